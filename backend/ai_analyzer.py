@@ -1,9 +1,20 @@
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import asyncio
 from datetime import datetime
 from models import ContactInfo, ResumeAnalysis
 from intelligent_education_detector import IntelligentEducationDetector
+from skill_matcher import SkillMatcher
+from contact_extractor import ContactExtractor
+from section_index import SectionSegmenter
+from parsed_document import ParsedDocument
+from pattern_registry import pattern_registry
+
+_ALPHA_WORD = pattern_registry.register('analyzer.name.alpha_word', r'^[A-Za-z]+$')
+_WHITESPACE = pattern_registry.register('analyzer.whitespace', r'\s+')
+_TIP = pattern_registry.register('analyzer.summary.tip', r'\(Tip:.*?\)', re.DOTALL)
+_SCORE_PHONE = pattern_registry.register('analyzer.score.phone', r'\d{3,5}\s?\d{3}\s?\d{3}')
+_SCORE_LOCATION = pattern_registry.register('analyzer.score.location', r'[A-Z][a-zA-Z\s]+,\s*[A-Z]')
 
 class ImprovedAIAnalyzer:
     def __init__(self):
@@ -48,6 +59,23 @@ class ImprovedAIAnalyzer:
                 'cash register', 'pos system'
             ]
         }
+        self.skill_matcher = SkillMatcher(self.skill_categories)
+        self.contact_extractor = ContactExtractor()
+        self.section_headers = {
+            'summary': ['career objective', 'objective', 'summary', 'profile', 'about'],
+            'experience': ['work experience', 'experience', 'employment', 'work history'],
+            'skills': ['key skills', 'skills', 'abilities', 'competencies']
+        }
+        self.section_boundary_headers = [
+            'education', 'experience', 'work', 'skills', 'objective', 'summary',
+            'employment', 'career', 'qualifications', 'achievements', 'projects',
+            'certifications', 'awards', 'interests', 'hobbies', 'references',
+            'leadership', 'volunteer', 'activities', 'availability'
+        ]
+        self.section_segmenter = SectionSegmenter(
+            'analyzer.section', self.section_headers, self.section_boundary_headers,
+            header_slack=10, boundary_substring=True
+        )
         self.education_levels = {
             'phd': ['phd', 'ph.d', 'doctorate', 'doctoral', 'doctor of philosophy'],
             'masters': ['master', 'msc', 'm.sc', 'mba', 'm.b.a', 'ms', 'm.s', 'ma', 'm.a'],
@@ -55,17 +83,72 @@ class ImprovedAIAnalyzer:
             'diploma': ['diploma', 'associate degree', 'certificate'],
             'high_school': ['year 12', 'year 11', 'high school', 'secondary school', 'hsc', 'vce', 'atar']
         }
+        self.name_skip_patterns = pattern_registry.register_group('analyzer.name.skip', [
+            r'page\s+\d+', r'tip:', r'@', r'phone', r'mobile', r'email',
+            r'address', r'resume', r'curriculum', r'cv'
+        ])
+        self.experience_year_patterns = pattern_registry.register_group('analyzer.experience_years', [
+            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
+            r'experience[:\s]*(\d+)\+?\s*years?',
+            r'(\d+)\+?\s*yrs?\s*(?:of\s*)?experience'
+        ])
+        self.date_patterns = pattern_registry.register_group('analyzer.date', [
+            r'(20\d{2})\s*[-–]\s*(20\d{2}|current|present)',
+            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s*(20\d{2})'
+        ], re.IGNORECASE)
+        self.title_patterns = pattern_registry.register_group('analyzer.job_title', [
+            r'(customer service|canteen|newspaper deliverer|assistant coach|umpire)',
+            r'(volunteer|intern|trainee|assistant|coordinator)',
+            r'(cashier|server|clerk|attendant|representative)',
+            r'(junior|senior|lead|manager|supervisor)',
+            r'(developer|engineer|analyst|designer|specialist)'
+        ])
+        self.org_patterns = pattern_registry.register_group('analyzer.organization', [
+            r'([A-Z][a-zA-Z\s]+(?:Club|College|School|Newsagency|Company|Inc|Ltd))',
+            r'(Park Hill Soccer Club|Argo Newsagency|Hill Park)',
+        ])
+        self.field_patterns = pattern_registry.register_group('analyzer.field', [
+            r'B\.?Tech\.?\s+in\s+([^.\n]+)',
+            r'Bachelor.*?in\s+([^.\n]+)',
+            r'Master.*?in\s+([^.\n]+)',
+            r'PhD.*?in\s+([^.\n]+)',
+            r'(?:bachelor|master|phd|doctorate).*?(?:in|of)\s+([a-zA-Z\s&]+)(?:from|at|\n|,)',
+            r'subjects include:\s*([^.]+)',
+            r'studying\s+([^.]+)',
+            r'(computer science.*?engineering|computer science|engineering|business|mathematics|science)',
+        ], re.IGNORECASE)
+        self.year_patterns = pattern_registry.register_group('analyzer.year', [
+            r'(20\d{2})\s*[-–]\s*(20\d{2})',
+            r'graduating.*?(20\d{2})',
+            r'batch.*?(20\d{2})',
+        ])
 
-    async def analyze_resume(self, resume_text: str, contact_info: Dict[str, Any] = None) -> 'ResumeAnalysis':
-        if not contact_info:
-            contact_info = self._extract_contact_info_enhanced(resume_text)
-        skills = self._extract_skills_enhanced(resume_text)
-        experience = self._extract_experience_enhanced(resume_text)
-        education = self._extract_education_enhanced(resume_text)
-        professional_summary = self._extract_professional_summary_enhanced(resume_text)
-        if not professional_summary or len(professional_summary) < 30:
-            professional_summary = await self._generate_summary_enhanced(resume_text, skills, experience, education)
-        score = self._calculate_resume_score_enhanced(resume_text, skills, experience, education)
+    async def analyze_resume(self, resume_text: Union[str, ParsedDocument], contact_info: Dict[str, Any] = None,
+                             skills: Optional[List[str]] = None, education_info: Optional[Dict[str, Any]] = None,
+                             professional_summary: Optional[str] = None) -> 'ResumeAnalysis':
+        document = ParsedDocument.of(resume_text)
+        skipped_stages = []
+        if contact_info:
+            skipped_stages.append('contact')
+        else:
+            contact_info = self._extract_contact_info_enhanced(document)
+        if skills is not None:
+            skipped_stages.append('skills')
+        else:
+            skills = self._extract_skills_enhanced(document)
+        experience = self._extract_experience_enhanced(document)
+        education = self._extract_education_enhanced(document, education_info)
+        if education_info is not None:
+            skipped_stages.append('education.institution')
+            if education_info['fields']:
+                skipped_stages.append('education.field_of_study')
+        if professional_summary:
+            skipped_stages.append('summary')
+        else:
+            professional_summary = self._extract_professional_summary_enhanced(document)
+            if not professional_summary or len(professional_summary) < 30:
+                professional_summary = await self._generate_summary_enhanced(document, skills, experience, education)
+        score = self._calculate_resume_score_enhanced(document, skills, experience, education)
         return ResumeAnalysis(
             contact=ContactInfo(**contact_info),
             skills=skills,
@@ -73,36 +156,27 @@ class ImprovedAIAnalyzer:
             education=education,
             summary=professional_summary,
             score=score,
-            analysis_date=datetime.now().isoformat()
+            analysis_date=datetime.now().isoformat(),
+            skipped_stages=skipped_stages
         )
     
-    def _extract_contact_info_enhanced(self, text: str) -> Dict[str, Optional[str]]:
-        name = self._extract_name_enhanced(text)
-        email = self._extract_email_enhanced(text)
-        phone = self._extract_phone_enhanced(text)
-        location = self._extract_location_enhanced(text)
-        return {
-            'name': name,
-            'email': email,
-            'phone': phone,
-            'location': location
-        }
+    def _extract_contact_info_enhanced(self, document: ParsedDocument) -> Dict[str, Optional[str]]:
+        contact = self.contact_extractor.extract(document)
+        contact['name'] = self._extract_name_enhanced(document)
+        return contact
     
-    def _extract_name_enhanced(self, text: str) -> Optional[str]:
-        lines = text.split('\n')
-        for line in lines[:8]:
-            line = line.strip()
+    def _extract_name_enhanced(self, document: ParsedDocument) -> Optional[str]:
+        return document.view('analyzer.name', lambda: self._find_name(document))
+
+    def _find_name(self, document: ParsedDocument) -> Optional[str]:
+        for line, line_lower in zip(document.stripped_lines[:8], document.stripped_lower_lines[:8]):
             if not line or len(line) < 3:
                 continue
-            skip_patterns = [
-                r'page\s+\d+', r'tip:', r'@', r'phone', r'mobile', r'email',
-                r'address', r'resume', r'curriculum', r'cv'
-            ]
-            if any(re.search(pattern, line.lower()) for pattern in skip_patterns):
+            if any(pattern.search(line_lower) for pattern in self.name_skip_patterns):
                 continue
             words = line.split()
             if 2 <= len(words) <= 4:
-                if all(word[0].isupper() and re.match(r'^[A-Za-z]+$', word) for word in words):
+                if all(word[0].isupper() and _ALPHA_WORD.match(word) for word in words):
                     potential_name = ' '.join(words)
                     if self._validate_name_enhanced(potential_name):
                         return potential_name
@@ -118,139 +192,9 @@ class ImprovedAIAnalyzer:
             return False
         return True
     
-    def _extract_email_enhanced(self, text: str) -> Optional[str]:
-        email_pattern = r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b'
-        matches = re.findall(email_pattern, text)
-        for email in matches:
-            if '@' in email and '.' in email.split('@')[1]:
-                return email.lower()
-        return None
-    
-    def _extract_phone_enhanced(self, text: str) -> Optional[str]:
-        phone_patterns = [
-            r'(\+\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,6})',
-            r'(\+\d{1,4}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,6})',
-            r'(\d{10,15})',
-            r'(\d{3,5}[-.\s]\d{3,4}[-.\s]\d{3,6})',
-            r'(\d{2,4}[-.\s]\d{3,4}[-.\s]\d{3,4}[-.\s]\d{2,4})',
-            r'(\(\d{2,4}\)[-.\s]?\d{3,4}[-.\s]?\d{3,6})',
-            r'(\d{2,4}[-.\s]?\(\d{2,4}\)[-.\s]?\d{3,6})',
-            r'(?:phone|mobile|tel|cell|contact)[:.]?\s*(\+?[\d\s\-\(\)\.]{8,20})',
-            r'(\d{4,5}\s\d{3}\s\d{3,4})',
-            r'(\d{2,3}\s\d{4}\s\d{4})',
-            r'(\d{3}\s\d{3}\s\d{4})',
-            r'(\d{2}[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2})',
-            r'(\d{3}[-.\s]\d{3}[-.\s]\d{2}[-.\s]\d{2})',
-            r'(\d{3}[-.\s]\d{4}[-.\s]\d{4})',
-            r'(\d{2}[-.\s]\d{4}[-.\s]\d{4})',
-        ]
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for phone in matches:
-                cleaned = self._clean_phone_universal(phone)
-                if cleaned:
-                    return cleaned
-        return None
-    
-    def _clean_phone_universal(self, phone: str) -> Optional[str]:
-        if not phone:
-            return None
-        digits_only = re.sub(r'[^\d+]', '', phone)
-        digit_count = len(digits_only.replace('+', ''))
-        if digit_count < 7 or digit_count > 15:
-            return None
-        cleaned_phone = phone.strip()
-        cleaned_phone = re.sub(r'\s+', ' ', cleaned_phone)
-        cleaned_phone = re.sub(r'[-.\s]{2,}', '-', cleaned_phone)
-        if digit_count > 10 and not cleaned_phone.startswith('+'):
-            if re.match(r'^\d{11,15}$', digits_only):
-                cleaned_phone = '+' + digits_only
-        if cleaned_phone.startswith('+'):
-            return self._format_international_phone(cleaned_phone)
-        else:
-            return self._format_domestic_phone(cleaned_phone, digit_count)
-    
-    def _format_international_phone(self, phone: str) -> str:
-        phone = re.sub(r'\s+', ' ', phone.strip())
-        digits = re.sub(r'[^\d]', '', phone)
-        if len(digits) == 11 and digits.startswith('1'):
-            return f"+1 {digits[1:4]} {digits[4:7]} {digits[7:]}"
-        elif len(digits) == 12 and digits.startswith('61'):
-            return f"+61 {digits[2]} {digits[3:7]} {digits[7:]}"
-        elif len(digits) == 12 and digits.startswith('44'):
-            return f"+44 {digits[2:6]} {digits[6:]}"
-        elif len(digits) == 12 and digits.startswith('91'):
-            return f"+91 {digits[2:7]} {digits[7:]}"
-        else:
-            if len(phone) > 0:
-                return phone
-        return phone
-    
-    def _format_domestic_phone(self, phone: str, digit_count: int) -> str:
-        digits = re.sub(r'[^\d]', '', phone)
-        if digit_count == 10:
-            if '(' in phone and ')' in phone:
-                return phone
-            else:
-                return f"{digits[:3]} {digits[3:6]} {digits[6:]}"
-        elif digit_count == 11:
-            if digits.startswith('1'):
-                return f"1 {digits[1:4]} {digits[4:7]} {digits[7:]}"
-            else:
-                return f"{digits[:3]} {digits[3:7]} {digits[7:]}"
-        elif digit_count == 9:
-            return f"{digits[:3]} {digits[3:6]} {digits[6:]}"
-        elif digit_count == 8:
-            return f"{digits[:4]} {digits[4:]}"
-        else:
-            return phone.strip()
-    
-    def _extract_location_enhanced(self, text: str) -> Optional[str]:
-        lines = text.split('\n')
-        location_patterns = [
-            r'(\d+\s+[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+,\s*[\dA-Z]{2,10})',
-            r'([A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+,\s*[\dA-Z]{2,10})',
-            r'([A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]{2,})',
-            r'([A-Z][a-zA-Z\s]+,\s*[A-Z]{2,3})',
-            r'([A-Z][a-zA-Z\s]+,?\s*\d{4,6})',
-            r'([A-Z][a-zA-Z\s]+,?\s*[A-Z]\d[A-Z]\s?\d[A-Z]\d)',
-            r'([A-Z][a-zA-Z\s]+,?\s*[A-Z]{1,2}\d{1,2}[A-Z]?\s?\d[A-Z]{2})',
-            r'(?:location|address|based in|city)[:.]?\s*([A-Z][a-zA-Z\s,.-]+)',
-            r'\b([A-Z][a-z]{2,}\s+[A-Z][a-z]{2,})\b',
-        ]
-        for line in lines[:8]:
-            for pattern in location_patterns:
-                matches = re.findall(pattern, line)
-                for match in matches:
-                    if self._validate_location_universal(match):
-                        return match.strip()
-        return None
-    
-    def _validate_location_universal(self, location: str) -> bool:
-        if not location or len(location) < 3:
-            return False
-        if len(location) > 150:
-            return False
-        location_lower = location.lower()
-        exclude_words = [
-            'email', 'phone', 'mobile', 'resume', 'page', 'tip', 'skills',
-            'experience', 'education', 'objective', 'summary', 'references'
-        ]
-        if any(word in location_lower for word in exclude_words):
-            return False
-        valid_chars = sum(c.isalpha() or c.isspace() or c in ',-.' for c in location)
-        if valid_chars / len(location) < 0.7:
-            return False
-        return True
-
-    def _extract_skills_enhanced(self, text: str) -> List[str]:
-        skills = set()
-        text_lower = text.lower()
-        for category, skill_list in self.skill_categories.items():
-            for skill in skill_list:
-                if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-                    skills.add(self._format_skill(skill))
-        skills_section = self._extract_skills_section(text)
+    def _extract_skills_enhanced(self, document: ParsedDocument) -> List[str]:
+        skills = {self._format_skill(skill) for skill in self.skill_matcher.find_skills(document.lower)}
+        skills_section = self._extract_skills_section(document)
         if skills_section:
             additional_skills = self._parse_skills_from_text(skills_section)
             skills.update(additional_skills)
@@ -269,36 +213,21 @@ class ImprovedAIAnalyzer:
         }
         return skill_mapping.get(skill.lower(), skill.title())
     
-    def _extract_skills_section(self, text: str) -> Optional[str]:
-        skill_headers = ['key skills', 'skills', 'abilities', 'competencies']
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line_lower = line.strip().lower()
-            for header in skill_headers:
-                if header in line_lower and len(line_lower) < len(header) + 10:
-                    section_content = []
-                    for j in range(i + 1, min(i + 15, len(lines))):
-                        next_line = lines[j].strip()
-                        if self._is_section_header(next_line.lower()):
-                            break
-                        if next_line and not next_line.lower().startswith('(tip'):
-                            section_content.append(next_line)
-                    return '\n'.join(section_content)
-        return None
+    def _extract_skills_section(self, document: ParsedDocument) -> Optional[str]:
+        section_index = document.sections(self.section_segmenter)
+        span = section_index.first('skills')
+        if span is None:
+            return None
+        return '\n'.join(section_index.content_lines(span, window=15, skip_prefix='(tip'))
     
     def _parse_skills_from_text(self, text: str) -> set:
-        skills = set()
-        for category, skill_list in self.skill_categories.items():
-            for skill in skill_list:
-                if re.search(r'\b' + re.escape(skill.lower()) + r'\b', text.lower()):
-                    skills.add(self._format_skill(skill))
-        return skills
+        return {self._format_skill(skill) for skill in self.skill_matcher.find_skills(text.lower())}
     
-    def _extract_experience_enhanced(self, text: str) -> Dict[str, Any]:
-        years = self._extract_experience_years_enhanced(text)
-        job_titles = self._extract_job_titles_enhanced(text)
-        companies = self._extract_companies_enhanced(text)
-        level = self._determine_experience_level_enhanced(text, years, job_titles)
+    def _extract_experience_enhanced(self, document: ParsedDocument) -> Dict[str, Any]:
+        years = self._extract_experience_years_enhanced(document)
+        job_titles = self._extract_job_titles_enhanced(document)
+        companies = self._extract_companies_enhanced(document)
+        level = self._determine_experience_level_enhanced(document, years, job_titles)
         return {
             'years': years,
             'job_titles': job_titles,
@@ -306,24 +235,15 @@ class ImprovedAIAnalyzer:
             'level': level
         }
     
-    def _extract_experience_years_enhanced(self, text: str) -> int:
-        exp_patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'experience[:\s]*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*yrs?\s*(?:of\s*)?experience'
-        ]
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, text.lower())
+    def _extract_experience_years_enhanced(self, document: ParsedDocument) -> int:
+        for pattern in self.experience_year_patterns:
+            matches = pattern.findall(document.lower)
             if matches:
                 return max(int(match) for match in matches)
         current_year = datetime.now().year
-        date_patterns = [
-            r'(20\d{2})\s*[-–]\s*(20\d{2}|current|present)',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s*(20\d{2})'
-        ]
         years_found = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in self.date_patterns:
+            matches = pattern.findall(document.text)
             for match in matches:
                 try:
                     if isinstance(match, tuple) and match[0].isdigit():
@@ -335,20 +255,13 @@ class ImprovedAIAnalyzer:
             return max(0, current_year - earliest)
         return 0
     
-    def _extract_job_titles_enhanced(self, text: str) -> List[str]:
+    def _extract_job_titles_enhanced(self, document: ParsedDocument) -> List[str]:
         job_titles = set()
-        title_patterns = [
-            r'(customer service|canteen|newspaper deliverer|assistant coach|umpire)',
-            r'(volunteer|intern|trainee|assistant|coordinator)',
-            r'(cashier|server|clerk|attendant|representative)',
-            r'(junior|senior|lead|manager|supervisor)',
-            r'(developer|engineer|analyst|designer|specialist)'
-        ]
-        for pattern in title_patterns:
-            matches = re.findall(pattern, text.lower())
+        for pattern in self.title_patterns:
+            matches = pattern.findall(document.lower)
             for match in matches:
                 job_titles.add(match.title())
-        exp_section = self._extract_experience_section(text)
+        exp_section = self._extract_experience_section(document)
         if exp_section:
             lines = exp_section.split('\n')
             for line in lines:
@@ -360,21 +273,17 @@ class ImprovedAIAnalyzer:
                             job_titles.add(potential_title.title())
         return list(job_titles)[:5]
     
-    def _extract_companies_enhanced(self, text: str) -> List[str]:
+    def _extract_companies_enhanced(self, document: ParsedDocument) -> List[str]:
         companies = set()
-        org_patterns = [
-            r'([A-Z][a-zA-Z\s]+(?:Club|College|School|Newsagency|Company|Inc|Ltd))',
-            r'(Park Hill Soccer Club|Argo Newsagency|Hill Park)',
-        ]
-        for pattern in org_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self.org_patterns:
+            matches = pattern.findall(document.text)
             for match in matches:
                 if len(match) > 3 and len(match) < 50:
                     companies.add(match.strip())
         return list(companies)[:5]
     
-    def _determine_experience_level_enhanced(self, text: str, years: int, titles: List[str]) -> str:
-        text_lower = text.lower()
+    def _determine_experience_level_enhanced(self, document: ParsedDocument, years: int, titles: List[str]) -> str:
+        text_lower = document.lower
         student_indicators = ['year 11', 'year 12', 'student', 'school', 'college']
         if any(indicator in text_lower for indicator in student_indicators):
             return 'Student'
@@ -390,43 +299,26 @@ class ImprovedAIAnalyzer:
         else:
             return 'Entry Level'
     
-    def _extract_education_enhanced(self, text: str) -> Dict[str, Any]:
-        best_institution = self.education_detector.get_best_institution(text)
-        all_institutions = self.education_detector.get_all_institutions(text, min_confidence=0.4)
+    def _extract_education_enhanced(self, document: ParsedDocument,
+                                    education_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if education_info is not None:
+            best_institution = education_info['best_institution']
+        else:
+            best_institution = self.education_detector.get_best_institution(document)
+        all_institutions = self.education_detector.get_all_institutions(document, min_confidence=0.4)
         highest_degree = None
-        field_of_study = None
         graduation_year = None
-        text_lower = text.lower()
+        text_lower = document.lower
         for degree, keywords in self.education_levels.items():
             if any(keyword in text_lower for keyword in keywords):
                 highest_degree = degree.replace('_', ' ').title()
                 break
-        field_patterns = [
-            r'B\.?Tech\.?\s+in\s+([^.\n]+)',
-            r'Bachelor.*?in\s+([^.\n]+)',
-            r'Master.*?in\s+([^.\n]+)',
-            r'PhD.*?in\s+([^.\n]+)',
-            r'(?:bachelor|master|phd|doctorate).*?(?:in|of)\s+([a-zA-Z\s&]+)(?:from|at|\n|,)',
-            r'subjects include:\s*([^.]+)',
-            r'studying\s+([^.]+)',
-            r'(computer science.*?engineering|computer science|engineering|business|mathematics|science)',
-        ]
-        for pattern in field_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                field = matches[0].strip()
-                if isinstance(field, str) and len(field) > 3:
-                    field = re.sub(r'\s+', ' ', field)
-                    field = field.replace('&', 'and')
-                    field_of_study = field.title()
-                    break
-        year_patterns = [
-            r'(20\d{2})\s*[-–]\s*(20\d{2})',
-            r'graduating.*?(20\d{2})',
-            r'batch.*?(20\d{2})',
-        ]
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text)
+        if education_info is not None and education_info['fields']:
+            field_of_study = education_info['fields'][0]
+        else:
+            field_of_study = self._extract_field_of_study(document)
+        for pattern in self.year_patterns:
+            matches = pattern.findall(document.text)
             if matches:
                 if isinstance(matches[0], tuple):
                     years = [int(y) for y in matches[0] if y.isdigit()]
@@ -443,29 +335,28 @@ class ImprovedAIAnalyzer:
             'graduation_year': graduation_year
         }
     
-    def _extract_professional_summary_enhanced(self, text: str) -> str:
-        summary_headers = ['career objective', 'objective', 'summary', 'profile', 'about']
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line_lower = line.strip().lower()
-            for header in summary_headers:
-                if header in line_lower and len(line_lower) < len(header) + 10:
-                    summary_lines = []
-                    for j in range(i + 1, len(lines)):
-                        next_line = lines[j].strip()
-                        if next_line.lower().startswith('(tip'):
-                            continue
-                        if self._is_section_header(next_line.lower()):
-                            break
-                        if next_line:
-                            summary_lines.append(next_line)
-                    if summary_lines:
-                        summary = ' '.join(summary_lines)
-                        summary = re.sub(r'\(Tip:.*?\)', '', summary, flags=re.DOTALL)
-                        return summary.strip()
+    def _extract_field_of_study(self, document: ParsedDocument) -> Optional[str]:
+        for pattern in self.field_patterns:
+            matches = pattern.findall(document.text)
+            if matches:
+                field = matches[0].strip()
+                if isinstance(field, str) and len(field) > 3:
+                    field = _WHITESPACE.sub(' ', field)
+                    field = field.replace('&', 'and')
+                    return field.title()
         return None
     
-    async def _generate_summary_enhanced(self, text: str, skills: List[str], 
+    def _extract_professional_summary_enhanced(self, document: ParsedDocument) -> str:
+        section_index = document.sections(self.section_segmenter)
+        for span in section_index.spans('summary'):
+            summary_lines = section_index.content_lines(span, skip_prefix='(tip', skip_prefixed_boundaries=True)
+            if summary_lines:
+                summary = ' '.join(summary_lines)
+                summary = _TIP.sub('', summary)
+                return summary.strip()
+        return None
+    
+    async def _generate_summary_enhanced(self, document: ParsedDocument, skills: List[str], 
                                        experience: Dict[str, Any], education: Dict[str, Any]) -> str:
         level = experience.get('level', 'Professional')
         years = experience.get('years', 0)
@@ -499,19 +390,20 @@ class ImprovedAIAnalyzer:
             summary += ". Committed to delivering high-quality results and continuous professional development."
         return summary
     
-    def _calculate_resume_score_enhanced(self, text: str, skills: List[str], 
+    def _calculate_resume_score_enhanced(self, document: ParsedDocument, skills: List[str], 
                                        experience: Dict[str, Any], education: Dict[str, Any]) -> int:
         score = 0
         level = experience.get('level', 'Professional')
+        text = document.text
         if '@' in text: score += 8
-        if re.search(r'\d{3,5}\s?\d{3}\s?\d{3}', text): score += 8
-        if re.search(r'[A-Z][a-zA-Z\s]+,\s*[A-Z]', text): score += 4
-        if self._extract_name_enhanced(text): score += 5
-        word_count = len(text.split())
+        if _SCORE_PHONE.search(text): score += 8
+        if _SCORE_LOCATION.search(text): score += 4
+        if self._extract_name_enhanced(document): score += 5
+        word_count = len(document.tokens)
         if word_count > 200: score += 8
         if word_count > 400: score += 4
-        if any(word in text.lower() for word in ['objective', 'summary', 'skills']): score += 4
-        if any(word in text.lower() for word in ['experience', 'work', 'volunteer']): score += 4
+        if any(word in document.lower for word in ['objective', 'summary', 'skills']): score += 4
+        if any(word in document.lower for word in ['experience', 'work', 'volunteer']): score += 4
         skill_count = len(skills)
         if level == 'Student':
             if skill_count >= 5: score += 25
@@ -540,29 +432,9 @@ class ImprovedAIAnalyzer:
             else: score += 5
         return min(score, 100)
     
-    def _extract_experience_section(self, text: str) -> Optional[str]:
-        exp_headers = ['work experience', 'experience', 'employment', 'work history']
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line_lower = line.strip().lower()
-            for header in exp_headers:
-                if header in line_lower and len(line_lower) < len(header) + 10:
-                    section_content = []
-                    for j in range(i + 1, min(i + 20, len(lines))):
-                        next_line = lines[j].strip()
-                        if self._is_section_header(next_line.lower()):
-                            break
-                        if next_line and not next_line.lower().startswith('(tip'):
-                            section_content.append(next_line)
-                    return '\n'.join(section_content)
-        return None
-    
-    def _is_section_header(self, line: str) -> bool:
-        headers = [
-            'education', 'experience', 'work', 'skills', 'objective', 'summary',
-            'employment', 'career', 'qualifications', 'achievements', 'projects',
-            'certifications', 'awards', 'interests', 'hobbies', 'references',
-            'leadership', 'volunteer', 'activities', 'availability'
-        ]
-        line_clean = line.strip().lower()
-        return any(header in line_clean for header in headers)
+    def _extract_experience_section(self, document: ParsedDocument) -> Optional[str]:
+        section_index = document.sections(self.section_segmenter)
+        span = section_index.first('experience')
+        if span is None:
+            return None
+        return '\n'.join(section_index.content_lines(span, window=20, skip_prefix='(tip'))
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, Dict, Optional, Union
+
+
+def pipeline_fingerprint(*modules: ModuleType) -> str:
+    """Digest of the source of the modules whose code and tables shape cached results."""
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()[:16]
+
+
+class AnalysisCache:
+    def __init__(self, version: str, max_entries: int = 256, ttl_seconds: float = 3600.0,
+                 db_path: Optional[str] = None):
+        self.version = version
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._entries: 'OrderedDict[str, tuple[float, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS analysis_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)'
+            )
+            self._db.commit()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def key(self, namespace: str, *parts: Union[str, bytes]) -> str:
+        digest = hashlib.sha256()
+        for part in (self.version, namespace) + parts:
+            data = part.encode('utf-8') if isinstance(part, str) else part
+            digest.update(len(data).to_bytes(8, 'big'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created, value = entry
+                if now - created <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(value)
+                del self._entries[key]
+                self.expirations += 1
+            if self._db is not None:
+                row = self._db.execute('SELECT value, created FROM analysis_cache WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    value, created = row
+                    if now - created <= self.ttl_seconds:
+                        self._store(key, created, value)
+                        self.disk_hits += 1
+                        return json.loads(value)
+                    self._db.execute('DELETE FROM analysis_cache WHERE key = ?', (key,))
+                    self._db.commit()
+                    self.expirations += 1
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        serialized = json.dumps(value, default=str)
+        created = time.time()
+        with self._lock:
+            self._store(key, created, serialized)
+            if self._db is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO analysis_cache (key, value, created) VALUES (?, ?, ?)',
+                    (key, serialized, created)
+                )
+                self._db.commit()
+
+    def _store(self, key: str, created: float, serialized: str) -> None:
+        self._entries[key] = (created, serialized)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM analysis_cache')
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'version': self.version,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'disk_tier': self.db_path is not None,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,311 @@
+import re
+from typing import Dict, List, Optional, Tuple, Union
+from pattern_registry import pattern_registry, TrackedPattern
+from parsed_document import ParsedDocument
+
+_WHITESPACE = pattern_registry.register('contact.whitespace', r'\s+')
+_NON_DIGIT_PLUS = pattern_registry.register('contact.phone.non_digit_plus', r'[^\d+]')
+_NON_DIGIT = pattern_registry.register('contact.phone.non_digit', r'[^\d]')
+_SEPARATOR_RUN = pattern_registry.register('contact.phone.separator_run', r'[-.\s]{2,}')
+_CONTACT_TOKEN = pattern_registry.register(
+    'contact.token', r'[@\d](?:(?<=@)|(?:[\s\-.()+]*\d){6,}[\d\s\-.()+]*)'
+)
+_PHONE_SPAN_CHARS = frozenset('-.()+')
+_EMAIL_LOCAL_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-')
+
+
+class _ContactTokens:
+    def __init__(self, text: str, header_end: int):
+        self.text = text
+        self.header_end = header_end
+        self.at_positions: List[int] = []
+        self.header_phone_spans: List[Tuple[int, int]] = []
+        self.body_phone_spans: List[Tuple[int, int]] = []
+        self._matches = _CONTACT_TOKEN.finditer(text)
+        self._scanned_to = 0
+        self._exhausted = False
+
+    def scan_until(self, position: Optional[int] = None) -> None:
+        while not self._exhausted and (position is None or self._scanned_to < position):
+            match = next(self._matches, None)
+            if match is None:
+                self._exhausted = True
+                self._scanned_to = len(self.text)
+                break
+            self._scanned_to = match.end()
+            if self.text[match.start()] == '@':
+                self.at_positions.append(match.start())
+                continue
+            start = match.start()
+            while start > 0 and (self.text[start - 1].isspace() or self.text[start - 1] in _PHONE_SPAN_CHARS):
+                start -= 1
+            if match.start() < self.header_end:
+                self.header_phone_spans.append((start, match.end()))
+            else:
+                self.body_phone_spans.append((start, match.end()))
+
+    def first_at(self) -> Optional[int]:
+        while not self.at_positions and not self._exhausted:
+            self.scan_until(self._scanned_to + 1)
+        return self.at_positions[0] if self.at_positions else None
+
+    def header_spans(self) -> List[Tuple[int, int]]:
+        self.scan_until(self.header_end)
+        return self.header_phone_spans
+
+    def body_spans(self) -> List[Tuple[int, int]]:
+        self.scan_until()
+        return self.body_phone_spans
+
+
+class ContactExtractor:
+    def __init__(self, header_lines: int = 15):
+        self.header_lines = max(header_lines, 10)
+        self.name_patterns = pattern_registry.register_group('contact.name', [
+            r'^([A-Z][a-z]+ [A-Z][a-z]+(?:\s[A-Z][a-z]+)?)\s*$',
+            r'^([A-Z][a-z]+\s[A-Z]\.\s[A-Z][a-z]+)\s*$',
+            r'^([A-Z][A-Z\s]+[A-Z])\s*$',
+            r'Name:\s*([A-Z][a-z\s]+)',
+            r'RESUME OF\s+([A-Z][a-z\s]+)',
+            r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)(?:\s*[\n|])',
+            r'([A-Z][a-z]+\s+[A-Z][a-z]+)',
+        ])
+        self.phone_patterns = pattern_registry.register_group('contact.phone', [
+            r'(\+\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,6})',
+            r'(\+\d{1,4}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,6})',
+            r'(\d{10,15})',
+            r'(\d{3,5}[-.\s]\d{3,4}[-.\s]\d{3,6})',
+            r'(\d{2,4}[-.\s]\d{3,4}[-.\s]\d{3,4}[-.\s]\d{2,4})',
+            r'(\(\d{2,4}\)[-.\s]?\d{3,4}[-.\s]?\d{3,6})',
+            r'(\d{2,4}[-.\s]?\(\d{2,4}\)[-.\s]?\d{3,6})',
+            r'(?:phone|mobile|tel|cell|contact)[:.]?\s*(\+?[\d\s\-\(\)\.]{8,20})',
+            r'(\d{4,5}\s\d{3}\s\d{3,4})',
+            r'(\d{2,3}\s\d{4}\s\d{4})',
+            r'(\d{3}\s\d{3}\s\d{4})',
+            r'(\d{2}[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2})',
+            r'(\d{3}[-.\s]\d{3}[-.\s]\d{2}[-.\s]\d{2})',
+            r'(\d{3}[-.\s]\d{4}[-.\s]\d{4})',
+            r'(\d{2}[-.\s]\d{4}[-.\s]\d{4})',
+            r'(\+91[-.\s]\d{5}[-.\s]\d{5})',
+            r'(\+44[-.\s]\d{4}[-.\s]\d{6})',
+            r'(\+33[-.\s]\d[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2})',
+            r'(\+49[-.\s]\d{3}[-.\s]\d{3}[-.\s]\d{4})',
+            r'(\+86[-.\s]\d{3}[-.\s]\d{4}[-.\s]\d{4})',
+            r'(\+81[-.\s]\d{2}[-.\s]\d{4}[-.\s]\d{4})',
+            r'(\+7[-.\s]\d{3}[-.\s]\d{3}[-.\s]\d{2}[-.\s]\d{2})',
+        ])
+        self.labelled_phone_index = 7
+        self.email_patterns = pattern_registry.register_group('contact.email', [
+            r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b',
+            r'Email:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+            r'E-mail:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+            r'Contact:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+        ], re.IGNORECASE)
+        self.location_patterns = pattern_registry.register_group('contact.location', [
+            r'([A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+,\s*\d{4})',
+            r'([A-Z][a-z]+,\s*[A-Z]{2,3}(?:\s+\d{4,5})?)',
+            r'([A-Z][a-z]+,\s*[A-Z][a-z]+)',
+            r'(\d+\s+[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+)',
+            r'Location:\s*([A-Z][a-zA-Z\s,.-]+)',
+            r'Address:\s*([A-Z][a-zA-Z\s,.-]+)',
+            r'Based in:\s*([A-Z][a-zA-Z\s,.-]+)',
+        ])
+
+    def extract(self, document: Union[str, ParsedDocument]) -> Dict[str, Optional[str]]:
+        document = ParsedDocument.of(document)
+        text = document.text
+        header = document.lines[:self.header_lines]
+        header_end = document.line_offsets[self.header_lines] if len(document.lines) > self.header_lines else len(text)
+        tokens = _ContactTokens(text, header_end)
+        return {
+            'name': self._extract_name(header),
+            'email': self._extract_email(text, tokens),
+            'phone': self._extract_phone(text, tokens),
+            'location': self._extract_location(header)
+        }
+
+    def _extract_name(self, lines: List[str]) -> Optional[str]:
+        for line in lines[:10]:
+            line = line.strip()
+            if not line or len(line) < 3:
+                continue
+            skip_indicators = ['page', 'tip:', 'address', '@', 'phone', 'mobile', 'email']
+            if any(indicator in line.lower() for indicator in skip_indicators):
+                continue
+            words = line.split()
+            if len(words) >= 2 and len(words) <= 4:
+                if all(word[0].isupper() and word[1:].islower() for word in words if len(word) > 1):
+                    potential_name = ' '.join(words)
+                    if self._validate_name(potential_name):
+                        return potential_name
+        for pattern in self.name_patterns:
+            for line in lines[:8]:
+                match = pattern.search(line)
+                if match:
+                    potential_name = match.group(1).strip()
+                    if self._validate_name(potential_name):
+                        return potential_name
+        return None
+
+    def _validate_name(self, name: str) -> bool:
+        if not name or len(name) < 3:
+            return False
+        exclusions = [
+            'resume', 'curriculum vitae', 'cv', 'email', 'phone', 'address',
+            'page', 'tip', 'career', 'objective', 'education', 'experience',
+            'skills', 'work', 'contact', 'details', 'information'
+        ]
+        if any(exclusion in name.lower() for exclusion in exclusions):
+            return False
+        words = name.split()
+        if len(words) < 2 or len(words) > 4:
+            return False
+        letter_ratio = sum(c.isalpha() for c in name) / len(name)
+        if letter_ratio < 0.7:
+            return False
+        return True
+
+    def _extract_phone(self, text: str, tokens: _ContactTokens) -> Optional[str]:
+        header_spans = tokens.header_spans()
+        for index, pattern in enumerate(self.phone_patterns):
+            phone = self._first_valid_phone(index, pattern, tokens, header_spans, in_header=True)
+            if phone:
+                higher_patterns = self.phone_patterns[:index]
+                if all(self._needs_plus(pattern) for pattern in higher_patterns) and '+' not in text[tokens.header_end:]:
+                    return phone
+                body_spans = tokens.body_spans()
+                for higher_index, higher_pattern in enumerate(higher_patterns):
+                    higher_phone = self._first_valid_phone(higher_index, higher_pattern, tokens, body_spans, in_header=False)
+                    if higher_phone:
+                        return higher_phone
+                return phone
+        body_spans = tokens.body_spans()
+        for index, pattern in enumerate(self.phone_patterns):
+            phone = self._first_valid_phone(index, pattern, tokens, body_spans, in_header=False)
+            if phone:
+                return phone
+        return None
+
+    def _first_valid_phone(self, index: int, pattern: TrackedPattern, tokens: _ContactTokens,
+                           spans: List[Tuple[int, int]], in_header: bool) -> Optional[str]:
+        if index == self.labelled_phone_index:
+            for match in pattern.finditer(tokens.text):
+                if (match.start() < tokens.header_end) != in_header:
+                    if in_header:
+                        break
+                    continue
+                cleaned = self._clean_phone(match.group(1))
+                if cleaned:
+                    return cleaned
+            return None
+        needs_plus = self._needs_plus(pattern)
+        for start, end in spans:
+            span = tokens.text[start:end]
+            if needs_plus and '+' not in span:
+                continue
+            for phone in pattern.findall(span):
+                cleaned = self._clean_phone(phone)
+                if cleaned:
+                    return cleaned
+        return None
+
+    def _needs_plus(self, pattern: TrackedPattern) -> bool:
+        return pattern.pattern.startswith(r'(\+')
+
+    def _clean_phone(self, phone: str) -> Optional[str]:
+        if not phone:
+            return None
+        digits_only = _NON_DIGIT_PLUS.sub('', phone)
+        digit_count = len(digits_only.replace('+', ''))
+        if digit_count < 7 or digit_count > 15:
+            return None
+        cleaned_phone = phone.strip()
+        cleaned_phone = _WHITESPACE.sub(' ', cleaned_phone)
+        cleaned_phone = _SEPARATOR_RUN.sub('-', cleaned_phone)
+        if cleaned_phone.startswith('+'):
+            return self._format_international_phone(cleaned_phone)
+        elif digit_count >= 10:
+            return self._format_domestic_phone(cleaned_phone, digit_count)
+        else:
+            return cleaned_phone
+
+    def _format_international_phone(self, phone: str) -> str:
+        digits = _NON_DIGIT.sub('', phone)
+        if len(digits) == 11 and digits.startswith('1'):
+            return f"+1 {digits[1:4]} {digits[4:7]} {digits[7:]}"
+        elif len(digits) == 12 and digits.startswith('61'):
+            return f"+61 {digits[2]} {digits[3:7]} {digits[7:]}"
+        elif len(digits) == 12 and digits.startswith('44'):
+            return f"+44 {digits[2:6]} {digits[6:]}"
+        elif len(digits) == 12 and digits.startswith('91'):
+            return f"+91 {digits[2:7]} {digits[7:]}"
+        elif len(digits) == 13 and digits.startswith('33'):
+            return f"+33 {digits[2]} {digits[3:5]} {digits[5:7]} {digits[7:9]} {digits[9:]}"
+        elif len(digits) == 12 and digits.startswith('49'):
+            return f"+49 {digits[2:5]} {digits[5:8]} {digits[8:]}"
+        elif len(digits) == 13 and digits.startswith('86'):
+            return f"+86 {digits[2:5]} {digits[5:9]} {digits[9:]}"
+        elif len(digits) == 12 and digits.startswith('81'):
+            return f"+81 {digits[2:4]} {digits[4:8]} {digits[8:]}"
+        else:
+            return phone
+
+    def _format_domestic_phone(self, phone: str, digit_count: int) -> str:
+        digits = _NON_DIGIT.sub('', phone)
+        if digit_count == 10:
+            return f"{digits[:3]} {digits[3:6]} {digits[6:]}"
+        elif digit_count == 11:
+            return f"{digits[0]} {digits[1:4]} {digits[4:7]} {digits[7:]}"
+        elif digit_count == 9:
+            return f"{digits[:3]} {digits[3:6]} {digits[6:]}"
+        elif digit_count == 8:
+            return f"{digits[:4]} {digits[4:]}"
+        else:
+            return phone.strip()
+
+    def _extract_email(self, text: str, tokens: _ContactTokens) -> Optional[str]:
+        first_at = tokens.first_at()
+        if first_at is None:
+            return None
+        start = first_at
+        while start > 0 and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+        for index, pattern in enumerate(self.email_patterns):
+            for match in pattern.finditer(text, start if index == 0 else 0):
+                email = match.group(1)
+                if self._validate_email(email):
+                    return email.lower()
+        return None
+
+    def _validate_email(self, email: str) -> bool:
+        if not email or '@' not in email:
+            return False
+        parts = email.split('@')
+        if len(parts) != 2:
+            return False
+        local, domain = parts
+        if not local or not domain or '.' not in domain:
+            return False
+        if len(local) < 1 or len(domain) < 3:
+            return False
+        return True
+
+    def _extract_location(self, lines: List[str]) -> Optional[str]:
+        for line in lines[:5]:
+            for pattern in self.location_patterns:
+                matches = pattern.findall(line)
+                for location in matches:
+                    if self._validate_location(location):
+                        return location.strip()
+        return None
+
+    def _validate_location(self, location: str) -> bool:
+        if not location or len(location) < 3:
+            return False
+        if len(location) > 100:
+            return False
+        location_lower = location.lower()
+        exclude_words = ['email', 'phone', 'mobile', 'resume', 'page']
+        if any(word in location_lower for word in exclude_words):
+            return False
+        return True
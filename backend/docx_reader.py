@@ -0,0 +1,146 @@
+import re
+import zipfile
+from typing import Any, List, NamedTuple
+from xml.etree.ElementTree import iterparse
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+_PARAGRAPH = W + 'p'
+_RUN = W + 'r'
+_TEXT = W + 't'
+_TAB = W + 'tab'
+_BREAK = W + 'br'
+_CARRIAGE_RETURN = W + 'cr'
+_TABLE = W + 'tbl'
+_ROW = W + 'tr'
+_CELL = W + 'tc'
+_VERTICAL_MERGE = W + 'vMerge'
+_VAL = W + 'val'
+_TYPE = W + 'type'
+_HEADER_PART = re.compile(r'^word/header(\d*)\.xml$')
+
+
+class DocxContent(NamedTuple):
+    text: str
+    paragraph_text: str
+    tables: List[List[List[str]]]
+
+
+class _PartReader:
+    def __init__(self):
+        self.parts: List[str] = []
+        self.paragraph_lines: List[str] = []
+        self.tables: List[List[List[str]]] = []
+        self._runs: List[List[str]] = []
+        self._cells: List[List[str]] = []
+        self._rows: List[List[str]] = []
+        self._table_stack: List[List[List[str]]] = []
+        self._merged: List[bool] = []
+        self._skip_depth = 0
+        self._run_depth = 0
+
+    def feed(self, stream: Any) -> None:
+        for event, elem in iterparse(stream, events=('start', 'end')):
+            tag = elem.tag
+            if tag == MC_FALLBACK:
+                self._skip_depth += 1 if event == 'start' else -1
+                if event == 'end':
+                    elem.clear()
+                continue
+            if self._skip_depth:
+                if event == 'end':
+                    elem.clear()
+                continue
+            if event == 'start':
+                self._start(tag, elem)
+            else:
+                self._end(tag, elem)
+                elem.clear()
+
+    def _start(self, tag: str, elem: Any) -> None:
+        if tag == _PARAGRAPH:
+            self._runs.append([])
+        elif tag == _RUN:
+            self._run_depth += 1
+        elif tag == _TABLE:
+            self._table_stack.append([])
+        elif tag == _ROW:
+            self._rows.append([])
+        elif tag == _CELL:
+            self._cells.append([])
+            self._merged.append(False)
+
+    def _end(self, tag: str, elem: Any) -> None:
+        if tag == _TEXT:
+            if self._runs:
+                self._runs[-1].append(elem.text or '')
+        elif tag == _RUN:
+            self._run_depth -= 1
+        elif tag == _TAB:
+            # w:tab also defines tab stops under w:pPr/w:tabs; only a tab inside a run is text.
+            if self._runs and self._run_depth:
+                self._runs[-1].append('\t')
+        elif tag == _BREAK:
+            if self._runs and elem.get(_TYPE, 'textWrapping') == 'textWrapping':
+                self._runs[-1].append('\n')
+        elif tag == _CARRIAGE_RETURN:
+            if self._runs:
+                self._runs[-1].append('\n')
+        elif tag == _VERTICAL_MERGE:
+            if self._merged and elem.get(_VAL, 'continue') == 'continue':
+                self._merged[-1] = True
+        elif tag == _PARAGRAPH:
+            self._emit_line(''.join(self._runs.pop()))
+        elif tag == _CELL:
+            paragraphs = self._cells.pop()
+            merged = self._merged.pop()
+            if self._rows and not merged:
+                self._rows[-1].append('\n'.join(paragraphs))
+        elif tag == _ROW:
+            cells = self._rows.pop()
+            if self._table_stack:
+                self._table_stack[-1].append(cells)
+            row_text = ''.join(cell + ' ' for cell in cells)
+            if self._cells:
+                self._cells[-1].append(row_text)
+            else:
+                self.parts.append(row_text + '\n')
+        elif tag == _TABLE:
+            table = self._table_stack.pop()
+            if table:
+                self.tables.append(table)
+
+    def _emit_line(self, line: str) -> None:
+        if self._cells:
+            self._cells[-1].append(line)
+        else:
+            self.paragraph_lines.append(line)
+            self.parts.append(line + '\n')
+
+
+class DocxReader:
+    def read(self, source: Any) -> DocxContent:
+        with zipfile.ZipFile(source) as archive:
+            names = archive.namelist()
+            header_lines: List[str] = []
+            seen = set()
+            header_parts = [name for name in names if _HEADER_PART.match(name)]
+            header_parts.sort(key=lambda name: int(_HEADER_PART.match(name).group(1) or 0))
+            for name in header_parts:
+                header = _PartReader()
+                with archive.open(name) as stream:
+                    header.feed(stream)
+                for line in ''.join(header.parts).split('\n'):
+                    if line.strip() and line not in seen:
+                        seen.add(line)
+                        header_lines.append(line)
+            body = _PartReader()
+            with archive.open('word/document.xml') as stream:
+                body.feed(stream)
+        header_text = ''.join(line + '\n' for line in header_lines)
+        return DocxContent(
+            text=header_text + ''.join(body.parts),
+            paragraph_text=header_text + ''.join(line + '\n' for line in body.paragraph_lines),
+            tables=body.tables
+        )
@@ -0,0 +1,39 @@
+from typing import Any, Dict, List, NamedTuple
+
+
+class ExtractedPage(NamedTuple):
+    number: int
+    text: str
+    tables: List[List[List[str]]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'number': self.number, 'text': self.text, 'tables': self.tables}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExtractedPage':
+        return cls(data['number'], data['text'], data['tables'])
+
+
+class ExtractedText(NamedTuple):
+    text: str
+    pages: List[ExtractedPage]
+    producer: str
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    @property
+    def table_count(self) -> int:
+        return sum(len(page.tables) for page in self.pages)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'text': self.text,
+            'pages': [page.to_dict() for page in self.pages],
+            'producer': self.producer
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExtractedText':
+        return cls(data['text'], [ExtractedPage.from_dict(page) for page in data['pages']], data['producer'])
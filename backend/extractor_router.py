@@ -0,0 +1,183 @@
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+PDF_EXTRACTORS = ('pdfplumber', 'pypdf2')
+
+DOCUMENT_CLASSES = {
+    'office': ('microsoft', 'word', 'libreoffice', 'openoffice', 'google docs', 'skia', 'pages', 'wps'),
+    'latex': ('tex', 'pdftex', 'xetex', 'luatex', 'pdflatex', 'xelatex', 'lualatex', 'dvipdfm', 'dvipdfmx', 'xdvipdfmx'),
+    'designer': ('indesign', 'illustrator', 'photoshop', 'canva', 'figma', 'coreldraw', 'affinity'),
+}
+
+DEFAULT_ROUTES = {
+    'office': ('pypdf2', 'pdfplumber'),
+    'latex': ('pdfplumber', 'pypdf2'),
+    'designer': ('pdfplumber', 'pypdf2'),
+    'image_only': ('pdfplumber', 'pypdf2'),
+    'other': ('pdfplumber', 'pypdf2'),
+}
+
+# Whole-token matches only: "iText" is not a TeX engine, while "pdfTeX-1.40" is.
+DOCUMENT_CLASS_PATTERNS = {
+    document_class: re.compile(r'\b(?:' + '|'.join(map(re.escape, markers)) + r')\b')
+    for document_class, markers in DOCUMENT_CLASSES.items()
+}
+
+SLOW_LANE_CLASSES = {'designer', 'image_only'}
+
+TEXT_OPERATORS = re.compile(rb'(?:\bT[Jj]|[\'"])\s')
+
+UNREADABLE_REASONS = {
+    'encrypted': "PDF is password-protected. Please upload an unprotected copy.",
+    'image_only': "PDF contains only images and no text layer. Please upload a text-based PDF or DOCX.",
+    'empty': "PDF contains no readable text.",
+}
+
+
+class UnreadableDocument(Exception):
+    def __init__(self, reason: str):
+        super().__init__(UNREADABLE_REASONS[reason])
+        self.reason = reason
+
+
+class PdfProfile(NamedTuple):
+    producer: str
+    creator: str
+    page_count: int
+    font_count: int
+    image_count: int
+    encrypted: bool
+    decrypted: bool = True
+    text_operator_count: int = 0
+
+    @property
+    def has_text_layer(self) -> bool:
+        return self.font_count > 0 and self.text_operator_count > 0
+
+    @property
+    def unreadable_reason(self) -> Optional[str]:
+        if self.encrypted and not self.decrypted:
+            return 'encrypted'
+        if self.text_operator_count:
+            return None
+        return 'image_only' if self.image_count else 'empty'
+
+    @property
+    def document_class(self) -> str:
+        if not self.has_text_layer and self.image_count:
+            return 'image_only'
+        tool = f'{self.producer} {self.creator}'.lower()
+        for document_class, pattern in DOCUMENT_CLASS_PATTERNS.items():
+            if pattern.search(tool):
+                return document_class
+        return 'other'
+
+
+class RouteDecision(NamedTuple):
+    document_class: str
+    order: Tuple[str, ...]
+    lane: str
+    learned: bool
+    explored: bool = False
+
+
+def is_good_text(text: str, min_length: int = 50, max_mean_token: float = 15.0) -> bool:
+    tokens = text.split()
+    if len(text.strip()) < min_length or not tokens:
+        return False
+    return sum(len(token) for token in tokens) / len(tokens) <= max_mean_token
+
+
+class ExtractorRouter:
+    def __init__(self, min_samples: int = 5, explore_every: int = 20):
+        self.min_samples = min_samples
+        self.explore_every = explore_every
+        self._lock = threading.Lock()
+        self._outcomes: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(
+            lambda: {'attempts': 0, 'successes': 0, 'total_seconds': 0.0}
+        )
+        self._decisions: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._rejections: Dict[str, int] = defaultdict(int)
+        self._routes: Dict[str, int] = defaultdict(int)
+
+    def _cost(self, document_class: str, extractor: str) -> Optional[float]:
+        outcome = self._outcomes.get((document_class, extractor))
+        if outcome is None or outcome['attempts'] < self.min_samples:
+            return None
+        success_rate = outcome['successes'] / outcome['attempts']
+        mean_seconds = outcome['total_seconds'] / outcome['attempts']
+        return mean_seconds / max(success_rate, 0.05)
+
+    def route(self, profile: Optional[PdfProfile]) -> RouteDecision:
+        document_class = profile.document_class if profile is not None else 'other'
+        order = DEFAULT_ROUTES[document_class]
+        learned = False
+        explored = False
+        with self._lock:
+            self._routes[document_class] += 1
+            costs = {extractor: self._cost(document_class, extractor) for extractor in order}
+            if all(cost is not None for cost in costs.values()):
+                order = tuple(sorted(order, key=lambda extractor: costs[extractor]))
+                learned = True
+                # The leader keeps winning only if the others are re-measured now and then.
+                if self.explore_every and self._routes[document_class] % self.explore_every == 0:
+                    order = order[1:2] + order[:1] + order[2:]
+                    explored = True
+            else:
+                # Lead with the least-tried extractor until each has min_samples; the rest remain as fallbacks.
+                attempts = {
+                    extractor: self._outcomes[(document_class, extractor)]['attempts']
+                    if (document_class, extractor) in self._outcomes else 0
+                    for extractor in order
+                }
+                least_tried = min(order, key=lambda extractor: attempts[extractor])
+                if least_tried != order[0]:
+                    order = (least_tried,) + tuple(extractor for extractor in order if extractor != least_tried)
+                    explored = True
+            lane = 'slow' if document_class in SLOW_LANE_CLASSES else 'fast'
+            self._decisions[(document_class, order[0], lane)] += 1
+        return RouteDecision(document_class, order, lane, learned, explored)
+
+    def triage(self, profile: Optional[PdfProfile]) -> None:
+        reason = profile.unreadable_reason if profile is not None else None
+        if reason is None:
+            return
+        with self._lock:
+            self._rejections[reason] += 1
+        raise UnreadableDocument(reason)
+
+    def record(self, document_class: str, attempts: List[Tuple[str, float, bool]]) -> None:
+        with self._lock:
+            for extractor, seconds, succeeded in attempts:
+                outcome = self._outcomes[(document_class, extractor)]
+                outcome['attempts'] += 1
+                outcome['successes'] += int(succeeded)
+                outcome['total_seconds'] += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            outcomes = [
+                {
+                    'document_class': document_class,
+                    'extractor': extractor,
+                    'attempts': outcome['attempts'],
+                    'successes': outcome['successes'],
+                    'success_rate': round(outcome['successes'] / outcome['attempts'], 4) if outcome['attempts'] else 0.0,
+                    'mean_ms': round(outcome['total_seconds'] * 1000 / outcome['attempts'], 3) if outcome['attempts'] else 0.0
+                }
+                for (document_class, extractor), outcome in sorted(self._outcomes.items())
+            ]
+            decisions = [
+                {'document_class': document_class, 'extractor': extractor, 'lane': lane, 'count': count}
+                for (document_class, extractor, lane), count in sorted(self._decisions.items())
+            ]
+            rejections = dict(self._rejections)
+        return {
+            'min_samples': self.min_samples,
+            'explore_every': self.explore_every,
+            'rejections': rejections,
+            'decisions': decisions,
+            'outcomes': outcomes
+        }
@@ -0,0 +1,60 @@
+from typing import Any, Dict, List, Optional, Set
+from extracted_text import ExtractedPage
+from parsed_document import ParsedDocument
+
+HEADER_FIELDS = ('name', 'location')
+BODY_FIELDS = ('email', 'phone')
+
+
+class IncrementalAnalysis:
+    def __init__(self, parser: Any):
+        self.parser = parser
+        self.pages_seen = 0
+        self.contact: Dict[str, str] = {}
+        self.skills: Set[str] = set()
+        self.sections: Dict[str, int] = {}
+        self.current_section: Optional[str] = None
+        self._header_seen = False
+
+    def feed(self, page: ExtractedPage) -> Dict[str, Any]:
+        # Only the new page is cleaned and scanned, so a document costs O(pages) rather than O(pages²).
+        document = ParsedDocument.from_normalized(self.parser.normalize_text(self.parser.page_raw_text(page)))
+        self.pages_seen += 1
+        new_contact = self._feed_contact(document)
+        page_skills = {
+            skill.title()
+            for skill in self.parser.skill_matcher.find_skills(document.lower, space_delimited=True)
+        }
+        new_skills = sorted(page_skills - self.skills)
+        self.skills.update(page_skills)
+        return {'contact': new_contact, 'skills': new_skills, 'sections': self._feed_sections(document, page.number)}
+
+    def _feed_contact(self, document: ParsedDocument) -> Dict[str, str]:
+        # Name and location come from the header lines of the first page with text; email and
+        # phone from whichever page shows them first.
+        fields = [field for field in BODY_FIELDS if field not in self.contact]
+        if not self._header_seen and document.text:
+            fields.extend(HEADER_FIELDS)
+            self._header_seen = True
+        if not fields:
+            return {}
+        contact = self.parser.extract_contact_info(document)
+        new_contact = {field: contact[field] for field in fields if contact.get(field)}
+        self.contact.update(new_contact)
+        return new_contact
+
+    def _feed_sections(self, document: ParsedDocument, page_number: int) -> List[Dict[str, Any]]:
+        section_index = document.sections(self.parser.section_segmenter)
+        headers = sorted(
+            (span.header_line, span.section) for spans in section_index.sections.values() for span in spans
+        )
+        found = []
+        if self.current_section is not None and (not headers or headers[0][0] > 0):
+            found.append({'section': self.current_section, 'line': 0, 'offset': 0, 'continued': True})
+        for line, section in headers:
+            offset = document.source_offset(document.line_offsets[line])
+            found.append({'section': section, 'line': line, 'offset': offset, 'continued': False})
+            self.sections.setdefault(section, page_number)
+        if headers:
+            self.current_section = headers[-1][1]
+        return found
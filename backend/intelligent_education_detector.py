@@ -1,6 +1,29 @@
 import re
-from typing import List, Dict, Any, Optional, Tuple
-import unicodedata
+from itertools import accumulate
+from typing import List, Dict, Any, Optional, Tuple, Union
+from pattern_registry import pattern_registry
+from parsed_document import ParsedDocument
+
+_PROPER_NOUN = pattern_registry.register('education.proper_noun', r'\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,4})\b')
+
+class _LineProfile:
+    def __init__(self, line_context_words: List[int], raw_context_words: List[int],
+                 raw_degree_lines: List[bool], lowercase_degree_lines: List[bool], clean_degree_lines: List[bool]):
+        self.line_context_words = line_context_words
+        self.raw_context_words = raw_context_words
+        self.lowercase_degree_lines = lowercase_degree_lines
+        self.clean_degree_lines = clean_degree_lines
+        self.has_degree = any(raw_degree_lines)
+        self._degree_prefix = list(accumulate(raw_degree_lines, initial=0))
+
+    def degree_lines_near(self, line_index: int, radius: int) -> int:
+        start = max(0, line_index - radius)
+        end = min(len(self._degree_prefix) - 1, line_index + radius + 1)
+        return self._degree_prefix[end] - self._degree_prefix[start]
+
+    def nearby_range(self, line_index: int, radius: int) -> range:
+        return range(max(0, line_index - radius), min(len(self.line_context_words), line_index + radius + 1))
+
 
 class IntelligentEducationDetector:
     def __init__(self):
@@ -32,6 +55,16 @@ class IntelligentEducationDetector:
             r'\b(phd|ph\.?d\.?|doctorate)\b',
             r'\b(diploma|certificate)\b'
         ]
+        self.any_degree_regex = pattern_registry.register(
+            'education.degree_any', '|'.join(f'(?:{pattern})' for pattern in self.degree_patterns), re.IGNORECASE
+        )
+        self.any_lowercase_degree_regex = pattern_registry.register(
+            'education.degree_any_lowercase', '|'.join(f'(?:{pattern})' for pattern in self.degree_patterns)
+        )
+        self.degree_context_regexes = pattern_registry.register_group('education.degree_context', [
+            degree_pattern + r'.*?(?:from|at|@)\s+([A-Z][a-zA-Z\s&\-\.]+)'
+            for degree_pattern in self.degree_patterns
+        ], re.IGNORECASE)
         self.education_context_words = [
             'graduated', 'degree', 'major', 'minor', 'gpa', 'cgpa', 'grade',
             'semester', 'year', 'batch', 'class', 'alumni', 'student',
@@ -42,43 +75,68 @@ class IntelligentEducationDetector:
             'hospital', 'clinic', 'bank', 'shop', 'store', 'restaurant',
             'hotel', 'club', 'gym', 'sports', 'football', 'soccer', 'cricket'
         ]
+        all_suffixes = []
+        for suffix_list in self.institution_suffixes.values():
+            all_suffixes.extend(suffix_list)
+        self.explicit_institution_regex = pattern_registry.register(
+            'education.explicit_institution',
+            r'\b([A-Z][a-zA-Z\s&\-\.]+(?:' + '|'.join(re.escape(suffix) for suffix in all_suffixes) + r'))\b',
+            re.IGNORECASE
+        )
+
+    def detect_institutions(self, text: Union[str, ParsedDocument]) -> List[Dict[str, Any]]:
+        document = ParsedDocument.of(text)
+        return list(document.view('education.institutions', lambda: self._detect_institutions(document)))
 
-    def detect_institutions(self, text: str) -> List[Dict[str, Any]]:
+    def _detect_institutions(self, document: ParsedDocument) -> List[Dict[str, Any]]:
         institutions = []
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            line_institutions = self._detect_in_line(line, i, lines)
+        profile = self._line_profile(document)
+        for i in range(len(document.lines)):
+            line_institutions = self._detect_in_line(i, document, profile)
             institutions.extend(line_institutions)
         unique_institutions = self._remove_duplicates(institutions)
         return sorted(unique_institutions, key=lambda x: x['confidence'], reverse=True)
+
+    def _line_profile(self, document: ParsedDocument) -> _LineProfile:
+        return document.view('education.line_profile', lambda: _LineProfile(
+            [self._count_context_words(line.lower()) for line in document.normalized_lines],
+            [self._count_context_words(line_lower) for line_lower in document.lower_lines],
+            [self.any_degree_regex.search(line) is not None for line in document.lines],
+            [self.any_lowercase_degree_regex.search(line_lower) is not None for line_lower in document.lower_lines],
+            [self.any_degree_regex.search(line) is not None for line in document.normalized_lines]
+        ))
+
+    def _count_context_words(self, line_lower: str) -> int:
+        return sum(1 for word in self.education_context_words if word in line_lower)
     
-    def _detect_in_line(self, line: str, line_index: int, all_lines: List[str]) -> List[Dict[str, Any]]:
+    def _detect_in_line(self, line_index: int, document: ParsedDocument, profile: _LineProfile) -> List[Dict[str, Any]]:
         institutions = []
-        line_clean = self._clean_text(line)
+        line_clean = document.normalized_lines[line_index]
         if len(line_clean) < 3:
             return institutions
         explicit_institutions = self._find_explicit_institutions(line_clean)
-        degree_context_institutions = self._find_degree_context_institutions(line_clean)
-        context_institutions = self._find_context_institutions(line_clean, line_index, all_lines)
+        degree_context_institutions = (
+            self._find_degree_context_institutions(line_clean) if profile.clean_degree_lines[line_index] else []
+        )
+        context_institutions = self._find_context_institutions(line_clean, line_index, profile)
         all_detected = explicit_institutions + degree_context_institutions + context_institutions
+        context = None
         for inst in all_detected:
-            confidence = self._calculate_confidence(inst, line_clean, line_index, all_lines)
+            confidence = self._calculate_confidence(inst, line_index, profile)
             if confidence > 0.3:
+                if context is None:
+                    context = self._get_context(line_index, document)
                 institutions.append({
                     'name': inst,
                     'confidence': confidence,
-                    'line': line.strip(),
-                    'context': self._get_context(line_index, all_lines)
+                    'line': document.stripped_lines[line_index],
+                    'context': context
                 })
         return institutions
     
     def _find_explicit_institutions(self, text: str) -> List[str]:
         institutions = []
-        all_suffixes = []
-        for suffix_list in self.institution_suffixes.values():
-            all_suffixes.extend(suffix_list)
-        pattern = r'\b([A-Z][a-zA-Z\s&\-\.]+(?:' + '|'.join(re.escape(suffix) for suffix in all_suffixes) + r'))\b'
-        matches = re.findall(pattern, text, re.IGNORECASE)
+        matches = self.explicit_institution_regex.findall(text)
         for match in matches:
             if self._is_valid_institution_name(match):
                 institutions.append(match.strip())
@@ -86,17 +144,16 @@ class IntelligentEducationDetector:
     
     def _find_degree_context_institutions(self, text: str) -> List[str]:
         institutions = []
-        for degree_pattern in self.degree_patterns:
-            pattern = degree_pattern + r'.*?(?:from|at|@)\s+([A-Z][a-zA-Z\s&\-\.]+)'
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for degree_context_regex in self.degree_context_regexes:
+            matches = degree_context_regex.findall(text)
             for match in matches:
                 if len(match) > 3 and self._is_valid_institution_name(match):
                     institutions.append(match.strip())
         return institutions
     
-    def _find_context_institutions(self, text: str, line_index: int, all_lines: List[str]) -> List[str]:
+    def _find_context_institutions(self, text: str, line_index: int, profile: _LineProfile) -> List[str]:
         institutions = []
-        context_score = self._calculate_education_context(text, line_index, all_lines)
+        context_score = self._calculate_education_context(line_index, profile)
         if context_score > 0.5:
             proper_nouns = self._extract_proper_nouns(text)
             for noun in proper_nouns:
@@ -106,24 +163,18 @@ class IntelligentEducationDetector:
                     institutions.append(noun)
         return institutions
     
-    def _calculate_confidence(self, institution: str, line: str, line_index: int, all_lines: List[str]) -> float:
+    def _calculate_confidence(self, institution: str, line_index: int, profile: _LineProfile) -> float:
         confidence = 0.0
         institution_lower = institution.lower()
-        line_lower = line.lower()
         for suffix_list in self.institution_suffixes.values():
             if any(suffix in institution_lower for suffix in suffix_list):
                 confidence += 0.4
                 break
         if any(prefix in institution_lower for prefix in self.institution_prefixes):
             confidence += 0.2
-        context_words_found = sum(1 for word in self.education_context_words if word in line_lower)
-        confidence += min(context_words_found * 0.1, 0.3)
-        context_lines = self._get_nearby_lines(line_index, all_lines, 2)
-        for context_line in context_lines:
-            for degree_pattern in self.degree_patterns:
-                if re.search(degree_pattern, context_line, re.IGNORECASE):
-                    confidence += 0.15
-                    break
+        confidence += min(profile.line_context_words[line_index] * 0.1, 0.3)
+        for _ in range(profile.degree_lines_near(line_index, 2)):
+            confidence += 0.15
         if any(exclude_word in institution_lower for exclude_word in self.exclude_words):
             confidence -= 0.5
         words = institution.split()
@@ -133,26 +184,18 @@ class IntelligentEducationDetector:
             confidence += 0.1
         return min(confidence, 1.0)
     
-    def _calculate_education_context(self, text: str, line_index: int, all_lines: List[str]) -> float:
+    def _calculate_education_context(self, line_index: int, profile: _LineProfile) -> float:
         context_score = 0.0
-        text_lower = text.lower()
-        context_words_found = sum(1 for word in self.education_context_words if word in text_lower)
-        context_score += context_words_found * 0.2
-        nearby_lines = self._get_nearby_lines(line_index, all_lines, 3)
-        for line in nearby_lines:
-            line_lower = line.lower()
-            context_words_found = sum(1 for word in self.education_context_words if word in line_lower)
-            context_score += context_words_found * 0.1
-            for degree_pattern in self.degree_patterns:
-                if re.search(degree_pattern, line_lower):
-                    context_score += 0.3
-                    break
+        context_score += profile.line_context_words[line_index] * 0.2
+        for nearby_index in profile.nearby_range(line_index, 3):
+            context_score += profile.raw_context_words[nearby_index] * 0.1
+            if profile.lowercase_degree_lines[nearby_index]:
+                context_score += 0.3
         return min(context_score, 1.0)
     
     def _extract_proper_nouns(self, text: str) -> List[str]:
         proper_nouns = []
-        pattern = r'\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,4})\b'
-        matches = re.findall(pattern, text)
+        matches = _PROPER_NOUN.findall(text)
         for match in matches:
             if len(match) > 5 and len(match) < 100:
                 proper_nouns.append(match)
@@ -182,14 +225,9 @@ class IntelligentEducationDetector:
         end = min(len(all_lines), line_index + radius + 1)
         return all_lines[start:end]
     
-    def _get_context(self, line_index: int, all_lines: List[str]) -> str:
-        nearby_lines = self._get_nearby_lines(line_index, all_lines, 2)
-        return ' '.join(line.strip() for line in nearby_lines if line.strip())
-    
-    def _clean_text(self, text: str) -> str:
-        text = unicodedata.normalize('NFKD', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+    def _get_context(self, line_index: int, document: ParsedDocument) -> str:
+        nearby_lines = self._get_nearby_lines(line_index, document.stripped_lines, 2)
+        return ' '.join(line for line in nearby_lines if line)
     
     def _remove_duplicates(self, institutions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         seen = set()
@@ -201,18 +239,19 @@ class IntelligentEducationDetector:
                 unique.append(inst)
         return unique
     
-    def get_best_institution(self, text: str) -> Optional[str]:
+    def get_best_institution(self, text: Union[str, ParsedDocument]) -> Optional[str]:
         institutions = self.detect_institutions(text)
         if institutions:
             return institutions[0]['name']
         return None
     
-    def get_all_institutions(self, text: str, min_confidence: float = 0.5) -> List[str]:
+    def get_all_institutions(self, text: Union[str, ParsedDocument], min_confidence: float = 0.5) -> List[str]:
         institutions = self.detect_institutions(text)
         return [inst['name'] for inst in institutions if inst['confidence'] >= min_confidence]
     
-    def detect_with_details(self, text: str) -> Dict[str, Any]:
-        institutions = self.detect_institutions(text)
+    def detect_with_details(self, text: Union[str, ParsedDocument]) -> Dict[str, Any]:
+        document = ParsedDocument.of(text)
+        institutions = self.detect_institutions(document)
         return {
             'institutions': institutions,
             'best_match': institutions[0]['name'] if institutions else None,
@@ -220,19 +259,12 @@ class IntelligentEducationDetector:
             'high_confidence': [inst for inst in institutions if inst['confidence'] > 0.7],
             'medium_confidence': [inst for inst in institutions if 0.4 <= inst['confidence'] <= 0.7],
             'analysis': {
-                'has_degree_context': self._has_degree_context(text),
-                'education_context_strength': self._calculate_overall_education_context(text),
-                'proper_nouns_found': len(self._extract_proper_nouns(text))
+                'has_degree_context': self._line_profile(document).has_degree,
+                'education_context_strength': self._calculate_overall_education_context(document.lower),
+                'proper_nouns_found': len(self._extract_proper_nouns(document.text))
             }
         }
     
-    def _has_degree_context(self, text: str) -> bool:
-        for pattern in self.degree_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
-    
-    def _calculate_overall_education_context(self, text: str) -> float:
-        text_lower = text.lower()
+    def _calculate_overall_education_context(self, text_lower: str) -> float:
         context_words_found = sum(1 for word in self.education_context_words if word in text_lower)
         return min(context_words_found / len(self.education_context_words), 1.0)
@@ -0,0 +1,171 @@
+import os
+from typing import Callable, FrozenSet, Iterable, NamedTuple, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+def job_level(job_experience: int) -> int:
+    if job_experience >= 7:
+        return 3
+    if job_experience >= 3:
+        return 2
+    return 1
+
+
+class JobColumns(NamedTuple):
+    """Column-oriented view of the job catalog, one row per job in id order.
+
+    Required and preferred skills are CSC index arrays over the store's skill
+    ids. Every array is saved as its own ``.npy`` file so workers can map them
+    read-only and share the pages.
+    """
+    job_ids: np.ndarray
+    experience: np.ndarray
+    experience_high: np.ndarray
+    experience_low: np.ndarray
+    levels: np.ndarray
+    salary_min: np.ndarray
+    salary_max: np.ndarray
+    required_counts: np.ndarray
+    preferred_counts: np.ndarray
+    required_divisor: np.ndarray
+    preferred_divisor: np.ndarray
+    required_indptr: np.ndarray
+    required_indices: np.ndarray
+    required_data: np.ndarray
+    preferred_indptr: np.ndarray
+    preferred_indices: np.ndarray
+    preferred_data: np.ndarray
+
+    @classmethod
+    def build(cls, jobs: Iterable[Tuple[int, float, int, int]], required: Iterable[Tuple[int, int]],
+              preferred: Iterable[Tuple[int, int]], skill_count: int) -> 'JobColumns':
+        """Build from (id, experience, salary_min, salary_max) rows and (skill_id, job_id) postings."""
+        rows = list(jobs)
+        job_ids = np.array([row[0] for row in rows], dtype=np.int64)
+        experience = np.array([row[1] for row in rows], dtype=np.float64)
+        required_indptr, required_indices = cls._postings(required, job_ids, skill_count)
+        preferred_indptr, preferred_indices = cls._postings(preferred, job_ids, skill_count)
+        required_counts = np.bincount(required_indices, minlength=len(job_ids)).astype(np.float64)
+        preferred_counts = np.bincount(preferred_indices, minlength=len(job_ids)).astype(np.float64)
+        return cls(
+            job_ids=job_ids,
+            experience=experience,
+            experience_high=experience * 0.8,
+            experience_low=experience * 0.6,
+            levels=np.array([job_level(row[1]) for row in rows], dtype=np.int64),
+            salary_min=np.array([row[2] for row in rows], dtype=np.int64),
+            salary_max=np.array([row[3] for row in rows], dtype=np.int64),
+            required_counts=required_counts,
+            preferred_counts=preferred_counts,
+            required_divisor=np.maximum(required_counts, 1.0),
+            preferred_divisor=np.maximum(preferred_counts, 1.0),
+            required_indptr=required_indptr,
+            required_indices=required_indices,
+            required_data=np.ones(len(required_indices), dtype=np.float64),
+            preferred_indptr=preferred_indptr,
+            preferred_indices=preferred_indices,
+            preferred_data=np.ones(len(preferred_indices), dtype=np.float64)
+        )
+
+    @staticmethod
+    def _postings(postings: Iterable[Tuple[int, int]], job_ids: np.ndarray,
+                  skill_count: int) -> Tuple[np.ndarray, np.ndarray]:
+        pairs = np.array(list(postings), dtype=np.int64).reshape(-1, 2)
+        order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+        skills, positions = pairs[order, 0], np.searchsorted(job_ids, pairs[order, 1])
+        indptr = np.zeros(skill_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(skills, minlength=skill_count), out=indptr[1:])
+        return indptr, positions.astype(np.int32)
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for name, array in self._asdict().items():
+            np.save(os.path.join(directory, f'{name}.npy'), array)
+
+    @classmethod
+    def load(cls, directory: str) -> 'JobColumns':
+        arrays = {}
+        for name in cls._fields:
+            path = os.path.join(directory, f'{name}.npy')
+            array = np.load(path, mmap_mode='r')
+            arrays[name] = array if array.size else np.load(path)
+        return cls(**arrays)
+
+
+class JobScoringEngine:
+    """Scores resumes against every job in a JobColumns snapshot with sparse matrix products.
+
+    Jobs are rows of binary CSC required/preferred matrices over skill ids,
+    so multiplying by a resume's skill-id vector gives the matched counts
+    behind the 60/25/15 score. The matrices wrap the snapshot's arrays
+    without copying them.
+    """
+
+    def __init__(self, columns: JobColumns, level_score: Callable[[str, int], float]):
+        self.columns = columns
+        self.level_score = level_score
+        shape = (len(columns.job_ids), len(columns.required_indptr) - 1)
+        self.required = sparse.csc_matrix(
+            (columns.required_data, columns.required_indices, columns.required_indptr), shape=shape, copy=False
+        )
+        self.preferred = sparse.csc_matrix(
+            (columns.preferred_data, columns.preferred_indices, columns.preferred_indptr), shape=shape, copy=False
+        )
+        # Negative experience falls outside the vectorised thresholds and is scored exactly by the caller.
+        self.irregular = np.flatnonzero(columns.experience < 0)
+
+    @property
+    def job_count(self) -> int:
+        return len(self.columns.job_ids)
+
+    @property
+    def skill_count(self) -> int:
+        return self.required.shape[1]
+
+    def resume_matrix(self, user_skills: Sequence[FrozenSet[int]]) -> np.ndarray:
+        """Encode resumes as a (skills x resumes) matrix of their skill ids."""
+        matrix = np.zeros((self.skill_count, len(user_skills)), dtype=np.float64)
+        for row, skill_ids in enumerate(user_skills):
+            for skill_id in skill_ids:
+                if 0 <= skill_id < self.skill_count:
+                    matrix[skill_id, row] = 1.0
+        return matrix
+
+    def score(self, user_skills: Sequence[FrozenSet[int]], user_experience: Sequence[float],
+              user_levels: Sequence[str]) -> np.ndarray:
+        """Return a (resumes x jobs) matrix of match scores, weighted 60/25/15 for skills/experience/level."""
+        columns = self.columns
+        resumes = self.resume_matrix(user_skills)
+        required_match = (self.required @ resumes) / columns.required_divisor.reshape(-1, 1)
+        preferred_match = (self.preferred @ resumes) / columns.preferred_divisor.reshape(-1, 1)
+        skill_score = (required_match * 0.8 + preferred_match * 0.2) * 60
+
+        experience = np.asarray(user_experience, dtype=np.float64).reshape(1, -1)
+        exp_score = 10.0 + 5.0 * ((experience >= columns.experience.reshape(-1, 1)).astype(np.float64)
+                                  + (experience >= columns.experience_high.reshape(-1, 1))
+                                  + (experience >= columns.experience_low.reshape(-1, 1)))
+
+        level_table = np.array([[0.0] + [self.level_score(level, job) for job in (1, 2, 3)] for level in user_levels])
+        level_score = level_table.T[columns.levels] * 15
+
+        total = skill_score + exp_score + level_score
+        return np.minimum(total.astype(np.int64), 100).T
+
+    def required_overlap(self, skill_ids: FrozenSet[int]) -> np.ndarray:
+        """Per job, how many of its required skills are among ``skill_ids``."""
+        return (self.required @ self.resume_matrix([skill_ids]))[:, 0]
+
+    def required_job_counts(self) -> np.ndarray:
+        """Per skill id, how many jobs require it."""
+        return np.diff(self.columns.required_indptr)
+
+    def top_k(self, scores: np.ndarray, k: int, threshold: int) -> np.ndarray:
+        """Positions of the k best scores at or above threshold, best first, earlier jobs winning ties."""
+        qualifying = np.flatnonzero(scores >= threshold)
+        keys = scores[qualifying] * self.job_count - qualifying
+        if len(qualifying) > k:
+            chosen = np.argpartition(-keys, k - 1)[:k]
+            qualifying, keys = qualifying[chosen], keys[chosen]
+        return qualifying[np.argsort(-keys)]
@@ -0,0 +1,693 @@
+import base64
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from job_scoring import JobColumns
+from skill_catalog import SkillCatalog, skill_catalog
+
+DATA_DIR = os.getenv('RESUME_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+DEFAULT_JOB_STORE = os.path.join(DATA_DIR, 'resume_jobs.sqlite3')
+SCHEMA_VERSION = 2
+
+SEED_JOBS: List[Dict[str, Any]] = [
+    {
+        "id": 1,
+        "title": "Senior Full Stack Developer",
+        "company": "TechCorp Inc.",
+        "location": "San Francisco, CA",
+        "salary_min": 120000,
+        "salary_max": 150000,
+        "required_skills": ["React", "Node.js", "JavaScript", "Python", "AWS", "Docker"],
+        "preferred_skills": ["TypeScript", "Kubernetes", "PostgreSQL"],
+        "experience_years": 5,
+        "job_type": "Full-time",
+        "remote": True,
+        "description": "We're looking for a senior full stack developer to join our growing team. You'll work on cutting-edge web applications and lead technical initiatives.",
+        "posted_days_ago": 2,
+        "benefits": ["Health Insurance", "401k", "Flexible Hours", "Remote Work"],
+        "team_size": "10-20 people"
+    },
+    {
+        "id": 2,
+        "title": "Frontend Developer",
+        "company": "StartupXYZ",
+        "location": "Austin, TX",
+        "salary_min": 80000,
+        "salary_max": 110000,
+        "required_skills": ["React", "JavaScript", "CSS", "HTML", "TypeScript"],
+        "preferred_skills": ["Redux", "Sass", "Webpack"],
+        "experience_years": 3,
+        "job_type": "Full-time",
+        "remote": False,
+        "description": "Join our dynamic team to create amazing user experiences. Work with modern frontend technologies in an agile environment.",
+        "posted_days_ago": 1,
+        "benefits": ["Health Insurance", "Stock Options", "Learning Budget"],
+        "team_size": "5-10 people"
+    },
+    {
+        "id": 3,
+        "title": "Backend Engineer",
+        "company": "CloudTech Solutions",
+        "location": "Seattle, WA",
+        "salary_min": 100000,
+        "salary_max": 130000,
+        "required_skills": ["Python", "Django", "PostgreSQL", "Docker", "Kubernetes"],
+        "preferred_skills": ["Redis", "Elasticsearch", "Terraform"],
+        "experience_years": 4,
+        "job_type": "Full-time",
+        "remote": True,
+        "description": "Build scalable backend systems for our cloud platform. Work with cutting-edge technologies and microservices architecture.",
+        "posted_days_ago": 3,
+        "benefits": ["Health Insurance", "401k", "Unlimited PTO"],
+        "team_size": "15-25 people"
+    },
+    {
+        "id": 4,
+        "title": "Data Scientist",
+        "company": "AI Innovations",
+        "location": "Boston, MA",
+        "salary_min": 130000,
+        "salary_max": 160000,
+        "required_skills": ["Python", "Machine Learning", "TensorFlow", "SQL", "Pandas"],
+        "preferred_skills": ["PyTorch", "Jupyter", "AWS", "Statistics"],
+        "experience_years": 3,
+        "job_type": "Full-time",
+        "remote": True,
+        "description": "Apply machine learning and statistical analysis to solve complex business problems. Work with large datasets and build predictive models.",
+        "posted_days_ago": 4,
+        "benefits": ["Health Insurance", "Research Budget", "Conference Attendance"],
+        "team_size": "8-12 people"
+    },
+    {
+        "id": 5,
+        "title": "DevOps Engineer",
+        "company": "Infrastructure Pro",
+        "location": "Denver, CO",
+        "salary_min": 110000,
+        "salary_max": 140000,
+        "required_skills": ["AWS", "Docker", "Kubernetes", "Terraform", "Python"],
+        "preferred_skills": ["Ansible", "Jenkins", "Monitoring"],
+        "experience_years": 4,
+        "job_type": "Full-time",
+        "remote": True,
+        "description": "Manage and optimize our cloud infrastructure. Implement CI/CD pipelines and ensure system reliability and scalability.",
+        "posted_days_ago": 5,
+        "benefits": ["Health Insurance", "401k", "Home Office Setup"],
+        "team_size": "6-10 people"
+    },
+    {
+        "id": 6,
+        "title": "Mobile Developer",
+        "company": "AppCraft Studios",
+        "location": "Los Angeles, CA",
+        "salary_min": 95000,
+        "salary_max": 125000,
+        "required_skills": ["React Native", "JavaScript", "iOS", "Android"],
+        "preferred_skills": ["Flutter", "Swift", "Kotlin"],
+        "experience_years": 3,
+        "job_type": "Full-time",
+        "remote": False,
+        "description": "Develop cross-platform mobile applications for millions of users. Work with cutting-edge mobile technologies.",
+        "posted_days_ago": 6,
+        "benefits": ["Health Insurance", "Gym Membership", "Catered Meals"],
+        "team_size": "12-18 people"
+    },
+    {
+        "id": 7,
+        "title": "Junior Software Developer",
+        "company": "TechStart Inc.",
+        "location": "Chicago, IL",
+        "salary_min": 65000,
+        "salary_max": 85000,
+        "required_skills": ["JavaScript", "HTML", "CSS", "Git"],
+        "preferred_skills": ["React", "Node.js", "SQL"],
+        "experience_years": 1,
+        "job_type": "Full-time",
+        "remote": True,
+        "description": "Great opportunity for junior developers to grow their skills. Mentorship program and learning opportunities available.",
+        "posted_days_ago": 7,
+        "benefits": ["Health Insurance", "Mentorship Program", "Learning Budget"],
+        "team_size": "20-30 people"
+    },
+    {
+        "id": 8,
+        "title": "UI/UX Designer",
+        "company": "DesignForward",
+        "location": "New York, NY",
+        "salary_min": 85000,
+        "salary_max": 115000,
+        "required_skills": ["Figma", "Adobe XD", "Sketch", "Prototyping"],
+        "preferred_skills": ["User Research", "Wireframing", "HTML", "CSS"],
+        "experience_years": 3,
+        "job_type": "Full-time",
+        "remote": True,
+        "description": "Design beautiful and intuitive user interfaces. Collaborate with product and engineering teams.",
+        "posted_days_ago": 8,
+        "benefits": ["Health Insurance", "Design Tools Budget", "Flexible Schedule"],
+        "team_size": "8-15 people"
+    }
+]
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS jobs ('
+    'id INTEGER PRIMARY KEY, title TEXT NOT NULL, company TEXT NOT NULL, location TEXT NOT NULL, '
+    'location_lower TEXT NOT NULL, salary_min INTEGER NOT NULL, salary_max INTEGER NOT NULL, '
+    'required_skills TEXT NOT NULL, preferred_skills TEXT NOT NULL, '
+    'experience_years INTEGER NOT NULL, job_type TEXT NOT NULL, job_type_lower TEXT NOT NULL, '
+    'remote INTEGER NOT NULL, description TEXT NOT NULL, posted_date TEXT NOT NULL, '
+    'benefits TEXT NOT NULL, team_size TEXT)',
+    'CREATE TABLE IF NOT EXISTS skills (id INTEGER PRIMARY KEY, canonical TEXT NOT NULL UNIQUE, name TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS job_skills ('
+    'job_id INTEGER NOT NULL, skill_id INTEGER NOT NULL, required INTEGER NOT NULL, '
+    'ordinal INTEGER NOT NULL, name TEXT NOT NULL, PRIMARY KEY (job_id, required, skill_id)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS job_skills_skill ON job_skills (skill_id, required, job_id)',
+    'CREATE TABLE IF NOT EXISTS job_locations ('
+    'term TEXT NOT NULL, job_id INTEGER NOT NULL, PRIMARY KEY (term, job_id)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS job_locations_job ON job_locations (job_id, term)',
+    'CREATE INDEX IF NOT EXISTS jobs_remote ON jobs (remote, posted_date DESC)',
+    'CREATE INDEX IF NOT EXISTS jobs_job_type ON jobs (job_type_lower, posted_date DESC)',
+    'CREATE INDEX IF NOT EXISTS jobs_salary ON jobs (salary_min, salary_max)',
+    'CREATE INDEX IF NOT EXISTS jobs_experience ON jobs (experience_years)',
+    'CREATE INDEX IF NOT EXISTS jobs_posted ON jobs (posted_date DESC)',
+)
+# Indexes whose definition changed since the previous schema version.
+_STALE_INDEXES = ('jobs_location', 'jobs_posted', 'jobs_remote', 'jobs_job_type')
+_SALARY_INDEX = 'CREATE VIRTUAL TABLE IF NOT EXISTS job_salary USING rtree_i32(id, salary_min, salary_max)'
+
+_JOB_FIELDS = ('id, title, company, location, salary_min, salary_max, required_skills, preferred_skills, '
+               'experience_years, job_type, remote, description, posted_date, benefits, team_size')
+# Filters matching fewer jobs than these drive page and count queries; larger ones are probed row by row.
+_DRIVER_LIMIT = 10000
+_COUNT_DRIVER_LIMIT = 100000
+_POSTED_DATE = _JOB_FIELDS.split(', ').index('posted_date')
+_QUERY_CHUNK = 500
+
+
+class JobSkills(NamedTuple):
+    required: Tuple[int, ...]
+    preferred: Tuple[int, ...]
+    names: Dict[int, str]
+
+
+class _Filter(NamedTuple):
+    probe: str
+    params: List[Any]
+    ids: Optional[str] = None
+
+
+class JobPage(NamedTuple):
+    jobs: List[Dict[str, Any]]
+    scores: List[Optional[int]]
+    total: Optional[int]
+    next_cursor: Optional[str]
+
+
+def location_terms(location: str) -> Set[str]:
+    """Prefix-searchable terms for a location: the whole value, each comma-separated part and each word."""
+    normalized = ' '.join(location.lower().split())
+    terms = {normalized}
+    for part in normalized.split(','):
+        part = part.strip()
+        terms.add(part)
+        terms.update(part.split())
+    terms.discard('')
+    return terms
+
+
+def encode_cursor(key: Tuple[Optional[int], str, int]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[int], str, int]:
+    try:
+        score, posted_date, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError(f"Invalid search cursor: {cursor!r}")
+    if not (score is None or isinstance(score, int)) or not isinstance(posted_date, str) or not isinstance(job_id, int):
+        raise ValueError(f"Invalid search cursor: {cursor!r}")
+    return score, posted_date, job_id
+
+
+class JobStore:
+    """SQLite job catalog with a memory-mapped columnar snapshot for scoring.
+
+    Rows, skills and the per-field indexes live in SQLite. Every write bumps
+    the store revision and saves a JobColumns snapshot next to the database,
+    which readers map read-only; worker processes open the store with
+    ``readonly=True`` and share those pages instead of holding the catalog.
+    Nothing is opened until the store is first used.
+    """
+
+    def __init__(self, path: str, readonly: bool = False, catalog: SkillCatalog = skill_catalog):
+        self.path = path
+        self.readonly = readonly
+        self.catalog = catalog
+        self.columns_dir = f'{path}.columns'
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._skills: Optional[Tuple[int, Dict[str, int]]] = None
+        self._columns: Optional[Tuple[int, JobColumns]] = None
+        self._salary_index = False
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            if self.readonly:
+                uri = Path(self.path).resolve().as_uri() + '?mode=ro'
+                db = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            else:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                db = sqlite3.connect(self.path, check_same_thread=False)
+                self._migrate(db)
+            self._salary_index = _has_table(db, 'job_salary')
+            self._db = db
+        return self._db
+
+    def _migrate(self, db: sqlite3.Connection) -> None:
+        db.execute(_SCHEMA[0])
+        row = db.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        current = row is not None and int(row[0]) == SCHEMA_VERSION
+        if not current:
+            for name in _STALE_INDEXES:
+                db.execute(f'DROP INDEX IF EXISTS {name}')
+        for statement in _SCHEMA:
+            db.execute(statement)
+        try:
+            db.execute(_SALARY_INDEX)
+        except sqlite3.OperationalError:
+            # SQLite built without R*Tree; salary filters fall back to the B-tree index.
+            pass
+        if not current:
+            self._index_search_fields(db)
+            db.execute('PRAGMA analysis_limit = 1000')
+            db.execute('ANALYZE')
+            db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+        db.commit()
+
+    def _index_search_fields(self, db: sqlite3.Connection) -> None:
+        has_salary_index = _has_table(db, 'job_salary')
+        db.execute('DELETE FROM job_locations')
+        if has_salary_index:
+            db.execute('DELETE FROM job_salary')
+        for job_id, location, salary_min, salary_max in db.execute(
+            'SELECT id, location, salary_min, salary_max FROM jobs'
+        ).fetchall():
+            self._index_job(db, job_id, location, salary_min, salary_max, has_salary_index)
+
+    def _read_revision(self, db: sqlite3.Connection) -> int:
+        row = db.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        return int(row[0]) if row else 0
+
+    @property
+    def revision(self) -> int:
+        with self._lock:
+            return self._read_revision(self._connection())
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection().execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def seed(self, jobs: Iterable[Dict[str, Any]]) -> None:
+        with self._lock:
+            if self.count() == 0:
+                self.add_jobs(jobs)
+
+    def add_jobs(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        if self.readonly:
+            raise PermissionError(f"Job store {self.path} is open read-only")
+        with self._lock:
+            db = self._connection()
+            try:
+                skills = dict(self._skill_index()[1])
+                for job in jobs:
+                    self._insert(db, job, skills)
+                revision = self._read_revision(db) + 1
+                db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('revision', ?)", (str(revision),))
+                # Fresh statistics let the planner drive each search from its most selective index.
+                db.execute('PRAGMA analysis_limit = 1000')
+                db.execute('ANALYZE')
+                self._save_columns(revision, self._build_columns(db))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                self._skills = None
+            self._prune_columns(revision)
+            return revision
+
+    def _insert(self, db: sqlite3.Connection, job: Dict[str, Any], skills: Dict[str, int]) -> None:
+        posted_date = job.get('posted_date')
+        if posted_date is None:
+            posted_date = datetime.now() - timedelta(days=job.get('posted_days_ago', 0))
+        if isinstance(posted_date, datetime):
+            posted_date = posted_date.isoformat()
+        db.execute(
+            f'INSERT OR REPLACE INTO jobs ({_JOB_FIELDS}, location_lower, job_type_lower) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (job['id'], job['title'], job['company'], job['location'], job['salary_min'], job['salary_max'],
+             json.dumps(job['required_skills']), json.dumps(job.get('preferred_skills', [])), job['experience_years'], job['job_type'], int(bool(job['remote'])), job['description'], posted_date,
+             json.dumps(job.get('benefits', [])), job.get('team_size'), job['location'].lower(),
+             job['job_type'].lower())
+        )
+        self._index_job(db, job['id'], job['location'], job['salary_min'], job['salary_max'], self._salary_index)
+        db.execute('DELETE FROM job_skills WHERE job_id = ?', (job['id'],))
+        for required, names in ((1, job['required_skills']), (0, job.get('preferred_skills', []))):
+            for ordinal, name in enumerate(names):
+                canonical = self.catalog.canonical(name)
+                skill_id = skills.get(canonical)
+                if skill_id is None:
+                    skill_id = db.execute(
+                        'INSERT INTO skills (canonical, name) VALUES (?, ?)', (canonical, name)
+                    ).lastrowid
+                    skills[canonical] = skill_id
+                db.execute(
+                    'INSERT OR IGNORE INTO job_skills (job_id, skill_id, required, ordinal, name) VALUES (?, ?, ?, ?, ?)',
+                    (job['id'], skill_id, required, ordinal, name)
+                )
+
+    def _index_job(self, db: sqlite3.Connection, job_id: int, location: str, salary_min: int, salary_max: int,
+                   salary_index: bool) -> None:
+        db.execute('DELETE FROM job_locations WHERE job_id = ?', (job_id,))
+        db.executemany(
+            'INSERT INTO job_locations (term, job_id) VALUES (?, ?)',
+            [(term, job_id) for term in location_terms(location)]
+        )
+        if salary_index:
+            db.execute(
+                'INSERT OR REPLACE INTO job_salary (id, salary_min, salary_max) VALUES (?, ?, ?)',
+                (job_id, min(salary_min, salary_max), max(salary_min, salary_max))
+            )
+
+    def _build_columns(self, db: sqlite3.Connection) -> JobColumns:
+        return JobColumns.build(
+            db.execute('SELECT id, experience_years, salary_min, salary_max FROM jobs ORDER BY id'),
+            db.execute('SELECT skill_id, job_id FROM job_skills WHERE required = 1'),
+            db.execute('SELECT skill_id, job_id FROM job_skills WHERE required = 0'),
+            db.execute('SELECT COALESCE(MAX(id), -1) + 1 FROM skills').fetchone()[0]
+        )
+
+    def _revision_dir(self, revision: int) -> str:
+        return os.path.join(self.columns_dir, f'rev-{revision}')
+
+    def _save_columns(self, revision: int, columns: JobColumns) -> None:
+        os.makedirs(self.columns_dir, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self.columns_dir, prefix='.staging-')
+        try:
+            columns.save(staging)
+            os.rename(staging, self._revision_dir(revision))
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(self._revision_dir(revision)):
+                raise
+
+    def _prune_columns(self, revision: int) -> None:
+        # The previous revision stays: a reader may have read it from meta and not yet mapped its files.
+        keep = {os.path.basename(self._revision_dir(revision)), os.path.basename(self._revision_dir(revision - 1))}
+        for name in os.listdir(self.columns_dir):
+            if name not in keep:
+                shutil.rmtree(os.path.join(self.columns_dir, name), ignore_errors=True)
+
+    def columns(self) -> JobColumns:
+        """The columnar snapshot for the current revision, memory-mapped when it is on disk."""
+        with self._lock:
+            db = self._connection()
+            revision = self._read_revision(db)
+            if self._columns is not None and self._columns[0] == revision:
+                return self._columns[1]
+            directory = self._revision_dir(revision)
+            columns = None
+            if os.path.isdir(directory):
+                try:
+                    columns = JobColumns.load(directory)
+                except FileNotFoundError:
+                    # Pruned by a writer that has since moved two revisions ahead; rebuild from the table.
+                    pass
+            if columns is None:
+                columns = self._build_columns(db)
+                if not self.readonly:
+                    self._save_columns(revision, columns)
+            self._columns = (revision, columns)
+            return columns
+
+    def _skill_index(self) -> Tuple[int, Dict[str, int]]:
+        db = self._connection()
+        revision = self._read_revision(db)
+        if self._skills is None or self._skills[0] != revision:
+            self._skills = (revision, dict(db.execute('SELECT canonical, id FROM skills')))
+        return self._skills
+
+    def skill_id(self, name: str) -> Optional[int]:
+        with self._lock:
+            return self._skill_index()[1].get(self.catalog.canonical(name))
+
+    def skill_ids(self, names: Iterable[str]) -> FrozenSet[int]:
+        """Ids of the skills any job lists; names no job lists cannot match and are dropped."""
+        with self._lock:
+            skills = self._skill_index()[1]
+            ids = (skills.get(self.catalog.canonical(name)) for name in names)
+            return frozenset(skill_id for skill_id in ids if skill_id is not None)
+
+    def skill_names(self, skill_ids: Iterable[int]) -> Dict[int, str]:
+        names: Dict[int, str] = {}
+        with self._lock:
+            db = self._connection()
+            for chunk in _chunks(list(skill_ids)):
+                names.update(db.execute(
+                    f'SELECT id, name FROM skills WHERE id IN ({_placeholders(chunk)})', chunk
+                ))
+        return names
+
+    def get_jobs(self, job_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """Jobs in the order of ``job_ids``; ids that do not exist are skipped."""
+        rows: Dict[int, tuple] = {}
+        with self._lock:
+            db = self._connection()
+            for chunk in _chunks([int(job_id) for job_id in job_ids]):
+                for row in db.execute(f'SELECT {_JOB_FIELDS} FROM jobs WHERE id IN ({_placeholders(chunk)})', chunk):
+                    rows[row[0]] = row
+            return self._hydrate(db, [rows[int(job_id)] for job_id in job_ids if int(job_id) in rows])
+
+    def _filters(self, skill_ids: Optional[FrozenSet[int]], location: str, remote_only: bool, job_type: str,
+                 salary_min: Optional[int], salary_max: Optional[int],
+                 experience_years: Optional[int]) -> List[_Filter]:
+        """Each filter as a per-row probe and, for filters with their own index table, a select of job ids.
+
+        Column probes are left to SQLite's indexes on ``jobs``; salary and
+        experience are written with unary ``+`` so a page walk is not
+        diverted from the posting-date order by them.
+        """
+        filters: List[_Filter] = []
+        if skill_ids is not None:
+            ids = sorted(skill_ids)
+            filters.append(_Filter(
+                f'EXISTS (SELECT 1 FROM job_skills WHERE job_id = jobs.id AND skill_id IN ({_placeholders(ids)}))',
+                ids,
+                f'SELECT job_id FROM job_skills WHERE skill_id IN ({_placeholders(ids)})'
+            ))
+        location = ' '.join(location.lower().split())
+        if location:
+            filters.append(_Filter(
+                '(EXISTS (SELECT 1 FROM job_locations WHERE job_id = jobs.id AND term >= ? AND term < ?) '
+                'OR remote = 1)',
+                [location, location[:-1] + chr(ord(location[-1]) + 1)],
+                'SELECT job_id FROM job_locations WHERE term >= ? AND term < ? '
+                'UNION ALL SELECT id FROM jobs WHERE remote = 1'
+            ))
+        if remote_only:
+            filters.append(_Filter('remote = 1', []))
+        if job_type:
+            filters.append(_Filter('job_type_lower = ?', [job_type.lower()]))
+        if salary_min is not None or salary_max is not None:
+            bounds: List[str] = []
+            params: List[Any] = []
+            if salary_min is not None:
+                bounds.append('salary_max >= ?')
+                params.append(salary_min)
+            if salary_max is not None:
+                bounds.append('salary_min <= ?')
+                params.append(salary_max)
+            table = 'job_salary' if self._salary_index else 'jobs'
+            filters.append(_Filter(
+                f"({' AND '.join('+' + bound for bound in bounds)})",
+                params,
+                f"SELECT id FROM {table} WHERE {' AND '.join(bounds)}"
+            ))
+        if experience_years is not None:
+            filters.append(_Filter('+experience_years <= ?', [experience_years]))
+        return filters
+
+    def _estimate(self, db: sqlite3.Connection, filters: List[_Filter]) -> List[Optional[int]]:
+        """Capped match counts through each indexed filter's own table; None for plain column filters."""
+        return [
+            db.execute(
+                f'SELECT COUNT(*) FROM (SELECT 1 FROM ({item.ids}) LIMIT ?)', item.params + [_COUNT_DRIVER_LIMIT]
+            ).fetchone()[0] if item.ids else None
+            for item in filters
+        ]
+
+    def _plan(self, filters: List[_Filter], estimates: List[Optional[int]],
+              driver_limit: int) -> Tuple[List[str], List[Any]]:
+        """Drive from the most selective indexed filter and probe the others on each of its rows.
+
+        When no indexed filter is under ``driver_limit`` every filter is
+        probed, so SQLite picks a column index or walks the posting-date
+        index, stopping at the page size.
+        """
+        candidates = [position for position, estimate in enumerate(estimates)
+                      if estimate is not None and estimate < driver_limit]
+        driver = min(candidates, key=estimates.__getitem__) if candidates else None
+        clauses: List[str] = []
+        params: List[Any] = []
+        if driver is not None:
+            clauses.append(f'id IN ({filters[driver].ids})')
+            params.extend(filters[driver].params)
+        for position, item in enumerate(filters):
+            if position != driver:
+                clauses.append(item.probe)
+                params.extend(item.params)
+        return clauses, params
+
+    def search(self, skill_ids: Optional[FrozenSet[int]] = None, location: str = '', remote_only: bool = False,
+               job_type: str = '', salary_min: Optional[int] = None, salary_max: Optional[int] = None,
+               experience_years: Optional[int] = None, limit: int = 20,
+               cursor: Optional[str] = None) -> JobPage:
+        """One page of jobs passing every given filter, with the total count across all pages on the first.
+
+        ``skill_ids`` keeps jobs listing any of them and scores each by the
+        share of its required skills among them, capped at 95; ``location``
+        prefix-matches a location term or keeps any remote job; the salary
+        bounds keep jobs whose range overlaps them; ``experience_years``
+        keeps jobs asking for no more. Pages are ordered by score, then
+        newest first, and continue from ``cursor``. Only the page itself is
+        read into memory. ``total`` is None on pages after the first, so a
+        page walk never counts the whole result.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        with self._lock:
+            db = self._connection()
+            if skill_ids is not None and not skill_ids:
+                return JobPage([], [], 0 if after is None else None, None)
+            filters = self._filters(
+                skill_ids, location, remote_only, job_type, salary_min, salary_max, experience_years
+            )
+            estimates = self._estimate(db, filters)
+            total = None
+
+            if skill_ids is None:
+                if after is None:
+                    clauses, params = self._plan(filters, estimates, _COUNT_DRIVER_LIMIT)
+                    total = db.execute(f'SELECT COUNT(*) FROM jobs{_where(clauses)}', params).fetchone()[0]
+                # A page walk stops at the page size, so only a small filter is worth driving from.
+                clauses, params = self._plan(filters, estimates, _DRIVER_LIMIT)
+                query = f'SELECT {_JOB_FIELDS}, NULL AS score FROM jobs'
+                order = 'posted_date DESC, id'
+            else:
+                # Every candidate is scored before ordering, so the first page takes its count from the same pass.
+                clauses, params = self._plan(filters, estimates, _COUNT_DRIVER_LIMIT)
+                ids = sorted(skill_ids)
+                counted = ', COUNT(*) OVER ()' if after is None else ''
+                query = (
+                    f'SELECT {_JOB_FIELDS}, score{counted} FROM ('
+                    f'SELECT jobs.*, CASE WHEN overlap.required_count = 0 THEN 0 ELSE CAST(MIN(95, '
+                    f'(CAST(overlap.matched AS REAL) / overlap.required_count) * 100) AS INTEGER) END AS score '
+                    f'FROM jobs JOIN ('
+                    f'SELECT job_id, SUM(required = 1 AND skill_id IN ({_placeholders(ids)})) AS matched, '
+                    f'SUM(required) AS required_count FROM job_skills '
+                    f'WHERE job_id IN (SELECT id FROM jobs{_where(clauses)}) GROUP BY job_id'
+                    f') AS overlap ON overlap.job_id = jobs.id)'
+                )
+                clauses, params = [], ids + params
+                order = 'score DESC, posted_date DESC, id'
+            if after is not None:
+                score, posted_date, job_id = after
+                keyset = '(posted_date < ? OR (posted_date = ? AND id > ?))'
+                keyset_params = [posted_date, posted_date, job_id]
+                if skill_ids is not None:
+                    keyset = f'(score < ? OR (score = ? AND {keyset}))'
+                    keyset_params = [score, score] + keyset_params
+                clauses, params = clauses + [keyset], params + keyset_params
+            rows = db.execute(
+                f'{query}{_where(clauses)} ORDER BY {order} LIMIT ?', params + [limit + 1]
+            ).fetchall()
+            if skill_ids is not None and after is None:
+                total = rows[0][-1] if rows else 0
+                rows = [row[:-1] for row in rows]
+
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last = rows[-1]
+                next_cursor = encode_cursor((last[-1], last[_POSTED_DATE], last[0]))
+            return JobPage(self._hydrate(db, [row[:-1] for row in rows]), [row[-1] for row in rows], total, next_cursor)
+
+    def _hydrate(self, db: sqlite3.Connection, rows: List[tuple]) -> List[Dict[str, Any]]:
+        skills: Dict[int, List[Tuple[int, int, str]]] = {}
+        for chunk in _chunks(list({row[0] for row in rows})):
+            for job_id, skill_id, required, name in db.execute(
+                f'SELECT job_id, skill_id, required, name FROM job_skills WHERE job_id IN ({_placeholders(chunk)}) '
+                'ORDER BY job_id, required DESC, ordinal', chunk
+            ):
+                skills.setdefault(job_id, []).append((skill_id, required, name))
+        jobs = []
+        for (job_id, title, company, location, salary_min, salary_max, required_skills, preferred_skills,
+             experience_years, job_type, remote, description, posted_date, benefits, team_size) in rows:
+            listed = skills.get(job_id, [])
+            jobs.append({
+                'id': job_id,
+                'title': title,
+                'company': company,
+                'location': location,
+                'salary_min': salary_min,
+                'salary_max': salary_max,
+                'required_skills': json.loads(required_skills),
+                'preferred_skills': json.loads(preferred_skills),
+                'experience_years': experience_years,
+                'job_type': job_type,
+                'remote': bool(remote),
+                'description': description,
+                'posted_date': datetime.fromisoformat(posted_date),
+                'benefits': json.loads(benefits),
+                'team_size': team_size,
+                'skills': JobSkills(
+                    required=tuple(skill_id for skill_id, required, _ in listed if required),
+                    preferred=tuple(skill_id for skill_id, required, _ in listed if not required),
+                    names={skill_id: name for skill_id, _, name in reversed(listed)}
+                )
+            })
+        return jobs
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            db = self._connection()
+            return {
+                'path': self.path,
+                'readonly': self.readonly,
+                'revision': self._read_revision(db),
+                'jobs': db.execute('SELECT COUNT(*) FROM jobs').fetchone()[0],
+                'skills': db.execute('SELECT COUNT(*) FROM skills').fetchone()[0],
+                'columns_mapped': self._columns is not None
+            }
+
+
+def _chunks(values: List[Any]) -> Iterable[List[Any]]:
+    for start in range(0, len(values), _QUERY_CHUNK):
+        yield values[start:start + _QUERY_CHUNK]
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ', '.join('?' * len(values))
+
+
+def _has_table(db: sqlite3.Connection, name: str) -> bool:
+    return db.execute('SELECT COUNT(*) FROM sqlite_master WHERE name = ?', (name,)).fetchone()[0] > 0
+
+
+def _where(clauses: List[str]) -> str:
+    return f" WHERE {' AND '.join(clauses)}" if clauses else ''
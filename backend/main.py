@@ -1,20 +1,107 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
 import os
+import sys
 import tempfile
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 import json
 import asyncio
+import time
+from contextlib import nullcontext
 from datetime import datetime
-from resume_parser import ImprovedResumeParser
-from ai_analyzer import ImprovedAIAnalyzer
+import ai_analyzer
+import contact_extractor
+import intelligent_education_detector
+import job_matcher as job_matcher_module
+import job_scoring
+import models
+import parsed_document
+import resume_parser as resume_parser_module
+import section_index
+import skill_catalog
+import skill_matcher
+import text_normalizer
+from resume_parser import ImprovedResumeParser, EXTRACTOR_VERSION
 from job_matcher import EnhancedJobMatcher
-from models import ResumeAnalysis, JobMatch, ContactInfo
+from job_store import DEFAULT_JOB_STORE, SEED_JOBS, JobStore
+from models import ResumeAnalysis, JobMatch, ContactInfo, JobSearchRequest
+from pattern_registry import pattern_registry
+from analysis_cache import AnalysisCache, pipeline_fingerprint
+from extracted_text import ExtractedText
+from text_store import TextStore
+from worker_pool import (
+    WorkerPool, PoolSaturated, extract_content, extract_routed, extract_pdf_pages, pdf_profile, analyze_text,
+    extract_contact, extract_skills, debug_parse
+)
+from incremental_analysis import IncrementalAnalysis
+from extractor_router import ExtractorRouter, PdfProfile, RouteDecision, UnreadableDocument, is_good_text
+from memory_guard import MemoryLimitExceeded
+from upload_ingest import UploadIngestor, UploadLimitMiddleware, UploadTooLarge, IngestedUpload
 
 app = FastAPI(title="Improved AI Resume Analyzer", version="3.0.0")
 
+parser_options = {
+    'document_memory_limit': int(os.getenv('RESUME_DOC_MEMORY_MB', '512')) * 1024 * 1024 or None
+}
+resume_parser = ImprovedResumeParser(**parser_options)
+job_store = JobStore(os.getenv('RESUME_JOB_STORE', DEFAULT_JOB_STORE))
+job_matcher = EnhancedJobMatcher(job_store)
+# Modules whose code shapes cached responses: the parsing pipeline, the response models and this module's builders.
+PIPELINE_MODULES = (
+    resume_parser_module, ai_analyzer, contact_extractor, intelligent_education_detector, section_index,
+    parsed_document, text_normalizer, skill_matcher, skill_catalog, job_matcher_module, job_scoring,
+    models, sys.modules[__name__]
+)
+analysis_cache = AnalysisCache(
+    version=":".join([
+        "3.0.0",
+        EXTRACTOR_VERSION,
+        pattern_registry.fingerprint(),
+        pipeline_fingerprint(*PIPELINE_MODULES)
+    ]),
+    max_entries=int(os.getenv('RESUME_CACHE_SIZE', '256')),
+    ttl_seconds=float(os.getenv('RESUME_CACHE_TTL', '3600')),
+    db_path=os.getenv('RESUME_CACHE_DB') or None
+)
+text_store = TextStore(
+    root=os.getenv('RESUME_TEXT_STORE_DIR', os.path.join(tempfile.gettempdir(), 'resume_text_store')),
+    version=EXTRACTOR_VERSION
+)
+
+worker_count = int(os.getenv('RESUME_WORKERS', str(os.cpu_count() or 1)))
+worker_pool = WorkerPool(
+    max_workers=worker_count,
+    max_pending=int(os.getenv('RESUME_WORKER_QUEUE', str(max(worker_count, 1) * 4))),
+    queue_timeout=float(os.getenv('RESUME_WORKER_QUEUE_TIMEOUT', '30')),
+    parser_options=parser_options,
+    job_store_path=job_store.path
+)
+parallel_min_pages = int(os.getenv('RESUME_PARALLEL_MIN_PAGES', '2'))
+extractor_router = ExtractorRouter(
+    min_samples=int(os.getenv('RESUME_ROUTER_MIN_SAMPLES', '5')),
+    explore_every=int(os.getenv('RESUME_ROUTER_EXPLORE_EVERY', '20'))
+)
+slow_lane = asyncio.Semaphore(int(os.getenv('RESUME_SLOW_LANE_SLOTS', '1')))
+upload_ingestor = UploadIngestor(
+    max_bytes=int(os.getenv('RESUME_MAX_UPLOAD_BYTES', str(10 * 1024 * 1024))),
+    spool_threshold=int(os.getenv('RESUME_UPLOAD_SPOOL_BYTES', str(1024 * 1024))),
+    chunk_size=int(os.getenv('RESUME_UPLOAD_CHUNK_BYTES', str(64 * 1024)))
+)
+WARM_MAX_FILES = int(os.getenv('RESUME_WARM_MAX_FILES', '20'))
+# Files each upload path accepts; the request body limit scales with it.
+UPLOAD_PATHS = {"/upload-resume": 1, "/upload-resume/stream": 1, "/debug-parsing": 1, "/text-store/warm": WARM_MAX_FILES}
+MULTIPART_OVERHEAD = 64 * 1024
+FILE_TOO_LARGE = "File size too large. Maximum 10MB allowed."
+app.add_middleware(
+    UploadLimitMiddleware,
+    ingestor=upload_ingestor,
+    paths=UPLOAD_PATHS,
+    overhead=MULTIPART_OVERHEAD,
+    detail=FILE_TOO_LARGE
+)
+# Registered after the upload limit so it wraps it and the limit's 413 carries CORS headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -23,9 +110,239 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-resume_parser = ImprovedResumeParser()
-ai_analyzer = ImprovedAIAnalyzer()
-job_matcher = EnhancedJobMatcher()
+def match_cache_key(namespace: str, *parts: str) -> str:
+    # Responses carrying job_matches go stale when the job catalog changes.
+    return analysis_cache.key(namespace, str(job_store.revision), *parts)
+
+ALLOWED_TYPES = [
+    'application/pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+]
+
+async def extract_upload(upload: IngestedUpload, max_pages: int = 10, **routing) -> ExtractedText:
+    file_hash, content_type, filename = upload.file_hash, upload.content_type, upload.filename
+    extracted = text_store.get(file_hash, content_type, max_pages)
+    if extracted is not None:
+        return extracted
+    if content_type == 'application/pdf':
+        extracted = await extract_pdf_routed(upload, max_pages, **routing)
+    else:
+        extracted = await worker_pool.run(extract_content, upload.source, filename, content_type, max_pages)
+    text_store.put(file_hash, content_type, max_pages, extracted)
+    return extracted
+
+async def route_pdf(upload: IngestedUpload) -> Tuple[Optional[PdfProfile], RouteDecision]:
+    profile = None
+    try:
+        profile = await worker_pool.run(pdf_profile, upload.source, upload.filename)
+    except PoolSaturated:
+        raise
+    except Exception as e:
+        print(f"PDF profiling failed: {e}")
+    extractor_router.triage(profile)
+    decision = extractor_router.route(profile)
+    print(f"Extractor route: {decision.document_class} -> {'/'.join(decision.order)} ({decision.lane} lane)")
+    return profile, decision
+
+# Callers that already routed the upload pass its profile and decision; one that already ran and recorded
+# the page-parallel pdfplumber attempt passes that result as parallel_result so it is not repeated.
+async def extract_pdf_routed(
+    upload: IngestedUpload,
+    max_pages: int,
+    profile: Optional[PdfProfile] = None,
+    decision: Optional[RouteDecision] = None,
+    parallel_result: Optional[ExtractedText] = None
+) -> ExtractedText:
+    if decision is None:
+        profile, decision = await route_pdf(upload)
+    order = decision.order
+    async with (slow_lane if decision.lane == 'slow' else nullcontext()):
+        pages_to_process = min(profile.page_count, max_pages) if profile is not None else 0
+        if parallel_result is not None:
+            if order[0] == 'pdfplumber':
+                order = order[1:]
+        elif order[0] == 'pdfplumber' and worker_pool.parallel and pages_to_process >= parallel_min_pages:
+            started = time.perf_counter()
+            try:
+                pages = await worker_pool.extract_pdf_pages(upload.source, upload.filename, pages_to_process)
+                parallel_result = resume_parser.assemble_pdf_pages(pages)
+            except (PoolSaturated, MemoryLimitExceeded):
+                raise
+            except Exception as e:
+                print(f"Page-parallel extraction failed, falling back to serial: {e}")
+            good = parallel_result is not None and is_good_text(parallel_result.text)
+            extractor_router.record(decision.document_class, [('pdfplumber', time.perf_counter() - started, good)])
+            if good:
+                return parallel_result
+            order = order[1:]
+        extracted, attempts, error = await worker_pool.run(extract_routed, upload.source, upload.filename, max_pages, order)
+    extractor_router.record(decision.document_class, attempts)
+    if extracted is None and parallel_result is not None and parallel_result.text:
+        return parallel_result
+    if extracted is None:
+        raise Exception(error)
+    return extracted
+
+def analysis_response(resume_text: str, result: Dict[str, Any], **metadata: Any) -> Dict[str, Any]:
+    contact_info = result["contact_info"]
+    print(f"Extracted contact: {contact_info}")
+    professional_summary = result["professional_summary"]
+    print(f"Extracted summary: {professional_summary[:100] if professional_summary else 'None'}...")
+    skills = result["skills"]
+    print(f"Extracted skills: {skills}")
+    print(f"Extracted education info: {result['education_info']}")
+    analysis = result["analysis"]
+    print(f"Analysis complete - Score: {analysis.score}, skipped stages: {analysis.skipped_stages}")
+    job_matches = result["job_matches"]
+    print(f"Found {len(job_matches)} job matches")
+    return {
+        "success": True,
+        "analysis": {
+            "contact": contact_info,
+            "skills": skills,
+            "professional_summary": professional_summary or analysis.summary,
+            "experience": analysis.experience,
+            "education": analysis.education,
+            "score": analysis.score,
+            "analysis_date": analysis.analysis_date
+        },
+        "job_matches": [job.dict() for job in job_matches],
+        "metadata": {
+            **metadata,
+            "text_length": len(resume_text),
+            "processing_time": datetime.now().isoformat(),
+            "parser_version": "3.0.0",
+            "features_detected": {
+                "has_contact_info": bool(contact_info.get('name') or contact_info.get('email')),
+                "has_professional_summary": bool(professional_summary),
+                "skills_count": len(skills),
+                "experience_years": analysis.experience.get('years', 0),
+                "education_level": analysis.education.get('highest_degree'),
+                "resume_type": analysis.experience.get('level', 'Professional')
+            },
+            "skipped_stages": analysis.skipped_stages
+        }
+    }
+
+async def analyze_upload(upload: IngestedUpload, extracted: ExtractedText) -> Dict[str, Any]:
+    resume_text = extracted.text
+    print(f"Extracted text length: {len(resume_text)}")
+    if not resume_text or len(resume_text.strip()) < 50:
+        raise HTTPException(
+            status_code=400,
+            detail="Could not extract meaningful text from the file. Please ensure the file is not corrupted."
+        )
+    result = await worker_pool.run(analyze_text, resume_text)
+    response_data = analysis_response(
+        resume_text, result,
+        file_name=upload.filename,
+        file_size=upload.size,
+        page_count=extracted.page_count,
+        table_count=extracted.table_count,
+        extractor=extracted.producer
+    )
+    if len(resume_text) > 300:
+        response_data["text_preview"] = resume_text[:300] + "..."
+    else:
+        response_data["text_preview"] = resume_text
+    return response_data
+
+async def stream_upload_pages(upload: IngestedUpload, max_pages: int = 10) -> AsyncIterator[Tuple[str, Any]]:
+    extracted = text_store.get(upload.file_hash, upload.content_type, max_pages)
+    streamed = set()
+    if extracted is None and upload.content_type == 'application/pdf' and worker_pool.parallel:
+        profile, decision = await route_pdf(upload)
+        routing = {'profile': profile, 'decision': decision}
+        if profile is not None and decision.order[0] == 'pdfplumber' and decision.lane == 'fast':
+            started = time.perf_counter()
+            tasks = [
+                asyncio.ensure_future(worker_pool.run(extract_pdf_pages, upload.source, upload.filename, [number]))
+                for number in range(1, min(profile.page_count, max_pages) + 1)
+            ]
+            pages = []
+            try:
+                for task in tasks:
+                    for page in await task:
+                        pages.append(page)
+                        streamed.add(page.number)
+                        yield "page", page
+            except (PoolSaturated, MemoryLimitExceeded):
+                raise
+            except Exception as e:
+                print(f"Page-streamed extraction failed, falling back to serial: {e}")
+                pages = []
+            finally:
+                for task in tasks:
+                    task.cancel()
+            candidate = resume_parser.assemble_pdf_pages(pages)
+            good = is_good_text(candidate.text)
+            extractor_router.record(decision.document_class, [('pdfplumber', time.perf_counter() - started, good)])
+            if good:
+                extracted = candidate
+                text_store.put(upload.file_hash, upload.content_type, max_pages, extracted)
+            else:
+                routing['parallel_result'] = candidate
+    else:
+        routing = {}
+    if extracted is None:
+        extracted = await extract_upload(upload, max_pages, **routing)
+    for page in extracted.pages:
+        if page.number not in streamed:
+            yield "page", page
+    yield "document", extracted
+
+async def stream_resume_events(upload: IngestedUpload, cache_key: str) -> AsyncIterator[str]:
+    try:
+        incremental = IncrementalAnalysis(resume_parser)
+        async for kind, item in stream_upload_pages(upload, max_pages=10):
+            if kind == "page":
+                findings = incremental.feed(item)
+                yield json.dumps({"event": "page", "page": item.number, "text_length": len(item.text)}) + "\n"
+                if findings["contact"]:
+                    yield json.dumps({"event": "contact", "page": item.number, "contact": findings["contact"], "provisional": True}) + "\n"
+                if findings["skills"]:
+                    yield json.dumps({"event": "skills", "page": item.number, "skills": findings["skills"], "provisional": True}) + "\n"
+                if findings["sections"]:
+                    yield json.dumps({"event": "sections", "page": item.number, "sections": findings["sections"], "provisional": True}) + "\n"
+            else:
+                response_data = await analyze_upload(upload, item)
+                analysis_cache.set(cache_key, response_data)
+                yield json.dumps({"event": "result", "data": response_data}, default=str) + "\n"
+    except Exception as e:
+        error = processing_error(e)
+        yield json.dumps({"event": "error", "status_code": error.status_code, "detail": error.detail}) + "\n"
+    finally:
+        upload.close()
+
+def processing_error(e: Exception) -> HTTPException:
+    print(f"Processing error: {str(e)}")
+    if isinstance(e, HTTPException):
+        return e
+    if isinstance(e, PoolSaturated):
+        return HTTPException(status_code=503, detail="Server is busy processing other resumes. Please retry shortly.")
+    if isinstance(e, MemoryLimitExceeded):
+        return HTTPException(status_code=413, detail=f"Error processing resume: {str(e)}")
+    if isinstance(e, UnreadableDocument):
+        return HTTPException(status_code=400, detail=f"Error processing resume: {str(e)}")
+    error_msg = str(e)
+    if "PDF" in error_msg:
+        error_msg = "Failed to parse PDF file. The file may be corrupted, password-protected, or contain only images."
+    elif "DOCX" in error_msg:
+        error_msg = "Failed to parse DOCX file. The file may be corrupted."
+    elif "text" in error_msg.lower():
+        error_msg = "Could not extract readable text from the file. Please ensure the document contains text and is not just images."
+    return HTTPException(status_code=500, detail=f"Error processing resume: {error_msg}")
+
+@app.on_event("startup")
+async def start_worker_pool():
+    job_store.seed(SEED_JOBS)
+    job_store.columns()
+    await worker_pool.start()
+    print(f"Worker pool ready: {worker_pool.stats()}")
+
+@app.on_event("shutdown")
+async def stop_worker_pool():
+    worker_pool.shutdown()
 
 @app.get("/")
 async def root():
@@ -52,7 +369,10 @@ async def health_check():
             "parser": "improved",
             "analyzer": "improved", 
             "job_matcher": "enhanced"
-        }
+        },
+        "worker_pool": worker_pool.stats(),
+        "uploads": upload_ingestor.stats(),
+        "job_store": job_store.stats()
     }
 
 @app.post("/upload-resume", response_model=Dict[str, Any])
@@ -67,95 +387,56 @@ async def upload_resume(file: UploadFile = File(...)):
                 status_code=400, 
                 detail="Only PDF and DOCX files are supported"
             )
-        content = await file.read()
-        if len(content) > 10 * 1024 * 1024:
-            raise HTTPException(
-                status_code=400,
-                detail="File size too large. Maximum 10MB allowed."
-            )
-        file_extension = os.path.splitext(file.filename)[1]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-            tmp_file.write(content)
-            tmp_file_path = tmp_file.name
+        try:
+            upload = await upload_ingestor.ingest(file)
+        except UploadTooLarge:
+            raise HTTPException(status_code=413, detail=FILE_TOO_LARGE)
+        cache_key = match_cache_key("upload-resume", file.content_type, upload.file_hash)
+        cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            upload.close()
+            print(f"Cache hit for file: {file.filename}")
+            cached["metadata"]["file_name"] = file.filename
+            cached["metadata"]["processing_time"] = datetime.now().isoformat()
+            cached["metadata"]["cached"] = True
+            return cached
         try:
             print(f"Processing file: {file.filename}")
-            resume_text = resume_parser.extract_text(tmp_file_path, file.content_type, max_pages=10)
-            print(f"Extracted text length: {len(resume_text)}")
-            if not resume_text or len(resume_text.strip()) < 50:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Could not extract meaningful text from the file. Please ensure the file is not corrupted."
-                )
-            contact_info = resume_parser.extract_contact_info(resume_text)
-            print(f"Extracted contact: {contact_info}")
-            professional_summary = resume_parser.extract_professional_summary(resume_text)
-            print(f"Extracted summary: {professional_summary[:100] if professional_summary else 'None'}...")
-            skills = resume_parser.extract_skills(resume_text)
-            print(f"Extracted skills: {skills}")
-            education_info = resume_parser.extract_education_info(resume_text)
-            print(f"Extracted education info: {education_info}")
-            analysis = await ai_analyzer.analyze_resume(resume_text, contact_info)
-            print(f"Analysis complete - Score: {analysis.score}")
-            if education_info['institutions']:
-                analysis.education['institution'] = education_info['institutions'][0]
-            if education_info['fields']:
-                analysis.education['field_of_study'] = education_info['fields'][0]
-            job_matches = await job_matcher.find_matches(analysis)
-            print(f"Found {len(job_matches)} job matches")
-            os.unlink(tmp_file_path)
-            response_data = {
-                "success": True,
-                "analysis": {
-                    "contact": contact_info,
-                    "skills": skills,
-                    "professional_summary": professional_summary or analysis.summary,
-                    "experience": analysis.experience,
-                    "education": analysis.education,
-                    "score": analysis.score,
-                    "analysis_date": analysis.analysis_date
-                },
-                "job_matches": [job.dict() for job in job_matches],
-                "metadata": {
-                    "file_name": file.filename,
-                    "file_size": len(content),
-                    "text_length": len(resume_text),
-                    "processing_time": datetime.now().isoformat(),
-                    "parser_version": "3.0.0",
-                    "features_detected": {
-                        "has_contact_info": bool(contact_info.get('name') or contact_info.get('email')),
-                        "has_professional_summary": bool(professional_summary),
-                        "skills_count": len(skills),
-                        "experience_years": analysis.experience.get('years', 0),
-                        "education_level": analysis.education.get('highest_degree'),
-                        "resume_type": analysis.experience.get('level', 'Professional')
-                    }
-                }
-            }
-            if len(resume_text) > 300:
-                response_data["text_preview"] = resume_text[:300] + "..."
-            else:
-                response_data["text_preview"] = resume_text
+            extracted = await extract_upload(upload, max_pages=10)
+            response_data = await analyze_upload(upload, extracted)
+            analysis_cache.set(cache_key, response_data)
             return response_data
         except Exception as e:
-            if os.path.exists(tmp_file_path):
-                os.unlink(tmp_file_path)
-            print(f"Processing error: {str(e)}")
-            if isinstance(e, HTTPException):
-                raise e
-            error_msg = str(e)
-            if "PDF" in error_msg:
-                error_msg = "Failed to parse PDF file. The file may be corrupted, password-protected, or contain only images."
-            elif "DOCX" in error_msg:
-                error_msg = "Failed to parse DOCX file. The file may be corrupted."
-            elif "text" in error_msg.lower():
-                error_msg = "Could not extract readable text from the file. Please ensure the document contains text and is not just images."
-            raise HTTPException(status_code=500, detail=f"Error processing resume: {error_msg}")
+            raise processing_error(e)
+        finally:
+            upload.close()
     except HTTPException:
         raise
     except Exception as e:
         print(f"Unexpected error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
+@app.post("/upload-resume/stream")
+async def upload_resume_stream(file: UploadFile = File(...)):
+    if file.content_type not in ALLOWED_TYPES:
+        raise HTTPException(status_code=400, detail="Only PDF and DOCX files are supported")
+    try:
+        upload = await upload_ingestor.ingest(file)
+    except UploadTooLarge:
+        raise HTTPException(status_code=413, detail=FILE_TOO_LARGE)
+    cache_key = match_cache_key("upload-resume", file.content_type, upload.file_hash)
+    cached = analysis_cache.get(cache_key)
+    if cached is not None:
+        upload.close()
+        cached["metadata"]["file_name"] = file.filename
+        cached["metadata"]["processing_time"] = datetime.now().isoformat()
+        cached["metadata"]["cached"] = True
+        return StreamingResponse(
+            iter([json.dumps({"event": "result", "data": cached}, default=str) + "\n"]),
+            media_type="application/x-ndjson"
+        )
+    return StreamingResponse(stream_resume_events(upload, cache_key), media_type="application/x-ndjson")
+
 @app.post("/analyze-text")
 async def analyze_resume_text(data: Dict[str, str]):
     try:
@@ -164,94 +445,88 @@ async def analyze_resume_text(data: Dict[str, str]):
             raise HTTPException(status_code=400, detail="Resume text is required")
         if len(resume_text) < 50:
             raise HTTPException(status_code=400, detail="Resume text is too short. Please provide more content (minimum 50 characters).")
+        cache_key = match_cache_key("analyze-text", resume_text)
+        cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            print(f"Cache hit for text of length: {len(resume_text)}")
+            cached["metadata"]["processing_time"] = datetime.now().isoformat()
+            cached["metadata"]["cached"] = True
+            return cached
         print(f"Analyzing text of length: {len(resume_text)}")
-        contact_info = resume_parser.extract_contact_info(resume_text)
-        print(f"Extracted contact: {contact_info}")
-        professional_summary = resume_parser.extract_professional_summary(resume_text)
-        print(f"Extracted summary: {professional_summary[:100] if professional_summary else 'None'}...")
-        skills = resume_parser.extract_skills(resume_text)
-        print(f"Extracted skills: {skills}")
-        education_info = resume_parser.extract_education_info(resume_text)
-        print(f"Extracted education info: {education_info}")
-        analysis = await ai_analyzer.analyze_resume(resume_text, contact_info)
-        print(f"Analysis complete - Score: {analysis.score}")
-        if education_info['institutions']:
-            analysis.education['institution'] = education_info['institutions'][0]
-        if education_info['fields']:
-            analysis.education['field_of_study'] = education_info['fields'][0]
-        job_matches = await job_matcher.find_matches(analysis)
-        print(f"Found {len(job_matches)} job matches")
-        return {
-            "success": True,
-            "analysis": {
-                "contact": contact_info,
-                "skills": skills,
-                "professional_summary": professional_summary or analysis.summary,
-                "experience": analysis.experience,
-                "education": analysis.education,
-                "score": analysis.score,
-                "analysis_date": analysis.analysis_date
-            },
-            "job_matches": [job.dict() for job in job_matches],
-            "metadata": {
-                "text_length": len(resume_text),
-                "processing_time": datetime.now().isoformat(),
-                "parser_version": "3.0.0",
-                "features_detected": {
-                    "has_contact_info": bool(contact_info.get('name') or contact_info.get('email')),
-                    "has_professional_summary": bool(professional_summary),
-                    "skills_count": len(skills),
-                    "experience_years": analysis.experience.get('years', 0),
-                    "education_level": analysis.education.get('highest_degree'),
-                    "resume_type": analysis.experience.get('level', 'Professional')
-                }
-            }
-        }
+        result = await worker_pool.run(analyze_text, resume_text)
+        response_data = analysis_response(resume_text, result)
+        analysis_cache.set(cache_key, response_data)
+        return response_data
     except HTTPException:
         raise
+    except PoolSaturated:
+        raise HTTPException(status_code=503, detail="Server is busy processing other resumes. Please retry shortly.")
     except Exception as e:
         print(f"Text analysis error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error analyzing text: {str(e)}")
 
-@app.get("/jobs/search")
-async def search_jobs(skills: str = "", experience: str = "", location: str = ""):
+async def _search_jobs(search: JobSearchRequest) -> Dict[str, Any]:
     try:
-        skills_list = []
-        if skills:
-            skills_list = [skill.strip() for skill in skills.split(",") if skill.strip()]
-        jobs = await job_matcher.search_jobs(
-            skills=skills_list,
-            experience=experience,
-            location=location
-        )
+        page = await job_matcher.search_jobs(search)
         return {
             "success": True,
-            "jobs": [job.dict() for job in jobs],
-            "total_found": len(jobs),
-            "search_criteria": {
-                "skills": skills_list,
-                "experience": experience,
-                "location": location
-            },
+            "jobs": [job.dict() for job in page.jobs],
+            "total_found": page.total,
+            "next_cursor": page.next_cursor,
+            "search_criteria": search.dict(exclude={"cursor"}),
             "timestamp": datetime.now().isoformat()
         }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"Job search error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error searching jobs: {str(e)}")
 
+@app.post("/jobs/search")
+async def search_jobs_indexed(search: JobSearchRequest):
+    return await _search_jobs(search)
+
+@app.get("/jobs/search")
+async def search_jobs(skills: str = "", experience: str = "", location: str = "", job_type: str = "",
+                      remote_only: bool = False, salary_min: Optional[int] = None, salary_max: Optional[int] = None,
+                      limit: int = 20, cursor: Optional[str] = None):
+    try:
+        search = JobSearchRequest(
+            skills=[skill.strip() for skill in skills.split(",") if skill.strip()],
+            experience_years=int(experience) if experience.strip().isdigit() else None,
+            location=location,
+            job_type=job_type,
+            remote_only=remote_only,
+            salary_min=salary_min,
+            salary_max=salary_max,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await _search_jobs(search)
+
 @app.post("/extract-contact")
 async def extract_contact_only(data: Dict[str, str]):
     try:
         resume_text = data.get("text", "").strip()
         if not resume_text:
             raise HTTPException(status_code=400, detail="Resume text is required")
-        contact_info = resume_parser.extract_contact_info(resume_text)
+        cache_key = analysis_cache.key("extract-contact", resume_text)
+        contact_info = analysis_cache.get(cache_key)
+        if contact_info is None:
+            contact_info = await worker_pool.run(extract_contact, resume_text)
+            analysis_cache.set(cache_key, contact_info)
         return {
             "success": True,
             "contact": contact_info,
             "extracted_at": datetime.now().isoformat(),
             "text_length": len(resume_text)
         }
+    except HTTPException:
+        raise
+    except PoolSaturated:
+        raise HTTPException(status_code=503, detail="Server is busy processing other resumes. Please retry shortly.")
     except Exception as e:
         print(f"Contact extraction error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error extracting contact: {str(e)}")
@@ -262,15 +537,13 @@ async def extract_skills_only(data: Dict[str, str]):
         resume_text = data.get("text", "").strip()
         if not resume_text:
             raise HTTPException(status_code=400, detail="Resume text is required")
-        skills = resume_parser.extract_skills(resume_text)
-        categorized_skills = {}
-        for category, skill_list in resume_parser.skill_patterns.items():
-            category_skills = []
-            for skill in skills:
-                if skill.lower() in [s.lower() for s in skill_list]:
-                    category_skills.append(skill)
-            if category_skills:
-                categorized_skills[category.replace('_', ' ').title()] = category_skills
+        cache_key = analysis_cache.key("extract-skills", resume_text)
+        extracted = analysis_cache.get(cache_key)
+        if extracted is None:
+            extracted = await worker_pool.run(extract_skills, resume_text)
+            analysis_cache.set(cache_key, extracted)
+        skills = extracted["skills"]
+        categorized_skills = extracted["categorized_skills"]
         return {
             "success": True,
             "skills": skills,
@@ -278,6 +551,10 @@ async def extract_skills_only(data: Dict[str, str]):
             "skill_count": len(skills),
             "extracted_at": datetime.now().isoformat()
         }
+    except HTTPException:
+        raise
+    except PoolSaturated:
+        raise HTTPException(status_code=503, detail="Server is busy processing other resumes. Please retry shortly.")
     except Exception as e:
         print(f"Skills extraction error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error extracting skills: {str(e)}")
@@ -304,8 +581,135 @@ async def get_supported_skills():
         print(f"Supported skills error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error retrieving supported skills: {str(e)}")
 
+@app.get("/pattern-stats")
+async def get_pattern_stats(limit: int = 0, sort_by: str = "total_time_ms"):
+    try:
+        return {
+            "success": True,
+            "enabled": pattern_registry.enabled,
+            "patterns_registered": len(pattern_registry),
+            "patterns": pattern_registry.stats(sort_by=sort_by, limit=limit or None),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        print(f"Pattern stats error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving pattern stats: {str(e)}")
+
+@app.post("/pattern-stats/reset")
+async def reset_pattern_stats():
+    pattern_registry.reset_stats()
+    return {
+        "success": True,
+        "reset_at": datetime.now().isoformat()
+    }
+
+@app.get("/cache-stats")
+async def get_cache_stats():
+    try:
+        return {
+            "success": True,
+            "cache": analysis_cache.stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        print(f"Cache stats error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving cache stats: {str(e)}")
+
+@app.post("/cache/clear")
+async def clear_analysis_cache():
+    analysis_cache.clear()
+    return {
+        "success": True,
+        "cleared_at": datetime.now().isoformat()
+    }
+
+@app.get("/text-store/stats")
+async def get_text_store_stats():
+    try:
+        return {
+            "success": True,
+            "text_store": text_store.stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        print(f"Text store stats error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving text store stats: {str(e)}")
+
+@app.get("/extractor-stats")
+async def get_extractor_stats():
+    try:
+        return {
+            "success": True,
+            "router": extractor_router.stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        print(f"Extractor stats error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving extractor stats: {str(e)}")
+
+@app.post("/text-store/warm")
+async def warm_text_store(files: List[UploadFile] = File(...), max_pages: int = 10):
+    if len(files) > WARM_MAX_FILES:
+        raise HTTPException(status_code=400, detail=f"At most {WARM_MAX_FILES} files can be warmed per request")
+    results = []
+    for file in files:
+        if file.content_type not in ALLOWED_TYPES:
+            results.append({"file_name": file.filename, "status": "unsupported"})
+            continue
+        try:
+            upload = await upload_ingestor.ingest(file)
+        except UploadTooLarge:
+            results.append({"file_name": file.filename, "status": "too_large"})
+            continue
+        file_hash = upload.file_hash
+        if text_store.contains(file_hash, file.content_type, max_pages):
+            upload.close()
+            results.append({"file_name": file.filename, "file_hash": file_hash, "status": "cached"})
+            continue
+        try:
+            extracted = await extract_upload(upload, max_pages)
+            results.append({
+                "file_name": file.filename,
+                "file_hash": file_hash,
+                "status": "extracted",
+                "page_count": extracted.page_count,
+                "extractor": extracted.producer
+            })
+        except Exception as e:
+            print(f"Text store warm error for {file.filename}: {str(e)}")
+            results.append({"file_name": file.filename, "file_hash": file_hash, "status": "failed", "error": str(e)})
+        finally:
+            upload.close()
+    return {
+        "success": True,
+        "results": results,
+        "text_store": text_store.stats(),
+        "warmed_at": datetime.now().isoformat()
+    }
+
+@app.post("/text-store/evict")
+async def evict_text_store(data: Dict[str, Any]):
+    try:
+        if data.get("all"):
+            evicted = text_store.clear()
+        else:
+            evicted = text_store.evict(data.get("file_hashes", []))
+        if data.get("stale"):
+            evicted += text_store.evict_stale()
+        return {
+            "success": True,
+            "evicted": evicted,
+            "text_store": text_store.stats(),
+            "evicted_at": datetime.now().isoformat()
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"Text store evict error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error evicting text store entries: {str(e)}")
+
 @app.post("/debug-parsing")
-async def debug_resume_parsing(file: UploadFile = File(...)):
+async def debug_resume_parsing(file: UploadFile = File(...), max_pages: int = 10):
     try:
         allowed_types = [
             'application/pdf', 
@@ -316,39 +720,36 @@ async def debug_resume_parsing(file: UploadFile = File(...)):
                 status_code=400, 
                 detail="Only PDF and DOCX files are supported"
             )
-        content = await file.read()
-        file_extension = os.path.splitext(file.filename)[1]
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-            tmp_file.write(content)
-            tmp_file_path = tmp_file.name
         try:
-            resume_text = resume_parser.extract_text(tmp_file_path, file.content_type)
-            contact_info = resume_parser.extract_contact_info(resume_text)
-            skills = resume_parser.extract_skills(resume_text)
-            professional_summary = resume_parser.extract_professional_summary(resume_text)
-            os.unlink(tmp_file_path)
-            return {
-                "success": True,
-                "debug_info": {
-                    "file_name": file.filename,
-                    "file_size": len(content),
-                    "extracted_text": resume_text,
-                    "text_length": len(resume_text),
-                    "contact_extraction": contact_info,
-                    "skills_extraction": skills,
-                    "summary_extraction": professional_summary,
-                    "parsing_steps": {
-                        "1_text_extraction": "✓ Completed",
-                        "2_contact_parsing": "✓ Completed",
-                        "3_skills_parsing": "✓ Completed", 
-                        "4_summary_parsing": "✓ Completed"
-                    }
+            upload = await upload_ingestor.ingest(file)
+        except UploadTooLarge:
+            raise HTTPException(status_code=413, detail=FILE_TOO_LARGE)
+        with upload:
+            extracted = await extract_upload(upload, max_pages=max_pages)
+        resume_text = extracted.text
+        parsed = await worker_pool.run(debug_parse, resume_text)
+        return {
+            "success": True,
+            "debug_info": {
+                "file_name": file.filename,
+                "file_size": upload.size,
+                "extracted_text": resume_text,
+                "text_length": len(resume_text),
+                "extractor": extracted.producer,
+                "pages": [page.to_dict() for page in extracted.pages],
+                "contact_extraction": parsed["contact_info"],
+                "skills_extraction": parsed["skills"],
+                "summary_extraction": parsed["professional_summary"],
+                "parsing_steps": {
+                    "1_text_extraction": "✓ Completed",
+                    "2_contact_parsing": "✓ Completed",
+                    "3_skills_parsing": "✓ Completed", 
+                    "4_summary_parsing": "✓ Completed"
                 }
             }
-        except Exception as e:
-            if os.path.exists(tmp_file_path):
-                os.unlink(tmp_file_path)
-            raise e
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Debug parsing error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Debug parsing error: {str(e)}")
@@ -0,0 +1,35 @@
+import os
+import resource
+from typing import Optional
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+class MemoryLimitExceeded(Exception):
+    pass
+
+
+def current_rss() -> int:
+    try:
+        with open('/proc/self/statm', 'r') as handle:
+            return int(handle.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class MemoryGuard:
+    def __init__(self, limit_bytes: Optional[int]):
+        self.limit_bytes = limit_bytes
+        self.baseline = current_rss() if limit_bytes else 0
+        self.peak = 0
+
+    def check(self, context: str) -> None:
+        if not self.limit_bytes:
+            return
+        growth = current_rss() - self.baseline
+        self.peak = max(self.peak, growth)
+        if growth > self.limit_bytes:
+            raise MemoryLimitExceeded(
+                f"{context} used {growth // (1024 * 1024)}MB, over the per-document limit of "
+                f"{self.limit_bytes // (1024 * 1024)}MB"
+            )
@@ -55,6 +55,7 @@ class ResumeAnalysis(BaseModel):
     analysis_date: str
     experience_info: Optional[ExperienceInfo] = None
     education_info: Optional[EducationInfo] = None
+    skipped_stages: List[str] = Field(default_factory=list)
     
     class Config:
         json_schema_extra = {
@@ -150,6 +151,8 @@ class JobSearchRequest(BaseModel):
     remote_only: Optional[bool] = False
     salary_min: Optional[int] = Field(default=None, ge=0)
     salary_max: Optional[int] = Field(default=None, ge=0)
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: Optional[str] = None
     
     @validator('salary_max')
     def validate_salary_range(cls, v, values):
@@ -167,7 +170,8 @@ class JobSearchRequest(BaseModel):
                 "job_type": "Full-time",
                 "remote_only": False,
                 "salary_min": 80000,
-                "salary_max": 120000
+                "salary_max": 120000,
+                "limit": 20
             }
         }
 
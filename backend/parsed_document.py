@@ -0,0 +1,76 @@
+import unicodedata
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Union
+from pattern_registry import pattern_registry
+from section_index import SectionIndex, SectionSegmenter
+from text_normalizer import NormalizedText
+
+_HORIZONTAL_WHITESPACE = pattern_registry.register('document.horizontal_whitespace', r'[^\S\n]+')
+
+
+class ParsedDocument:
+    def __init__(self, text: str, normalized: Optional[NormalizedText] = None):
+        self.text = text
+        self.normalized = normalized
+        self._views: Dict[str, Any] = {}
+
+    @classmethod
+    def of(cls, document: Union[str, 'ParsedDocument']) -> 'ParsedDocument':
+        return document if isinstance(document, ParsedDocument) else cls(document)
+
+    @classmethod
+    def from_normalized(cls, normalized: NormalizedText) -> 'ParsedDocument':
+        return cls(normalized.text, normalized)
+
+    def source_offset(self, index: int) -> int:
+        # Spans found in the cleaned text map back to the raw extraction through the normalizer's anchors.
+        if self.normalized is None:
+            return index
+        return self.normalized.source_offset(index)
+
+    def view(self, name: str, factory: Callable[[], Any]) -> Any:
+        if name not in self._views:
+            self._views[name] = factory()
+        return self._views[name]
+
+    @property
+    def lower(self) -> str:
+        return self.view('lower', self.text.lower)
+
+    @property
+    def lines(self) -> List[str]:
+        return self.view('lines', lambda: self.text.split('\n'))
+
+    @property
+    def lower_lines(self) -> List[str]:
+        return self.view('lower_lines', lambda: [line.lower() for line in self.lines])
+
+    @property
+    def stripped_lines(self) -> List[str]:
+        return self.view('stripped_lines', lambda: [line.strip() for line in self.lines])
+
+    @property
+    def stripped_lower_text(self) -> str:
+        return self.view('stripped_lower_text', lambda: '\n'.join(self.stripped_lines).lower())
+
+    @property
+    def stripped_lower_lines(self) -> List[str]:
+        return self.view('stripped_lower_lines', lambda: self.stripped_lower_text.split('\n'))
+
+    @property
+    def normalized_lines(self) -> List[str]:
+        return self.view('normalized_lines', lambda: [
+            line.strip()
+            for line in _HORIZONTAL_WHITESPACE.sub(' ', unicodedata.normalize('NFKD', self.text)).split('\n')
+        ])
+
+    @property
+    def line_offsets(self) -> List[int]:
+        return self.view('line_offsets', lambda: list(accumulate((len(line) + 1 for line in self.lines[:-1]), initial=0)))
+
+    @property
+    def tokens(self) -> List[str]:
+        return self.view('tokens', self.text.split)
+
+    def sections(self, segmenter: SectionSegmenter) -> SectionIndex:
+        return self.view(f'sections.{segmenter.name}', lambda: segmenter.segment(self))
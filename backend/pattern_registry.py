@@ -0,0 +1,195 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
+
+
+class TrackedPattern:
+    def __init__(self, name: str, regex: Pattern, registry: 'PatternRegistry'):
+        self.name = name
+        self.regex = regex
+        self.pattern = regex.pattern
+        self.flags = regex.flags
+        self._registry = registry
+        self.calls = 0
+        self.hits = 0
+        self.total_time = 0.0
+
+    def _record(self, started: float, hit: bool) -> None:
+        self.calls += 1
+        if hit:
+            self.hits += 1
+        self.total_time += time.perf_counter() - started
+
+    def search(self, string: str, *args) -> Optional[re.Match]:
+        if not self._registry.enabled:
+            return self.regex.search(string, *args)
+        started = time.perf_counter()
+        result = self.regex.search(string, *args)
+        self._record(started, result is not None)
+        return result
+
+    def match(self, string: str, *args) -> Optional[re.Match]:
+        if not self._registry.enabled:
+            return self.regex.match(string, *args)
+        started = time.perf_counter()
+        result = self.regex.match(string, *args)
+        self._record(started, result is not None)
+        return result
+
+    def fullmatch(self, string: str, *args) -> Optional[re.Match]:
+        if not self._registry.enabled:
+            return self.regex.fullmatch(string, *args)
+        started = time.perf_counter()
+        result = self.regex.fullmatch(string, *args)
+        self._record(started, result is not None)
+        return result
+
+    def findall(self, string: str, *args) -> List[Any]:
+        if not self._registry.enabled:
+            return self.regex.findall(string, *args)
+        started = time.perf_counter()
+        result = self.regex.findall(string, *args)
+        self._record(started, bool(result))
+        return result
+
+    def finditer(self, string: str, *args) -> Iterator[re.Match]:
+        if not self._registry.enabled:
+            yield from self.regex.finditer(string, *args)
+            return
+        iterator = self.regex.finditer(string, *args)
+        elapsed = 0.0
+        hit = False
+        try:
+            while True:
+                started = time.perf_counter()
+                match = next(iterator, None)
+                elapsed += time.perf_counter() - started
+                if match is None:
+                    break
+                hit = True
+                yield match
+        finally:
+            self.calls += 1
+            if hit:
+                self.hits += 1
+            self.total_time += elapsed
+
+    def sub(self, repl: Any, string: str, count: int = 0) -> str:
+        if not self._registry.enabled:
+            return self.regex.sub(repl, string, count)
+        started = time.perf_counter()
+        result, replaced = self.regex.subn(repl, string, count)
+        self._record(started, replaced > 0)
+        return result
+
+    def reset_stats(self) -> None:
+        self.calls = 0
+        self.hits = 0
+        self.total_time = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'pattern': self.pattern,
+            'calls': self.calls,
+            'hits': self.hits,
+            'hit_rate': round(self.hits / self.calls, 4) if self.calls else 0.0,
+            'total_time_ms': round(self.total_time * 1000, 3),
+            'avg_time_us': round(self.total_time * 1_000_000 / self.calls, 3) if self.calls else 0.0
+        }
+
+
+class PatternRegistry:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._patterns: Dict[str, TrackedPattern] = {}
+        self._compiled: Dict[tuple, Pattern] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, pattern: str, flags: int = 0) -> TrackedPattern:
+        with self._lock:
+            existing = self._patterns.get(name)
+            if existing is not None:
+                if existing.regex is not self._compiled.get((pattern, flags)):
+                    raise ValueError(f"Pattern '{name}' is already registered with a different expression")
+                return existing
+            key = (pattern, flags)
+            if key not in self._compiled:
+                self._compiled[key] = re.compile(pattern, flags)
+            tracked = TrackedPattern(name, self._compiled[key], self)
+            self._patterns[name] = tracked
+            return tracked
+
+    def register_group(self, name: str, patterns: List[str], flags: int = 0) -> List[TrackedPattern]:
+        return [self.register(f'{name}[{i}]', pattern, flags) for i, pattern in enumerate(patterns)]
+
+    def get(self, name: str) -> TrackedPattern:
+        return self._patterns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._patterns
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def stats(self, sort_by: str = 'total_time_ms', limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        stats = [tracked.stats() for tracked in self._patterns.values()]
+        stats.sort(key=lambda entry: entry.get(sort_by, 0), reverse=True)
+        return stats[:limit] if limit else stats
+
+    def reset_stats(self) -> None:
+        for tracked in self._patterns.values():
+            tracked.reset_stats()
+
+    def drain_stats(self) -> Dict[str, Tuple[int, int, float]]:
+        """Counters accumulated since the last drain, keyed by pattern name; the counters are reset."""
+        deltas = {}
+        for name, tracked in self._patterns.items():
+            if tracked.calls:
+                deltas[name] = (tracked.calls, tracked.hits, tracked.total_time)
+                tracked.reset_stats()
+        return deltas
+
+    def merge_stats(self, deltas: Dict[str, Tuple[int, int, float]]) -> None:
+        for name, (calls, hits, total_time) in deltas.items():
+            tracked = self._patterns.get(name)
+            if tracked is not None:
+                tracked.calls += calls
+                tracked.hits += hits
+                tracked.total_time += total_time
+
+    def fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        for name in sorted(self._patterns):
+            tracked = self._patterns[name]
+            digest.update(f'{name}\0{tracked.flags}\0{tracked.pattern}\0'.encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+
+def trie_pattern(words: List[str], terminal: str = '') -> str:
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return _trie_node_pattern(trie, terminal)
+
+
+def _trie_node_pattern(node: Dict[str, Any], terminal: str) -> str:
+    branches = [
+        re.escape(char) + _trie_node_pattern(child, terminal)
+        for char, child in sorted(node.items()) if char
+    ]
+    if not branches:
+        return terminal
+    alternation = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        return '(?:' + alternation + '|' + terminal + ')'
+    return alternation
+
+
+pattern_registry = PatternRegistry(enabled=os.getenv('RESUME_PATTERN_STATS', '1') != '0')
@@ -1,13 +1,34 @@
 import PyPDF2
 import docx
 import re
-from typing import Optional, List, Dict, Any
+import time
+from typing import Optional, List, Dict, Any, Union, BinaryIO, Iterator, Sequence, Tuple
 import pdfplumber
 from io import BytesIO
 from intelligent_education_detector import IntelligentEducationDetector
+from skill_matcher import SkillMatcher
+from contact_extractor import ContactExtractor
+from section_index import SectionSegmenter
+from parsed_document import ParsedDocument
+from extracted_text import ExtractedPage, ExtractedText
+from docx_reader import DocxReader
+from text_normalizer import NormalizedText, TextNormalizer
+from memory_guard import MemoryGuard, MemoryLimitExceeded
+from extractor_router import PDF_EXTRACTORS, TEXT_OPERATORS, PdfProfile, is_good_text
+from pattern_registry import pattern_registry
+
+_WHITESPACE = pattern_registry.register('parser.whitespace', r'\s+')
+_NEWLINES = pattern_registry.register('parser.newlines', r'\n+')
+_BULLET = pattern_registry.register('parser.skills.bullet', r'^[•\-\*]\s*')
+_TIP = pattern_registry.register('parser.summary.tip', r'\(Tip:.*?\)', re.DOTALL)
+
+EXTRACTOR_VERSION = '3.0.0-extract.2'
+
+DocumentSource = Union[str, bytes, bytearray, memoryview, BinaryIO]
 
 class ImprovedResumeParser:
-    def __init__(self):
+    def __init__(self, document_memory_limit: Optional[int] = None):
+        self.document_memory_limit = document_memory_limit
         self.education_detector = IntelligentEducationDetector()
         self.skill_patterns = {
             'programming_languages': [
@@ -59,39 +80,45 @@ class ImprovedResumeParser:
                 'business analysis', 'data analysis', 'reporting', 'budgeting'
             ]
         }
-        self.name_patterns = [
-            r'^([A-Z][a-z]+ [A-Z][a-z]+(?:\s[A-Z][a-z]+)?)\s*$',
-            r'^([A-Z][a-z]+\s[A-Z]\.\s[A-Z][a-z]+)\s*$',
-            r'^([A-Z][A-Z\s]+[A-Z])\s*$',
-            r'Name:\s*([A-Z][a-z\s]+)',
-            r'RESUME OF\s+([A-Z][a-z\s]+)',
-            r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)(?:\s*[\n|])',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+)',
-        ]
-        self.phone_patterns = [
-            r'(\+\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,6})',
-            r'(\+\d{1,4}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,6})',
-            r'(\d{10,15})',
-            r'(\d{3,5}[-.\s]\d{3,4}[-.\s]\d{3,6})',
-            r'(\d{2,4}[-.\s]\d{3,4}[-.\s]\d{3,4}[-.\s]\d{2,4})',
-            r'(\(\d{2,4}\)[-.\s]?\d{3,4}[-.\s]?\d{3,6})',
-            r'(\d{2,4}[-.\s]?\(\d{2,4}\)[-.\s]?\d{3,6})',
-            r'(?:phone|mobile|tel|cell|contact)[:.]?\s*(\+?[\d\s\-\(\)\.]{8,20})',
-            r'(\d{4,5}\s\d{3}\s\d{3,4})',
-            r'(\d{2,3}\s\d{4}\s\d{4})',
-            r'(\d{3}\s\d{3}\s\d{4})',
-            r'(\d{2}[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2})',
-            r'(\d{3}[-.\s]\d{3}[-.\s]\d{2}[-.\s]\d{2})',
-            r'(\d{3}[-.\s]\d{4}[-.\s]\d{4})',
-            r'(\d{2}[-.\s]\d{4}[-.\s]\d{4})',
-            r'(\+91[-.\s]\d{5}[-.\s]\d{5})',
-            r'(\+44[-.\s]\d{4}[-.\s]\d{6})',
-            r'(\+33[-.\s]\d[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2}[-.\s]\d{2})',
-            r'(\+49[-.\s]\d{3}[-.\s]\d{3}[-.\s]\d{4})',
-            r'(\+86[-.\s]\d{3}[-.\s]\d{4}[-.\s]\d{4})',
-            r'(\+81[-.\s]\d{2}[-.\s]\d{4}[-.\s]\d{4})',
-            r'(\+7[-.\s]\d{3}[-.\s]\d{3}[-.\s]\d{2}[-.\s]\d{2})',
-        ]
+        self.skill_matcher = SkillMatcher(self.skill_patterns)
+        self.contact_extractor = ContactExtractor()
+        self.docx_reader = DocxReader()
+        self.text_normalizer = TextNormalizer()
+        self.degree_patterns = pattern_registry.register_group('parser.degree', [
+            r'(B\.?Tech\.?|Bachelor.*?Technology|BTech)',
+            r'(B\.?E\.?|Bachelor.*?Engineering|BE)',
+            r'(B\.?Sc\.?|Bachelor.*?Science|BSc)',
+            r'(B\.?A\.?|Bachelor.*?Arts|BA)',
+            r'(B\.?Com\.?|Bachelor.*?Commerce|BCom)',
+            r'(M\.?Tech\.?|Master.*?Technology|MTech)',
+            r'(M\.?Sc\.?|Master.*?Science|MSc)',
+            r'(M\.?A\.?|Master.*?Arts|MA)',
+            r'(MBA|Master.*?Business)',
+            r'(PhD|Ph\.?D\.?|Doctorate)',
+            r'(Diploma|Certificate)',
+        ], re.IGNORECASE)
+        self.field_patterns = pattern_registry.register_group('parser.field', [
+            r'B\.?Tech\.?\s+in\s+([^.\n,]+)',
+            r'Bachelor.*?in\s+([^.\n,]+)',
+            r'Master.*?in\s+([^.\n,]+)',
+            r'PhD.*?in\s+([^.\n,]+)',
+            r'(Computer Science.*?Engineering|CSE)',
+            r'(Computer Science)',
+            r'(Information Technology|IT)',
+            r'(Electronics.*?Communication|ECE)',
+            r'(Mechanical Engineering)',
+            r'(Civil Engineering)',
+            r'(Electrical Engineering)',
+            r'(Business Administration)',
+            r'(Data Science)',
+            r'(Artificial Intelligence)',
+        ], re.IGNORECASE)
+        self.year_patterns = pattern_registry.register_group('parser.year', [
+            r'(20\d{2})\s*[-–]\s*(20\d{2})',
+            r'(20\d{2})\s*[-–]\s*present',
+            r'graduating.*?(20\d{2})',
+            r'batch.*?(20\d{2})',
+        ], re.IGNORECASE)
         self.section_headers = {
             'summary': [
                 'professional summary', 'summary', 'profile', 'objective', 'career objective',
@@ -114,272 +141,238 @@ class ImprovedResumeParser:
                 'university', 'college', 'school'
             ]
         }
+        self.section_indicators = [
+            'education', 'experience', 'work', 'skills', 'objective', 'summary',
+            'employment', 'career', 'background', 'qualifications', 'achievements',
+            'projects', 'certifications', 'awards', 'interests', 'hobbies',
+            'references', 'leadership', 'volunteer', 'activities'
+        ]
+        self.section_segmenter = SectionSegmenter(
+            'parser.section', self.section_headers, self.section_indicators,
+            header_slack=15, colon_headers=True
+        )
 
-    def extract_text(self, file_path: str, content_type: str, max_pages: int = 10) -> str:
+    def extract_text(self, source: DocumentSource, content_type: str, max_pages: int = 10) -> str:
+        return self.extract_document(source, content_type, max_pages).text
+
+    def extract_document(self, source: DocumentSource, content_type: str, max_pages: int = 10,
+                         order: Sequence[str] = PDF_EXTRACTORS,
+                         attempts: Optional[List[Tuple[str, float, bool]]] = None) -> ExtractedText:
         try:
             if content_type == 'application/pdf':
-                return self._extract_from_pdf(file_path, max_pages)
+                return self._extract_from_pdf(source, max_pages, order, attempts)
             elif content_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-                return self._extract_from_docx(file_path)
+                return self._extract_from_docx(source)
             else:
                 raise ValueError("Unsupported file type")
+        except MemoryLimitExceeded:
+            raise
         except Exception as e:
             raise Exception(f"Error extracting text: {str(e)}")
 
-    def _extract_from_pdf(self, file_path: str, max_pages: int = 10) -> str:
-        text = ""
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                pages_to_process = min(len(pdf.pages), max_pages)
-                for i in range(pages_to_process):
-                    page = pdf.pages[i]
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                    tables = page.extract_tables()
-                    for table in tables:
-                        for row in table:
-                            if row:
-                                text += " ".join([cell for cell in row if cell]) + "\n"
-            if text.strip():
-                return self._clean_text(text)
-        except Exception as e:
-            print(f"pdfplumber failed: {e}")
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                pages_to_process = min(len(pdf_reader.pages), max_pages)
-                for i in range(pages_to_process):
-                    page = pdf_reader.pages[i]
-                    text += page.extract_text() + "\n"
-            if text.strip():
-                return self._clean_text(text)
-        except Exception as e:
-            print(f"PyPDF2 failed: {e}")
+    def _open_source(self, source: DocumentSource) -> Union[str, BinaryIO]:
+        if isinstance(source, str):
+            return source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return BytesIO(source)
+        source.seek(0)
+        return source
+
+    def _extract_from_pdf(self, source: DocumentSource, max_pages: int = 10,
+                          order: Sequence[str] = PDF_EXTRACTORS,
+                          attempts: Optional[List[Tuple[str, float, bool]]] = None) -> ExtractedText:
+        extractors = {'pdfplumber': self._extract_with_pdfplumber, 'pypdf2': self._extract_with_pypdf2}
+        fallback = None
+        for extractor in order:
+            started = time.perf_counter()
+            try:
+                extracted = extractors[extractor](source, max_pages)
+            except MemoryLimitExceeded:
+                raise
+            except Exception as e:
+                print(f"{extractor} failed: {e}")
+                extracted = None
+            good = extracted is not None and is_good_text(extracted.text)
+            if attempts is not None:
+                attempts.append((extractor, time.perf_counter() - started, good))
+            if good:
+                return extracted
+            if fallback is None and extracted is not None and extracted.text:
+                fallback = extracted
+        if fallback is not None:
+            return fallback
         raise Exception("Failed to extract text from PDF using all available methods")
 
-    def _extract_from_docx(self, file_path: str) -> str:
-        try:
-            doc = docx.Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
-            return self._clean_text(text)
-        except Exception as e:
-            raise Exception(f"Error reading DOCX file: {str(e)}")
+    def _extract_with_pdfplumber(self, source: DocumentSource, max_pages: int) -> ExtractedText:
+        return self.assemble_pdf_pages(list(self.iter_pdf_pages(source, max_pages)))
 
-    def _clean_text(self, text: str) -> str:
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r'[ \t]+', ' ', text)
-        text = re.sub(r'[^\w\s@.,()|\-/+:]', ' ', text)
-        return text.strip()
+    def iter_pdf_pages(self, source: DocumentSource, max_pages: int = 10,
+                       page_numbers: Optional[Sequence[int]] = None) -> Iterator[ExtractedPage]:
+        guard = MemoryGuard(self.document_memory_limit)
+        with pdfplumber.open(self._open_source(source)) as pdf:
+            if page_numbers is None:
+                page_numbers = range(1, min(len(pdf.pages), max_pages) + 1)
+            for number in page_numbers:
+                page = pdf.pages[number - 1]
+                try:
+                    extracted = self._extract_pdf_page(page, number)
+                finally:
+                    release = getattr(page, 'close', None) or page.flush_cache
+                    release()
+                guard.check(f"PDF page {number}")
+                yield extracted
 
-    def extract_contact_info(self, text: str) -> Dict[str, Optional[str]]:
-        name = self._extract_name_improved(text)
-        email = self._extract_email_improved(text)
-        phone = self._extract_phone_improved(text)
-        location = self._extract_location_improved(text)
-        return {
-            'name': name,
-            'email': email,
-            'phone': phone,
-            'location': location
-        }
+    def _extract_with_pypdf2(self, source: DocumentSource, max_pages: int) -> ExtractedText:
+        pages = []
+        text = ""
+        guard = MemoryGuard(self.document_memory_limit)
+        pdf_reader = PyPDF2.PdfReader(self._open_source(source))
+        pages_to_process = min(len(pdf_reader.pages), max_pages)
+        for i in range(pages_to_process):
+            page_text = pdf_reader.pages[i].extract_text()
+            text += page_text + "\n"
+            pages.append(ExtractedPage(i + 1, page_text, []))
+            guard.check(f"PDF page {i + 1}")
+        return ExtractedText(self._clean_text(text) if text.strip() else '', pages, 'pypdf2')
 
-    def _extract_name_improved(self, text: str) -> Optional[str]:
-        lines = text.split('\n')
-        for line in lines[:10]:
-            line = line.strip()
-            if not line or len(line) < 3:
-                continue
-            skip_indicators = ['page', 'tip:', 'address', '@', 'phone', 'mobile', 'email']
-            if any(indicator in line.lower() for indicator in skip_indicators):
-                continue
-            words = line.split()
-            if len(words) >= 2 and len(words) <= 4:
-                if all(word[0].isupper() and word[1:].islower() for word in words if len(word) > 1):
-                    potential_name = ' '.join(words)
-                    if self._validate_name_improved(potential_name):
-                        return potential_name
-        for pattern in self.name_patterns:
-            for line in lines[:8]:
-                match = re.search(pattern, line)
-                if match:
-                    potential_name = match.group(1).strip()
-                    if self._validate_name_improved(potential_name):
-                        return potential_name
-        return None
+    def pdf_profile(self, source: DocumentSource, sample_pages: int = 10) -> PdfProfile:
+        pdf_reader = PyPDF2.PdfReader(self._open_source(source))
+        encrypted = pdf_reader.is_encrypted
+        # decrypt() raises when PyPDF2 has no backend for the cipher (AES without a crypto
+        # package); that is not a password, so the error reaches the caller, which then
+        # extracts without a profile and lets pdfplumber try.
+        if encrypted and not pdf_reader.decrypt(''):
+            return PdfProfile('', '', 0, 0, 0, encrypted=True, decrypted=False)
+        metadata = pdf_reader.metadata or {}
+        counts = {'fonts': 0, 'images': 0, 'text_operators': 0}
+        for page in pdf_reader.pages[:sample_pages]:
+            contents = page.get_contents()
+            if contents is not None:
+                counts['text_operators'] += len(TEXT_OPERATORS.findall(contents.get_data()))
+            self._profile_resources(page.get('/Resources'), counts, depth=0)
+        return PdfProfile(
+            producer=str(metadata.get('/Producer') or ''),
+            creator=str(metadata.get('/Creator') or ''),
+            page_count=len(pdf_reader.pages),
+            font_count=counts['fonts'],
+            image_count=counts['images'],
+            encrypted=encrypted,
+            text_operator_count=counts['text_operators']
+        )
 
-    def _validate_name_improved(self, name: str) -> bool:
-        if not name or len(name) < 3:
-            return False
-        exclusions = [
-            'resume', 'curriculum vitae', 'cv', 'email', 'phone', 'address',
-            'page', 'tip', 'career', 'objective', 'education', 'experience',
-            'skills', 'work', 'contact', 'details', 'information'
-        ]
-        if any(exclusion in name.lower() for exclusion in exclusions):
-            return False
-        words = name.split()
-        if len(words) < 2 or len(words) > 4:
-            return False
-        letter_ratio = sum(c.isalpha() for c in name) / len(name)
-        if letter_ratio < 0.7:
-            return False
-        return True
+    def _profile_resources(self, resources: Any, counts: Dict[str, int], depth: int) -> None:
+        if resources is None or depth > 3:
+            return
+        resources = resources.get_object()
+        fonts = resources.get('/Font')
+        if fonts is not None:
+            counts['fonts'] += len(fonts.get_object())
+        xobjects = resources.get('/XObject')
+        if xobjects is None:
+            return
+        for xobject in xobjects.get_object().values():
+            xobject = xobject.get_object()
+            subtype = xobject.get('/Subtype')
+            if subtype == '/Image':
+                counts['images'] += 1
+            elif subtype == '/Form':
+                counts['text_operators'] += len(TEXT_OPERATORS.findall(xobject.get_data()))
+                self._profile_resources(xobject.get('/Resources'), counts, depth + 1)
 
-    def _extract_phone_improved(self, text: str) -> Optional[str]:
-        for pattern in self.phone_patterns:
-            matches = re.findall(pattern, text)
-            for phone in matches:
-                cleaned = self._clean_phone_improved(phone)
-                if cleaned:
-                    return cleaned
-        return None
+    def extract_pdf_pages(self, source: DocumentSource, page_numbers: List[int]) -> List[ExtractedPage]:
+        return list(self.iter_pdf_pages(source, page_numbers=page_numbers))
 
-    def _clean_phone_improved(self, phone: str) -> Optional[str]:
-        if not phone:
-            return None
-        digits_only = re.sub(r'[^\d+]', '', phone)
-        digit_count = len(digits_only.replace('+', ''))
-        if digit_count < 7 or digit_count > 15:
-            return None
-        cleaned_phone = phone.strip()
-        cleaned_phone = re.sub(r'\s+', ' ', cleaned_phone)
-        cleaned_phone = re.sub(r'[-.\s]{2,}', '-', cleaned_phone)
-        if cleaned_phone.startswith('+'):
-            return self._format_international_phone(cleaned_phone)
-        elif digit_count >= 10:
-            return self._format_domestic_phone(cleaned_phone, digit_count)
-        else:
-            return cleaned_phone
+    def _extract_pdf_page(self, page: Any, number: int) -> ExtractedPage:
+        page_text = page.extract_text() or ''
+        tables = []
+        if self._has_table_grid(page):
+            tables = [[[cell or '' for cell in row] for row in table if row] for table in page.extract_tables()]
+        return ExtractedPage(number, page_text, tables)
 
-    def _format_international_phone(self, phone: str) -> str:
-        digits = re.sub(r'[^\d]', '', phone)
-        if len(digits) == 11 and digits.startswith('1'):
-            return f"+1 {digits[1:4]} {digits[4:7]} {digits[7:]}"
-        elif len(digits) == 12 and digits.startswith('61'):
-            return f"+61 {digits[2]} {digits[3:7]} {digits[7:]}"
-        elif len(digits) == 12 and digits.startswith('44'):
-            return f"+44 {digits[2:6]} {digits[6:]}"
-        elif len(digits) == 12 and digits.startswith('91'):
-            return f"+91 {digits[2:7]} {digits[7:]}"
-        elif len(digits) == 13 and digits.startswith('33'):
-            return f"+33 {digits[2]} {digits[3:5]} {digits[5:7]} {digits[7:9]} {digits[9:]}"
-        elif len(digits) == 12 and digits.startswith('49'):
-            return f"+49 {digits[2:5]} {digits[5:8]} {digits[8:]}"
-        elif len(digits) == 13 and digits.startswith('86'):
-            return f"+86 {digits[2:5]} {digits[5:9]} {digits[9:]}"
-        elif len(digits) == 12 and digits.startswith('81'):
-            return f"+81 {digits[2:4]} {digits[4:8]} {digits[8:]}"
-        else:
-            return phone
+    def _has_table_grid(self, page: Any) -> bool:
+        if not page.lines and not page.rects:
+            return False
+        horizontal = vertical = 0
+        for edge in page.edges:
+            if edge['orientation'] == 'h':
+                horizontal += 1
+            else:
+                vertical += 1
+            if horizontal >= 2 and vertical >= 2:
+                return True
+        return False
 
-    def _format_domestic_phone(self, phone: str, digit_count: int) -> str:
-        digits = re.sub(r'[^\d]', '', phone)
-        if digit_count == 10:
-            return f"{digits[:3]} {digits[3:6]} {digits[6:]}"
-        elif digit_count == 11:
-            return f"{digits[0]} {digits[1:4]} {digits[4:7]} {digits[7:]}"
-        elif digit_count == 9:
-            return f"{digits[:3]} {digits[3:6]} {digits[6:]}"
-        elif digit_count == 8:
-            return f"{digits[:4]} {digits[4:]}"
-        else:
-            return phone.strip()
+    def page_raw_text(self, page: ExtractedPage) -> str:
+        parts = [page.text + "\n"] if page.text else []
+        for table in page.tables:
+            for row in table:
+                parts.append(" ".join([cell for cell in row if cell]) + "\n")
+        return "".join(parts)
 
-    def _extract_email_improved(self, text: str) -> Optional[str]:
-        email_patterns = [
-            r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b',
-            r'Email:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-            r'E-mail:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-            r'Contact:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-        ]
-        for pattern in email_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for email in matches:
-                if self._validate_email_improved(email):
-                    return email.lower()
-        return None
+    def assemble_pdf_pages(self, pages: List[ExtractedPage]) -> ExtractedText:
+        pages = sorted(pages, key=lambda page: page.number)
+        text = "".join(self.page_raw_text(page) for page in pages)
+        return ExtractedText(self._clean_text(text) if text.strip() else '', pages, 'pdfplumber')
 
-    def _validate_email_improved(self, email: str) -> bool:
-        if not email or '@' not in email:
-            return False
-        parts = email.split('@')
-        if len(parts) != 2:
-            return False
-        local, domain = parts
-        if not local or not domain or '.' not in domain:
-            return False
-        if len(local) < 1 or len(domain) < 3:
-            return False
-        return True
+    def _extract_from_docx(self, source: DocumentSource) -> ExtractedText:
+        try:
+            content = self.docx_reader.read(self._open_source(source))
+            return ExtractedText(
+                self._clean_text(content.text),
+                [ExtractedPage(1, content.paragraph_text, content.tables)],
+                'docx-stream'
+            )
+        except Exception as e:
+            print(f"Streaming DOCX read failed: {e}")
+        try:
+            doc = docx.Document(self._open_source(source))
+            parts = [paragraph.text + "\n" for paragraph in doc.paragraphs]
+            page_text = "".join(parts)
+            tables = []
+            for table in doc.tables:
+                rows = []
+                for row in table.rows:
+                    cells = [cell.text for cell in row.cells]
+                    parts.append("".join(cell + " " for cell in cells) + "\n")
+                    rows.append(cells)
+                tables.append(rows)
+            return ExtractedText(self._clean_text("".join(parts)), [ExtractedPage(1, page_text, tables)], 'python-docx')
+        except Exception as e:
+            raise Exception(f"Error reading DOCX file: {str(e)}")
 
-    def _extract_location_improved(self, text: str) -> Optional[str]:
-        location_patterns = [
-            r'([A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+,\s*\d{4})',
-            r'([A-Z][a-z]+,\s*[A-Z]{2,3}(?:\s+\d{4,5})?)',
-            r'([A-Z][a-z]+,\s*[A-Z][a-z]+)',
-            r'(\d+\s+[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+)',
-            r'Location:\s*([A-Z][a-zA-Z\s,.-]+)',
-            r'Address:\s*([A-Z][a-zA-Z\s,.-]+)',
-            r'Based in:\s*([A-Z][a-zA-Z\s,.-]+)',
-        ]
-        lines = text.split('\n')
-        for line in lines[:5]:
-            for pattern in location_patterns:
-                matches = re.findall(pattern, line)
-                for location in matches:
-                    if self._validate_location_improved(location):
-                        return location.strip()
-        return None
+    def _clean_text(self, text: str) -> str:
+        return self.text_normalizer.normalize(text).text
 
-    def _validate_location_improved(self, location: str) -> bool:
-        if not location or len(location) < 3:
-            return False
-        if len(location) > 100:
-            return False
-        location_lower = location.lower()
-        exclude_words = ['email', 'phone', 'mobile', 'resume', 'page']
-        if any(word in location_lower for word in exclude_words):
-            return False
-        return True
+    def normalize_text(self, text: str) -> NormalizedText:
+        return self.text_normalizer.normalize(text)
 
-    def extract_skills(self, text: str) -> List[str]:
-        skills = set()
-        text_lower = text.lower()
-        for category, skill_list in self.skill_patterns.items():
-            for skill in skill_list:
-                if f' {skill.lower()} ' in f' {text_lower} ':
-                    skills.add(skill.title())
-                elif re.search(r'\b' + re.escape(skill.lower()) + r'\b', text_lower):
-                    skills.add(skill.title())
-        skills_section = self._extract_section(text, 'skills')
+    def extract_contact_info(self, text: Union[str, ParsedDocument]) -> Dict[str, Optional[str]]:
+        return self.contact_extractor.extract(text)
+
+    def extract_skills(self, text: Union[str, ParsedDocument]) -> List[str]:
+        document = ParsedDocument.of(text)
+        skills = {
+            skill.title()
+            for skill in self.skill_matcher.find_skills(document.lower, space_delimited=True)
+        }
+        skills_section = self._extract_section(document, 'skills')
         if skills_section:
             additional_skills = self._parse_skills_from_section(skills_section)
             skills.update(additional_skills)
         return list(skills)[:25]
 
     def _parse_skills_from_section(self, section: str) -> set:
-        skills = set()
-        lines = section.split('\n')
-        for line in lines:
+        lines = []
+        for line in section.split('\n'):
             if 'tip:' in line.lower():
                 continue
-            line = re.sub(r'^[•\-\*]\s*', '', line.strip())
-            for category, skill_list in self.skill_patterns.items():
-                for skill in skill_list:
-                    if re.search(r'\b' + re.escape(skill.lower()) + r'\b', line.lower()):
-                        skills.add(skill.title())
-        return skills
+            lines.append(_BULLET.sub('', line.strip()))
+        section_lower = '\n'.join(lines).lower()
+        return {skill.title() for skill in self.skill_matcher.find_skills(section_lower)}
 
-    def extract_education_info(self, text: str) -> Dict[str, Any]:
-        education_details = self.education_detector.detect_with_details(text)
+    def extract_education_info(self, text: Union[str, ParsedDocument]) -> Dict[str, Any]:
+        document = ParsedDocument.of(text)
+        education_details = self.education_detector.detect_with_details(document)
         education_info = {
             'institutions': [inst['name'] for inst in education_details['institutions']],
             'best_institution': education_details['best_match'],
@@ -389,56 +382,20 @@ class ImprovedResumeParser:
             'detection_confidence': education_details['institutions'][0]['confidence'] if education_details['institutions'] else 0,
             'context_analysis': education_details['analysis']
         }
-        degree_patterns = [
-            r'(B\.?Tech\.?|Bachelor.*?Technology|BTech)',
-            r'(B\.?E\.?|Bachelor.*?Engineering|BE)',
-            r'(B\.?Sc\.?|Bachelor.*?Science|BSc)',
-            r'(B\.?A\.?|Bachelor.*?Arts|BA)',
-            r'(B\.?Com\.?|Bachelor.*?Commerce|BCom)',
-            r'(M\.?Tech\.?|Master.*?Technology|MTech)',
-            r'(M\.?Sc\.?|Master.*?Science|MSc)',
-            r'(M\.?A\.?|Master.*?Arts|MA)',
-            r'(MBA|Master.*?Business)',
-            r'(PhD|Ph\.?D\.?|Doctorate)',
-            r'(Diploma|Certificate)',
-        ]
-        field_patterns = [
-            r'B\.?Tech\.?\s+in\s+([^.\n,]+)',
-            r'Bachelor.*?in\s+([^.\n,]+)',
-            r'Master.*?in\s+([^.\n,]+)',
-            r'PhD.*?in\s+([^.\n,]+)',
-            r'(Computer Science.*?Engineering|CSE)',
-            r'(Computer Science)',
-            r'(Information Technology|IT)',
-            r'(Electronics.*?Communication|ECE)',
-            r'(Mechanical Engineering)',
-            r'(Civil Engineering)',
-            r'(Electrical Engineering)',
-            r'(Business Administration)',
-            r'(Data Science)',
-            r'(Artificial Intelligence)',
-        ]
-        year_patterns = [
-            r'(20\d{2})\s*[-–]\s*(20\d{2})',
-            r'(20\d{2})\s*[-–]\s*present',
-            r'graduating.*?(20\d{2})',
-            r'batch.*?(20\d{2})',
-        ]
-        lines = text.split('\n')
-        for line in lines:
-            for pattern in degree_patterns:
-                matches = re.findall(pattern, line, re.IGNORECASE)
+        for line in document.lines:
+            for pattern in self.degree_patterns:
+                matches = pattern.findall(line)
                 for match in matches:
                     if match not in education_info['degrees']:
                         education_info['degrees'].append(match)
-            for pattern in field_patterns:
-                matches = re.findall(pattern, line, re.IGNORECASE)
+            for pattern in self.field_patterns:
+                matches = pattern.findall(line)
                 for match in matches:
                     if len(match) > 3 and match not in education_info['fields']:
-                        field_clean = re.sub(r'\s+', ' ', match).strip()
+                        field_clean = _WHITESPACE.sub(' ', match).strip()
                         education_info['fields'].append(field_clean)
-            for pattern in year_patterns:
-                matches = re.findall(pattern, line, re.IGNORECASE)
+            for pattern in self.year_patterns:
+                matches = pattern.findall(line)
                 for match in matches:
                     if isinstance(match, tuple):
                         for year in match:
@@ -450,18 +407,19 @@ class ImprovedResumeParser:
                             education_info['graduation_years'].append(match)
         return education_info
 
-    def extract_professional_summary(self, text: str) -> Optional[str]:
-        summary_section = self._extract_section(text, 'summary')
+    def extract_professional_summary(self, text: Union[str, ParsedDocument]) -> Optional[str]:
+        document = ParsedDocument.of(text)
+        summary_section = self._extract_section(document, 'summary')
         if summary_section:
-            summary = re.sub(r'\n+', ' ', summary_section).strip()
-            summary = re.sub(r'\(Tip:.*?\)', '', summary, flags=re.DOTALL)
+            summary = _NEWLINES.sub(' ', summary_section).strip()
+            summary = _TIP.sub('', summary)
             summary = summary.strip()
             if 50 < len(summary) < 1000:
                 return summary
-        paragraphs = text.split('\n\n')
+        paragraphs = document.text.split('\n\n')
         for paragraph in paragraphs[1:4]:
             clean_para = paragraph.strip().replace('\n', ' ')
-            clean_para = re.sub(r'\(Tip:.*?\)', '', clean_para, flags=re.DOTALL)
+            clean_para = _TIP.sub('', clean_para)
             clean_para = clean_para.strip()
             objective_keywords = ['seeking', 'looking', 'aim', 'objective', 'goal', 'enthusiast']
             if (len(clean_para) > 50 and 
@@ -469,42 +427,12 @@ class ImprovedResumeParser:
                 return clean_para[:500]
         return "Professional summary not found in resume."
 
-    def _extract_section(self, text: str, section_type: str) -> Optional[str]:
+    def _extract_section(self, document: ParsedDocument, section_type: str) -> Optional[str]:
         if section_type not in self.section_headers:
             return None
-        headers = self.section_headers[section_type]
-        text_lines = text.split('\n')
-        for i, line in enumerate(text_lines):
-            line_lower = line.lower().strip()
-            for header in headers:
-                if (line_lower == header or 
-                    line_lower.startswith(header + ':') or
-                    header in line_lower and len(line_lower) < len(header) + 15):
-                    section_content = []
-                    for j in range(i + 1, len(text_lines)):
-                        next_line = text_lines[j].strip()
-                        if self._is_section_header(next_line.lower()):
-                            break
-                        if next_line:
-                            section_content.append(next_line)
-                        if len(section_content) > 25:
-                            break
-                    if section_content:
-                        return '\n'.join(section_content)
+        section_index = document.sections(self.section_segmenter)
+        for span in section_index.spans(section_type):
+            section_content = section_index.content_lines(span, max_lines=26)
+            if section_content:
+                return '\n'.join(section_content)
         return None
-
-    def _is_section_header(self, line: str) -> bool:
-        section_indicators = [
-            'education', 'experience', 'work', 'skills', 'objective', 'summary',
-            'employment', 'career', 'background', 'qualifications', 'achievements',
-            'projects', 'certifications', 'awards', 'interests', 'hobbies',
-            'references', 'leadership', 'volunteer', 'activities'
-        ]
-        line_clean = line.strip().lower()
-        for indicator in section_indicators:
-            if (line_clean == indicator or 
-                line_clean.startswith(indicator + ':') or
-                line_clean.startswith(indicator + ' ') or
-                line_clean.endswith(indicator)):
-                return True
-        return False
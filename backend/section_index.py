@@ -0,0 +1,129 @@
+from typing import Dict, List, NamedTuple, Optional
+from pattern_registry import pattern_registry, trie_pattern, TrackedPattern
+
+
+class SectionSpan(NamedTuple):
+    section: str
+    header_line: int
+    start: int
+    end: int
+    confidence: float
+
+
+class SectionIndex:
+    def __init__(self, lines: List[str], lowered: List[str], boundaries: List[bool],
+                 sections: Dict[str, List[SectionSpan]]):
+        self.lines = lines
+        self.lowered = lowered
+        self.boundaries = boundaries
+        self.sections = sections
+
+    def spans(self, section: str) -> List[SectionSpan]:
+        return self.sections.get(section, [])
+
+    def first(self, section: str) -> Optional[SectionSpan]:
+        spans = self.spans(section)
+        return spans[0] if spans else None
+
+    def content_lines(self, span: SectionSpan, window: Optional[int] = None, max_lines: Optional[int] = None,
+                      skip_prefix: Optional[str] = None, skip_prefixed_boundaries: bool = False) -> List[str]:
+        stop = len(self.lines) if window is None else min(span.header_line + window, len(self.lines))
+        content = []
+        for index in range(span.start, stop):
+            skipped = skip_prefix is not None and self.lowered[index].startswith(skip_prefix)
+            if skipped and skip_prefixed_boundaries:
+                continue
+            if self.boundaries[index]:
+                break
+            if self.lines[index] and not skipped:
+                content.append(self.lines[index])
+            if max_lines is not None and len(content) >= max_lines:
+                break
+        return content
+
+    def section_map(self) -> Dict[str, List[Dict[str, float]]]:
+        return {
+            section: [
+                {'header_line': span.header_line, 'start': span.start, 'end': span.end, 'confidence': span.confidence}
+                for span in spans
+            ]
+            for section, spans in self.sections.items() if spans
+        }
+
+
+class SectionSegmenter:
+    def __init__(self, name: str, section_headers: Dict[str, List[str]], boundary_words: List[str],
+                 header_slack: int, colon_headers: bool = False, boundary_substring: bool = False):
+        self.name = name
+        self.section_headers = section_headers
+        self.header_slack = header_slack
+        self.colon_headers = colon_headers
+        self.boundary_substring = boundary_substring
+        self._header_sets = {section: set(headers) for section, headers in section_headers.items()}
+        self._headers_by_length = {
+            section: sorted(set(headers), key=len, reverse=True) for section, headers in section_headers.items()
+        }
+        self._max_header_length = max(len(header) for headers in section_headers.values() for header in headers)
+        self._header_candidate_pattern = pattern_registry.register(
+            f'{name}.header_candidate',
+            r'\n|' + trie_pattern([header for headers in section_headers.values() for header in headers]) + r'[^\n]*'
+        )
+        if boundary_substring:
+            self._boundary_pattern = pattern_registry.register(
+                f'{name}.boundary', r'\n|' + trie_pattern(boundary_words) + r'[^\n]*'
+            )
+        else:
+            self._boundary_words = set(boundary_words)
+            self._boundary_prefixes = tuple(word + ':' for word in boundary_words) + tuple(word + ' ' for word in boundary_words)
+            self._boundary_suffixes = tuple(boundary_words)
+
+    def segment(self, document: 'ParsedDocument') -> SectionIndex:
+        lines = document.stripped_lines
+        lowered_text = document.stripped_lower_text
+        lowered = document.stripped_lower_lines
+        if self.boundary_substring:
+            boundaries = [False] * len(lines)
+            for line_number in self._matching_lines(self._boundary_pattern, lowered_text):
+                boundaries[line_number] = True
+        else:
+            boundaries = [
+                line in self._boundary_words or line.startswith(self._boundary_prefixes) or line.endswith(self._boundary_suffixes)
+                for line in lowered
+            ]
+        next_boundary = [len(lines)] * (len(lines) + 1)
+        for line_number in range(len(lines) - 1, -1, -1):
+            next_boundary[line_number] = line_number if boundaries[line_number] else next_boundary[line_number + 1]
+        sections: Dict[str, List[SectionSpan]] = {section: [] for section in self.section_headers}
+        for line_number in self._matching_lines(self._header_candidate_pattern, lowered_text):
+            line = lowered[line_number]
+            if len(line) >= self._max_header_length + self.header_slack and not (self.colon_headers and ':' in line):
+                continue
+            for section in self.section_headers:
+                confidence = self._header_confidence(section, line)
+                if confidence:
+                    sections[section].append(
+                        SectionSpan(section, line_number, line_number + 1, next_boundary[line_number + 1], confidence)
+                    )
+        return SectionIndex(lines, lowered, boundaries, sections)
+
+    def _matching_lines(self, pattern: TrackedPattern, text: str) -> List[int]:
+        line_number = 0
+        matched = []
+        for match in pattern.findall(text):
+            if match == '\n':
+                line_number += 1
+            else:
+                matched.append(line_number)
+        return matched
+
+    def _header_confidence(self, section: str, line: str) -> float:
+        if line in self._header_sets[section]:
+            return 1.0
+        if self.colon_headers and ':' in line and line.split(':', 1)[0] in self._header_sets[section]:
+            return 0.9
+        for header in self._headers_by_length[section]:
+            if len(line) >= len(header) + self.header_slack:
+                break
+            if header in line:
+                return round(len(header) / len(line), 2)
+        return 0.0
@@ -0,0 +1,67 @@
+from typing import Dict, Tuple
+
+SKILL_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'javascript': ('js', 'ecmascript'),
+    'typescript': ('ts',),
+    'node.js': ('nodejs', 'node js', 'node'),
+    'vue.js': ('vue', 'vuejs', 'vue js'),
+    'react': ('react.js', 'reactjs', 'react js'),
+    'angular': ('angular.js', 'angularjs'),
+    'express': ('express.js', 'expressjs'),
+    'next.js': ('nextjs',),
+    'nuxt.js': ('nuxtjs',),
+    'ember.js': ('emberjs', 'ember'),
+    'backbone.js': ('backbonejs', 'backbone'),
+    'react native': ('react-native',),
+    'c++': ('cpp',),
+    'c#': ('csharp', 'c sharp'),
+    'go': ('golang',),
+    'objective-c': ('objective c', 'objc'),
+    'vb.net': ('vb .net', 'visual basic .net'),
+    'postgresql': ('postgres', 'psql'),
+    'mongodb': ('mongo',),
+    'sql server': ('mssql', 'ms sql server', 'microsoft sql server'),
+    'elasticsearch': ('elastic search',),
+    'kubernetes': ('k8s',),
+    'aws': ('amazon web services',),
+    'gcp': ('google cloud', 'google cloud platform'),
+    'azure': ('microsoft azure',),
+    'github actions': ('gh actions',),
+    'gitlab ci': ('gitlab ci/cd', 'gitlab-ci'),
+    'machine learning': ('ml',),
+    'deep learning': ('dl',),
+    'scikit-learn': ('sklearn', 'scikit learn'),
+    'power bi': ('powerbi',),
+    'vs code': ('vscode', 'visual studio code'),
+    'adobe xd': ('xd',),
+    'material-ui': ('material ui', 'mui'),
+    'styled-components': ('styled components',),
+    'tailwind': ('tailwind css', 'tailwindcss'),
+}
+
+
+def normalize_skill(name: str) -> str:
+    return ' '.join(name.lower().split())
+
+
+class SkillCatalog:
+    """Maps skill names to canonical skills.
+
+    Names are lowercased and whitespace-collapsed, then folded through the
+    alias table, so "NodeJS" and "node.js" share one canonical skill. The job
+    store assigns each canonical skill its integer id; matching is exact on
+    ids, so "c" no longer matches "css".
+    """
+
+    def __init__(self, aliases: Dict[str, Tuple[str, ...]] = SKILL_ALIASES):
+        self._canonical: Dict[str, str] = {}
+        for canonical, names in aliases.items():
+            for name in (canonical,) + names:
+                self._canonical[normalize_skill(name)] = normalize_skill(canonical)
+
+    def canonical(self, name: str) -> str:
+        normalized = normalize_skill(name)
+        return self._canonical.get(normalized, normalized)
+
+
+skill_catalog = SkillCatalog()
@@ -0,0 +1,53 @@
+import re
+from typing import List, Dict, Set, NamedTuple
+from pattern_registry import trie_pattern
+
+
+class SkillOccurrence(NamedTuple):
+    skill: str
+    category: str
+    start: int
+
+
+class SkillMatcher:
+    def __init__(self, skill_categories: Dict[str, List[str]]):
+        self.skill_categories: Dict[str, List[str]] = {}
+        for category, skill_list in skill_categories.items():
+            for skill in skill_list:
+                categories = self.skill_categories.setdefault(skill.lower(), [])
+                if category not in categories:
+                    categories.append(category)
+        self.skills = list(self.skill_categories)
+        self._prefixes = {
+            skill: [other for other in self.skills if other != skill and skill.startswith(other)]
+            for skill in self.skills
+        }
+        left = r'(?:\b|(?<![^ ]))'
+        right = r'(?:\b|(?![^ ]))'
+        self._pattern = re.compile(r'(?=' + left + '(' + trie_pattern(self.skills, right) + '))')
+
+    def find_occurrences(self, text_lower: str, space_delimited: bool = False) -> List[SkillOccurrence]:
+        occurrences = []
+        for match in self._pattern.finditer(text_lower):
+            start = match.start()
+            longest = match.group(1)
+            for skill in [longest] + self._prefixes[longest]:
+                if self._is_delimited(text_lower, start, start + len(skill), space_delimited):
+                    for category in self.skill_categories[skill]:
+                        occurrences.append(SkillOccurrence(skill, category, start))
+        return occurrences
+
+    def find_skills(self, text_lower: str, space_delimited: bool = False) -> Set[str]:
+        return {occurrence.skill for occurrence in self.find_occurrences(text_lower, space_delimited)}
+
+    def _is_delimited(self, text: str, start: int, end: int, space_delimited: bool) -> bool:
+        before = text[start - 1] if start > 0 else ''
+        after = text[end] if end < len(text) else ''
+        if (self._is_word_char(before) != self._is_word_char(text[start]) and
+                self._is_word_char(text[end - 1]) != self._is_word_char(after)):
+            return True
+        return space_delimited and before in ('', ' ') and after in ('', ' ')
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum() or char == '_'
@@ -0,0 +1,42 @@
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_SKILL_NAMES = [
+    'React', 'node.js', 'NodeJS', 'javascript', 'JS', 'java', 'python', 'aws', 'docker', 'css', 'html', 'sql',
+    'go', 'golang', 'c', 'c++', 'ml', 'figma', 'Vue', 'vue.js', 'Kubernetes', 'PostgreSQL'
+]
+_LOCATIONS = ['Austin, TX', 'New York, NY', 'San Francisco, CA', 'San Jose, CA', 'Remote US', 'Zürich']
+
+
+@pytest.fixture
+def random_jobs():
+    """Factory for randomized job postings, including alias-spelled skills."""
+    def build(count, seed=0, first_id=1):
+        rng = random.Random(seed)
+        return [
+            {
+                'id': job_id,
+                'title': f'Job {job_id}',
+                'company': rng.choice(['Acme', 'Globex', 'Initech']),
+                'location': rng.choice(_LOCATIONS),
+                'salary_min': rng.randint(50, 100) * 1000,
+                'salary_max': rng.randint(100, 200) * 1000,
+                'required_skills': rng.sample(_SKILL_NAMES, rng.randint(0, 5)),
+                'preferred_skills': rng.sample(_SKILL_NAMES, rng.randint(0, 3)),
+                'experience_years': rng.randint(0, 10),
+                'job_type': rng.choice(['Full-time', 'Contract']),
+                'remote': rng.random() < 0.3,
+                'description': 'Description',
+                'posted_date': datetime(2024, 1, 1) + timedelta(days=rng.randint(0, 5)),
+                'benefits': [],
+                'team_size': None
+            }
+            for job_id in range(first_id, first_id + count)
+        ]
+    return build
@@ -0,0 +1,39 @@
+import asyncio
+
+from ai_analyzer import ImprovedAIAnalyzer
+from parsed_document import ParsedDocument
+from resume_parser import ImprovedResumeParser
+
+RESUME = """Jane Doe
+Sydney, NSW 2000
+jane.doe@example.com | +61 412 345 678
+
+Professional Summary
+Backend engineer with eight years of experience building Python services and data pipelines.
+
+Skills
+Python, Docker, Kubernetes, PostgreSQL
+
+Education
+Bachelor of Computer Science, University of Sydney
+"""
+
+
+def test_reuses_parser_results():
+    parser = ImprovedResumeParser()
+    document = ParsedDocument(RESUME)
+    contact = parser.extract_contact_info(document)
+    skills = parser.extract_skills(document)
+    summary = parser.extract_professional_summary(document)
+    analysis = asyncio.run(ImprovedAIAnalyzer().analyze_resume(
+        document, contact, skills=skills, professional_summary=summary
+    ))
+    assert analysis.skipped_stages == ['contact', 'skills', 'summary']
+    assert analysis.skills == skills
+    assert analysis.summary == summary
+
+
+def test_computes_missing_stages():
+    analysis = asyncio.run(ImprovedAIAnalyzer().analyze_resume(RESUME))
+    assert analysis.skipped_stages == []
+    assert 'Python' in analysis.skills
@@ -0,0 +1,40 @@
+import skill_catalog
+import text_normalizer
+from analysis_cache import AnalysisCache, pipeline_fingerprint
+
+
+def test_keys_depend_on_version_namespace_and_parts():
+    cache = AnalysisCache(version='v1')
+    assert cache.key('upload', 'a', 'bc') == cache.key('upload', 'a', 'bc')
+    assert cache.key('upload', 'a', 'bc') != cache.key('upload', 'ab', 'c')
+    assert cache.key('upload', 'a') != cache.key('text', 'a')
+    assert cache.key('upload', 'a') != AnalysisCache(version='v2').key('upload', 'a')
+
+
+def test_pipeline_fingerprint_covers_each_module():
+    both = pipeline_fingerprint(skill_catalog, text_normalizer)
+    assert both == pipeline_fingerprint(skill_catalog, text_normalizer)
+    assert both != pipeline_fingerprint(skill_catalog)
+    assert both != pipeline_fingerprint(text_normalizer, skill_catalog)
+
+
+def test_lru_eviction_and_ttl():
+    cache = AnalysisCache(version='v1', max_entries=2)
+    cache.set('a', {'n': 1})
+    cache.set('b', {'n': 2})
+    assert cache.get('a') == {'n': 1}
+    cache.set('c', {'n': 3})
+    assert cache.get('b') is None
+    assert cache.get('a') == {'n': 1} and cache.get('c') == {'n': 3}
+    expired = AnalysisCache(version='v1', ttl_seconds=-1)
+    expired.set('a', {'n': 1})
+    assert expired.get('a') is None
+    assert expired.stats()['expirations'] == 1
+
+
+def test_disk_tier_survives_a_restart(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    AnalysisCache(version='v1', db_path=path).set('k', {'value': [1, 2]})
+    restarted = AnalysisCache(version='v1', db_path=path)
+    assert restarted.get('k') == {'value': [1, 2]}
+    assert restarted.stats()['disk_hits'] == 1
@@ -0,0 +1,131 @@
+import random
+import re
+
+from contact_extractor import ContactExtractor
+
+NAME_PATTERNS = [
+    r'^([A-Z][a-z]+ [A-Z][a-z]+(?:\s[A-Z][a-z]+)?)\s*$',
+    r'^([A-Z][a-z]+\s[A-Z]\.\s[A-Z][a-z]+)\s*$',
+    r'^([A-Z][A-Z\s]+[A-Z])\s*$',
+    r'Name:\s*([A-Z][a-z\s]+)',
+    r'RESUME OF\s+([A-Z][a-z\s]+)',
+    r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)(?:\s*[\n|])',
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+)',
+]
+EMAIL_PATTERNS = [
+    r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b',
+    r'Email:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+    r'E-mail:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+    r'Contact:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+]
+LOCATION_PATTERNS = [
+    r'([A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+,\s*\d{4})',
+    r'([A-Z][a-z]+,\s*[A-Z]{2,3}(?:\s+\d{4,5})?)',
+    r'([A-Z][a-z]+,\s*[A-Z][a-z]+)',
+    r'(\d+\s+[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+)',
+    r'Location:\s*([A-Z][a-zA-Z\s,.-]+)',
+    r'Address:\s*([A-Z][a-zA-Z\s,.-]+)',
+    r'Based in:\s*([A-Z][a-zA-Z\s,.-]+)',
+]
+
+
+class LegacyContactExtractor:
+    """The per-pattern whole-text scans ImprovedResumeParser used before ContactExtractor."""
+
+    def __init__(self, phone_patterns):
+        self.phone_patterns = phone_patterns
+        self.helper = ContactExtractor()
+
+    def extract(self, text):
+        return {
+            'name': self._name(text),
+            'email': self._email(text),
+            'phone': self._phone(text),
+            'location': self._location(text)
+        }
+
+    def _name(self, text):
+        lines = text.split('\n')
+        for line in lines[:10]:
+            line = line.strip()
+            if not line or len(line) < 3:
+                continue
+            if any(indicator in line.lower() for indicator in ['page', 'tip:', 'address', '@', 'phone', 'mobile', 'email']):
+                continue
+            words = line.split()
+            if 2 <= len(words) <= 4:
+                if all(word[0].isupper() and word[1:].islower() for word in words if len(word) > 1):
+                    potential_name = ' '.join(words)
+                    if self.helper._validate_name(potential_name):
+                        return potential_name
+        for pattern in NAME_PATTERNS:
+            for line in lines[:8]:
+                match = re.search(pattern, line)
+                if match and self.helper._validate_name(match.group(1).strip()):
+                    return match.group(1).strip()
+        return None
+
+    def _phone(self, text):
+        for pattern in self.phone_patterns:
+            for phone in re.findall(pattern, text):
+                cleaned = self.helper._clean_phone(phone)
+                if cleaned:
+                    return cleaned
+        return None
+
+    def _email(self, text):
+        for pattern in EMAIL_PATTERNS:
+            for email in re.findall(pattern, text, re.IGNORECASE):
+                if self.helper._validate_email(email):
+                    return email.lower()
+        return None
+
+    def _location(self, text):
+        for line in text.split('\n')[:5]:
+            for pattern in LOCATION_PATTERNS:
+                for location in re.findall(pattern, line):
+                    if self.helper._validate_location(location):
+                        return location.strip()
+        return None
+
+
+def clean_text(text):
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'[^\w\s@.,()|\-/+:]', ' ', text)
+    return text.strip()
+
+
+LINES = [
+    'Jane Doe', 'JOHN SMITH', 'Name: Priya Sharma', 'RESUME OF Alex Chen', 'Curriculum Vitae',
+    'Sydney, NSW 2000', 'Melbourne, Victoria, 3000', '12 George Street, Sydney', 'Location: Brisbane',
+    'jane.doe@example.com', 'Email: J.Smith@Mail.Example.org', 'contact me at x@y', 'foo@bar.co | bar@baz.io',
+    '+61 412 345 678', '0412 345 678', '(02) 9876 5432', 'Phone: +1 (415) 555-0100', 'Mobile. 98765 43210',
+    '+44 7911 123456', '+91-98765-43210', '2019 - 2023', '1234567', '123456789012345678',
+    'Tel: 555.123.4567', '+33 1 23 45 67 89', '+49 301 234 5678', 'Order 10023 shipped 2021',
+    'Senior Software Engineer', 'Python, Docker, Kubernetes', '', 'Page 1 of 2', 'Summary',
+]
+
+
+def random_resumes(count):
+    rng = random.Random(3)
+    for _ in range(count):
+        yield '\n'.join(rng.choice(LINES) for _ in range(rng.randint(1, 30)))
+
+
+def test_matches_legacy_whole_text_scans():
+    extractor = ContactExtractor()
+    legacy = LegacyContactExtractor([pattern.pattern for pattern in extractor.phone_patterns])
+    for raw in random_resumes(3000):
+        text = clean_text(raw)
+        assert extractor.extract(text) == legacy.extract(text), text
+
+
+def test_extracts_header_contact_details():
+    text = 'Jane Doe\nSydney, NSW 2000\njane.doe@example.com | +61 412 345 678\n\nSummary\nEngineer'
+    assert ContactExtractor().extract(text) == {
+        'name': 'Jane Doe',
+        'email': 'jane.doe@example.com',
+        'phone': '+61 412 345 678',
+        'location': 'Sydney, NSW 2000'
+    }
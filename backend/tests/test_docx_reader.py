@@ -0,0 +1,95 @@
+import io
+import zipfile
+
+import pytest
+
+from docx_reader import DocxReader
+
+docx = pytest.importorskip('docx')
+from docx.enum.text import WD_TAB_ALIGNMENT  # noqa: E402
+from docx.shared import Inches  # noqa: E402
+
+
+def build_document():
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = 'Jane Doe | jane@example.com'
+    document.add_paragraph('Professional Summary')
+    dated = document.add_paragraph()
+    dated.paragraph_format.tab_stops.add_tab_stop(Inches(6), WD_TAB_ALIGNMENT.RIGHT)
+    dated.add_run('Software Engineer')
+    dated.add_run().add_tab()
+    dated.add_run('2019 - 2023')
+    wrapped = document.add_paragraph()
+    wrapped.add_run('Line one')
+    wrapped.add_run().add_break()
+    wrapped.add_run('line two')
+    table = document.add_table(rows=2, cols=3)
+    for row_index, row in enumerate(table.rows):
+        for column, cell in enumerate(row.cells):
+            cell.text = f'r{row_index}c{column}'
+    table.rows[1].cells[2].add_paragraph('second paragraph')
+    document.add_paragraph('Skills: Python, Docker')
+    return document
+
+
+def save(document):
+    buffer = io.BytesIO()
+    document.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def test_matches_python_docx_paragraphs_and_tables():
+    document = build_document()
+    content = DocxReader().read(save(document))
+    header_lines = [paragraph.text for paragraph in document.sections[0].header.paragraphs]
+    body_lines = [paragraph.text for paragraph in document.paragraphs]
+    assert content.paragraph_text == ''.join(line + '\n' for line in header_lines + body_lines)
+    assert content.tables == [[[cell.text for cell in row.cells] for row in table.rows] for table in document.tables]
+
+
+def test_tab_stop_definitions_are_not_text():
+    content = DocxReader().read(save(build_document()))
+    assert 'Software Engineer\t2019 - 2023\n' in content.text
+    assert '\tSoftware Engineer' not in content.text
+
+
+def test_text_follows_document_order():
+    content = DocxReader().read(save(build_document()))
+    assert content.text == (
+        'Jane Doe | jane@example.com\n'
+        'Professional Summary\n'
+        'Software Engineer\t2019 - 2023\n'
+        'Line one\nline two\n'
+        'r0c0 r0c1 r0c2 \n'
+        'r1c0 r1c1 r1c2\nsecond paragraph \n'
+        'Skills: Python, Docker\n'
+    )
+
+
+def test_merged_cells_appear_once():
+    document = docx.Document()
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).merge(table.cell(1, 0)).text = 'merged'
+    table.cell(0, 1).text = 'a'
+    table.cell(1, 1).text = 'b'
+    content = DocxReader().read(save(document))
+    assert content.tables == [[['merged', 'a'], ['b']]]
+
+
+def test_header_parts_are_read_in_numeric_order():
+    source = save(build_document())
+    header_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:hdr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        '<w:p><w:r><w:t>{}</w:t></w:r></w:p></w:hdr>'
+    )
+    rebuilt = io.BytesIO()
+    with zipfile.ZipFile(source) as original, zipfile.ZipFile(rebuilt, 'w') as archive:
+        for item in original.infolist():
+            if not item.filename.startswith('word/header'):
+                archive.writestr(item, original.read(item.filename))
+        for number in (10, 2, 1):
+            archive.writestr(f'word/header{number}.xml', header_xml.format(f'H{number}'))
+    rebuilt.seek(0)
+    assert DocxReader().read(rebuilt).text.startswith('H1\nH2\nH10\nProfessional Summary\n')
@@ -0,0 +1,38 @@
+import pytest
+
+from intelligent_education_detector import IntelligentEducationDetector
+from parsed_document import ParsedDocument
+
+RESUME = """Jane Doe
+EDUCATION
+Bachelor of Science in Computer Science
+The University of Sydney
+2015 - 2018
+Master of Business Administration
+Melbourne Business School
+EXPERIENCE
+Engineer at Atlassian"""
+
+
+def test_scores_institutions_by_neighbourhood():
+    found = IntelligentEducationDetector().detect_institutions(RESUME)
+    assert [(entry['name'], entry['confidence']) for entry in found] == [
+        ('The University', pytest.approx(0.9)),
+        ('Melbourne Business School', pytest.approx(0.75)),
+        ('Computer Science', pytest.approx(0.35)),
+        ('Business Administration', pytest.approx(0.35)),
+    ]
+    assert found[1]['context'] == (
+        '2015 - 2018 Master of Business Administration Melbourne Business School EXPERIENCE Engineer at Atlassian'
+    )
+
+
+def test_lookups_share_one_detection_pass():
+    detector = IntelligentEducationDetector()
+    document = ParsedDocument(RESUME)
+    assert detector.get_best_institution(document) == 'The University'
+    assert detector.get_all_institutions(document) == ['The University', 'Melbourne Business School']
+
+
+def test_no_education_lines():
+    assert IntelligentEducationDetector().detect_institutions('Jane Doe\nSkills\nPython') == []
@@ -0,0 +1,75 @@
+import pytest
+
+from extractor_router import ExtractorRouter, PdfProfile, UnreadableDocument, is_good_text
+
+
+def profile(producer, fonts=1, images=0, encrypted=False, decrypted=True, text_operators=5):
+    return PdfProfile(producer, '', 1, fonts, images, encrypted, decrypted, text_operators)
+
+
+@pytest.mark.parametrize('producer, document_class', [
+    ('iText 5.5.13', 'other'),
+    ('pdfTeX-1.40.25', 'latex'),
+    ('xdvipdfmx (20200315)', 'latex'),
+    ('LuaTeX-1.17.0', 'latex'),
+    ('Microsoft® Word 2016', 'office'),
+    ('Skia/PDF m116', 'office'),
+    ('Adobe InDesign 18.0', 'designer'),
+    ('Wordsmith', 'other'),
+])
+def test_producer_markers_match_whole_tokens(producer, document_class):
+    assert profile(producer).document_class == document_class
+
+
+def test_image_only_documents_take_the_slow_lane():
+    decision = ExtractorRouter().route(profile('Scanner', fonts=0, images=3, text_operators=0))
+    assert decision.document_class == 'image_only' and decision.lane == 'slow'
+
+
+def test_learns_the_cheapest_extractor_per_class():
+    router = ExtractorRouter(min_samples=2)
+    office = profile('Microsoft Word')
+    assert router.route(office) == ('office', ('pypdf2', 'pdfplumber'), 'fast', False, False)
+    for _ in range(2):
+        router.record('office', [('pypdf2', 0.2, False), ('pdfplumber', 0.1, True)])
+    assert router.route(office) == ('office', ('pdfplumber', 'pypdf2'), 'fast', True, False)
+    assert router.route(profile('pdfTeX')).learned is False
+
+
+def test_every_extractor_is_tried_before_the_order_is_learned():
+    router = ExtractorRouter(min_samples=2, explore_every=5)
+    office = profile('Microsoft Word')
+    decisions = []
+    for _ in range(14):
+        decision = router.route(office)
+        decisions.append(decision)
+        # The leading extractor always succeeds, so a fallback would never be recorded.
+        seconds = 0.1 if decision.order[0] == 'pdfplumber' else 0.2
+        router.record(decision.document_class, [(decision.order[0], seconds, True)])
+    assert [decision.order[0] for decision in decisions[:4]] == ['pypdf2', 'pdfplumber', 'pypdf2', 'pdfplumber']
+    assert not any(decision.learned for decision in decisions[:4])
+    learned = decisions[4:]
+    assert all(decision.learned for decision in learned)
+    assert [decision.order[0] for decision in learned if not decision.explored] == ['pdfplumber'] * 8
+    assert [decision.order[0] for decision in learned if decision.explored] == ['pypdf2', 'pypdf2']
+
+
+def test_good_text_heuristic():
+    assert is_good_text('Jane Doe, backend engineer with Python and Docker experience since 2016.')
+    assert not is_good_text('too short')
+    assert not is_good_text('x' * 80)
+
+
+def test_triage_rejects_unreadable_documents():
+    router = ExtractorRouter()
+    router.triage(profile('Word'))
+    with pytest.raises(UnreadableDocument) as raised:
+        router.triage(profile('Word', encrypted=True, decrypted=False))
+    assert raised.value.reason == 'encrypted'
+    with pytest.raises(UnreadableDocument) as raised:
+        router.triage(profile('Scanner', text_operators=0, images=3))
+    assert raised.value.reason == 'image_only'
+    with pytest.raises(UnreadableDocument) as raised:
+        router.triage(profile('Word', text_operators=0))
+    assert raised.value.reason == 'empty'
+    assert router.stats()['rejections'] == {'empty': 1, 'encrypted': 1, 'image_only': 1}
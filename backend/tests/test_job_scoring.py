@@ -0,0 +1,75 @@
+import asyncio
+import random
+from datetime import datetime
+
+from job_matcher import MATCH_THRESHOLD, MAX_MATCHES, EnhancedJobMatcher
+from job_store import JobStore
+from models import ContactInfo, ResumeAnalysis
+from skill_catalog import SkillCatalog
+
+LEVELS = ['Junior', 'Mid-Level', 'Senior', 'Unknown']
+
+
+def skill_pool(jobs):
+    return sorted({skill for job in jobs for skill in job['required_skills'] + job['preferred_skills']} | {'Rust'})
+
+
+def test_engine_matches_per_job_scoring(tmp_path, random_jobs):
+    jobs = random_jobs(80, seed=1)
+    jobs[3]['experience_years'] = 0
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.add_jobs(jobs)
+    matcher = EnhancedJobMatcher(store)
+    rng = random.Random(2)
+    pool = skill_pool(jobs)
+    resumes = [
+        (store.skill_ids(rng.sample(pool, rng.randint(0, 8))), rng.choice([0, 1, 2, 3, 4, 5, 8, 12]), rng.choice(LEVELS))
+        for _ in range(40)
+    ]
+    scoring = matcher.scoring
+    scores = scoring.score(*zip(*resumes))
+    hydrated = store.get_jobs(scoring.columns.job_ids)
+    for row, (skill_ids, experience, level) in enumerate(resumes):
+        expected = [matcher._calculate_enhanced_match(skill_ids, experience, level, job)['score'] for job in hydrated]
+        assert scores[row].tolist() == expected
+
+
+def test_find_matches_ranks_like_a_full_sort(tmp_path, random_jobs):
+    jobs = random_jobs(120, seed=4)
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.add_jobs(jobs)
+    matcher = EnhancedJobMatcher(store)
+    rng = random.Random(5)
+    pool = skill_pool(jobs)
+    for _ in range(20):
+        skills = rng.sample(pool, rng.randint(1, 10))
+        experience = {'years': rng.randint(0, 10), 'level': rng.choice(LEVELS)}
+        analysis = ResumeAnalysis(
+            contact=ContactInfo(), skills=skills, experience=experience, analysis_date='2024-01-01'
+        )
+        skill_ids = store.skill_ids(skills)
+        scored = []
+        for job in store.get_jobs([job['id'] for job in jobs]):
+            score = matcher._calculate_enhanced_match(skill_ids, experience['years'], experience['level'], job)['score']
+            if score >= MATCH_THRESHOLD:
+                scored.append((score, job['id']))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        matches = asyncio.run(matcher.find_matches(analysis))
+        assert [(match.match_percentage, match.job_id) for match in matches] == scored[:MAX_MATCHES]
+
+
+def test_aliases_fold_to_canonical_skills(tmp_path):
+    catalog = SkillCatalog()
+    assert catalog.canonical('NodeJS') == catalog.canonical('node.js') == catalog.canonical('Node  JS') == 'node.js'
+    assert catalog.canonical('golang') == 'go'
+    assert catalog.canonical('k8s') == 'kubernetes'
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.add_jobs([{
+        'id': 1, 'title': 'Engineer', 'company': 'Acme', 'location': 'Remote US', 'salary_min': 1, 'salary_max': 2,
+        'required_skills': ['C', 'NodeJS'], 'preferred_skills': ['css'], 'experience_years': 1,
+        'job_type': 'Full-time', 'remote': True, 'description': '', 'posted_date': datetime(2024, 1, 1),
+        'benefits': [], 'team_size': None
+    }])
+    assert store.skill_ids(['node.js']) == store.skill_ids(['Node JS'])
+    assert store.skill_id('c') != store.skill_id('css')
+    assert store.skill_ids(['rust']) == frozenset()
@@ -0,0 +1,114 @@
+import os
+import random
+
+import pytest
+
+import job_store
+from job_store import JobStore, location_terms
+from skill_catalog import skill_catalog
+
+
+def reference_search(jobs, skills=(), location='', remote_only=False, job_type='', salary_min=None,
+                     salary_max=None, experience_years=None):
+    wanted = {skill_catalog.canonical(skill) for skill in skills}
+    location = ' '.join(location.lower().split())
+    keys = []
+    for job in jobs:
+        listed = {skill_catalog.canonical(skill) for skill in job['required_skills'] + job['preferred_skills']}
+        if skills and not listed & wanted:
+            continue
+        if location and not (job['remote'] or any(term.startswith(location) for term in location_terms(job['location']))):
+            continue
+        if remote_only and not job['remote']:
+            continue
+        if job_type and job['job_type'].lower() != job_type.lower():
+            continue
+        if salary_min is not None and job['salary_max'] < salary_min:
+            continue
+        if salary_max is not None and job['salary_min'] > salary_max:
+            continue
+        if experience_years is not None and job['experience_years'] > experience_years:
+            continue
+        score = None
+        if skills:
+            required = list(dict.fromkeys(skill_catalog.canonical(skill) for skill in job['required_skills']))
+            matched = [skill for skill in required if skill in wanted]
+            score = int(min(95, len(matched) / len(required) * 100)) if required else 0
+        keys.append((score, job['posted_date'].isoformat(), job['id']))
+    keys.sort(key=lambda key: key[2])
+    keys.sort(key=lambda key: (key[0] or 0, key[1]), reverse=True)
+    return keys
+
+
+def walk(store, limit, **filters):
+    keys, totals, cursor = [], [], None
+    while True:
+        page = store.search(limit=limit, cursor=cursor, **filters)
+        assert len(page.jobs) <= limit
+        totals.append(page.total)
+        keys.extend((score, job['posted_date'].isoformat(), job['id']) for job, score in zip(page.jobs, page.scores))
+        cursor = page.next_cursor
+        if cursor is None:
+            return keys, totals
+
+
+def test_paged_search_matches_reference(tmp_path, random_jobs):
+    rng = random.Random(9)
+    for trial in range(40):
+        jobs = random_jobs(rng.randint(0, 60), seed=trial)
+        store = JobStore(str(tmp_path / f'{trial}.db'))
+        store.add_jobs(jobs)
+        for _ in range(5):
+            filters = {
+                'skills': rng.choice([(), tuple(rng.sample(['python', 'JS', 'node.js', 'golang', 'vue', 'rust'], 2))]),
+                'location': rng.choice(['', '', 'san', 'SAN  jose', 'tx', 'zü']),
+                'remote_only': rng.random() < 0.2,
+                'job_type': rng.choice(['', 'contract']),
+                'salary_min': rng.choice([None, 120000]),
+                'salary_max': rng.choice([None, 90000]),
+                'experience_years': rng.choice([None, 3]),
+            }
+            expected = reference_search(jobs, **filters)
+            skills = filters.pop('skills')
+            keys, totals = walk(store, rng.randint(1, 7), skill_ids=store.skill_ids(skills) if skills else None, **filters)
+            assert keys == expected
+            assert totals[0] == len(expected)
+            assert all(total is None for total in totals[1:])
+
+
+def test_invalid_cursor_is_rejected(tmp_path, random_jobs):
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.add_jobs(random_jobs(3))
+    with pytest.raises(ValueError):
+        store.search(cursor='not-a-cursor')
+
+
+def test_jobs_round_trip(tmp_path, random_jobs):
+    jobs = random_jobs(5)
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    store.add_jobs(jobs)
+    found = store.get_jobs([4, 99, 2])
+    assert [job['id'] for job in found] == [4, 2]
+    for job in found:
+        expected = jobs[job['id'] - 1]
+        assert {field: job[field] for field in expected} == expected
+
+
+def test_default_store_lives_in_the_data_directory(tmp_path, random_jobs):
+    assert os.path.dirname(job_store.DEFAULT_JOB_STORE) == job_store.DATA_DIR
+    store = JobStore(str(tmp_path / 'data' / 'jobs.db'))
+    store.add_jobs(random_jobs(2))
+    assert [job['id'] for job in store.get_jobs([1, 2])] == [1, 2]
+
+
+def test_writes_keep_the_previous_column_revision(tmp_path, random_jobs):
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    for first_id in (1, 11, 21):
+        store.add_jobs(random_jobs(10, first_id=first_id))
+    assert store.revision == 3
+    assert list(store.columns().job_ids) == list(range(1, 31))
+    assert sorted(os.listdir(store.columns_dir)) == ['rev-2', 'rev-3']
+    reader = JobStore(store.path, readonly=True)
+    assert list(reader.columns().job_ids) == list(range(1, 31))
+    with pytest.raises(PermissionError):
+        reader.add_jobs(random_jobs(1, first_id=99))
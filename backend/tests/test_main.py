@@ -0,0 +1,230 @@
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+docx = pytest.importorskip('docx')
+from fastapi.testclient import TestClient  # noqa: E402
+
+DOCX_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+RESUME_TEXT = (
+    "Jane Doe\nSydney, NSW 2000\njane.doe@example.com | +61 412 345 678\n\n"
+    "Professional Summary\nBackend engineer with eight years building Python and Go services on AWS.\n\n"
+    "Experience\nSenior Software Engineer, Acme Corp 2016 - 2024\nBuilt Docker and Kubernetes platforms.\n\n"
+    "Skills\nPython, Go, Docker, Kubernetes, PostgreSQL, Terraform\n\n"
+    "Education\nBachelor of Science in Computer Science, University of Sydney 2015\n"
+)
+
+
+@pytest.fixture(scope='module')
+def app_module(tmp_path_factory):
+    root = tmp_path_factory.mktemp('app')
+    patch = pytest.MonkeyPatch()
+    patch.setenv('RESUME_JOB_STORE', str(root / 'jobs.sqlite3'))
+    patch.setenv('RESUME_TEXT_STORE_DIR', str(root / 'text'))
+    patch.setenv('RESUME_WORKERS', '1')
+    patch.delenv('RESUME_CACHE_DB', raising=False)
+    import main
+    yield main
+    patch.undo()
+
+
+@pytest.fixture(scope='module')
+def client(app_module):
+    with TestClient(app_module.app) as test_client:
+        yield test_client
+
+
+def resume_docx():
+    document = docx.Document()
+    for line in RESUME_TEXT.split('\n'):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def comparable(response):
+    response = json.loads(json.dumps(response))
+    response['metadata'].pop('processing_time')
+    response['metadata'].pop('cached', None)
+    response['analysis'].pop('analysis_date')
+    return response
+
+
+def test_search_pages_cover_the_unpaged_result(client):
+    full = client.post('/jobs/search', json={'skills': ['python', 'javascript'], 'limit': 100}).json()
+    assert full['next_cursor'] is None
+    seen, cursor, totals = [], None, []
+    while True:
+        page = client.post('/jobs/search', json={'skills': ['python', 'javascript'], 'limit': 2, 'cursor': cursor}).json()
+        assert page['success'] and len(page['jobs']) <= 2
+        assert 'cursor' not in page['search_criteria']
+        totals.append(page['total_found'])
+        seen.extend(job['job_id'] for job in page['jobs'])
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+    assert seen == [job['job_id'] for job in full['jobs']]
+    assert totals[0] == full['total_found'] == len(seen)
+    assert all(total is None for total in totals[1:])
+
+
+def test_get_search_matches_post(client):
+    posted = client.post('/jobs/search', json={'skills': ['react', 'node.js'], 'location': 'san', 'limit': 5}).json()
+    fetched = client.get('/jobs/search', params={'skills': 'react, node.js', 'location': 'san', 'limit': 5}).json()
+    assert [job['job_id'] for job in fetched['jobs']] == [job['job_id'] for job in posted['jobs']]
+    assert fetched['total_found'] == posted['total_found']
+
+
+def test_search_rejects_bad_cursor_and_limit(client):
+    assert client.post('/jobs/search', json={'cursor': 'garbage'}).status_code == 400
+    assert client.post('/jobs/search', json={'limit': 0}).status_code == 422
+
+
+def test_cached_text_analysis_follows_job_catalog_writes(client, app_module):
+    first = client.post('/analyze-text', json={'text': RESUME_TEXT}).json()
+    assert first['analysis']['contact']['email'] == 'jane.doe@example.com'
+    again = client.post('/analyze-text', json={'text': RESUME_TEXT}).json()
+    assert again['metadata']['cached'] is True
+    app_module.job_store.add_jobs([{
+        'id': 9001, 'title': 'Platform Engineer', 'company': 'Tested Ltd', 'location': 'Sydney, NSW',
+        'salary_min': 150000, 'salary_max': 180000,
+        'required_skills': ['Python', 'Go', 'Docker', 'Kubernetes'], 'preferred_skills': ['Terraform'],
+        'experience_years': 5, 'job_type': 'Full-time', 'remote': False, 'description': 'Platform work',
+        'posted_date': datetime(2024, 6, 1), 'benefits': [], 'team_size': None
+    }])
+    refreshed = client.post('/analyze-text', json={'text': RESUME_TEXT}).json()
+    assert 'cached' not in refreshed['metadata']
+    assert 9001 in [match['job_id'] for match in refreshed['job_matches']]
+    assert 9001 not in [match['job_id'] for match in first['job_matches']]
+
+
+def test_upload_stream_ends_with_the_upload_result(client):
+    data = resume_docx()
+    client.post('/cache/clear')
+    streamed = client.post('/upload-resume/stream', files={'file': ('stream.docx', data, DOCX_TYPE)})
+    assert streamed.status_code == 200
+    events = [json.loads(line) for line in streamed.text.splitlines()]
+    kinds = [event['event'] for event in events]
+    assert kinds[0] == 'page' and kinds[-1] == 'result'
+    assert {'contact', 'skills', 'sections'} <= set(kinds)
+    contact = next(event for event in events if event['event'] == 'contact')['contact']
+    assert contact['email'] == 'jane.doe@example.com'
+    sections = [item['section'] for event in events if event['event'] == 'sections' for item in event['sections']]
+    assert {'summary', 'experience', 'skills', 'education'} <= set(sections)
+    client.post('/cache/clear')
+    uploaded = client.post('/upload-resume', files={'file': ('stream.docx', data, DOCX_TYPE)}).json()
+    assert comparable(events[-1]['data']) == comparable(uploaded)
+    assert uploaded['metadata']['extractor'] == 'docx-stream'
+    cached = client.post('/upload-resume', files={'file': ('renamed.docx', data, DOCX_TYPE)}).json()
+    assert cached['metadata']['cached'] is True and cached['metadata']['file_name'] == 'renamed.docx'
+
+
+def test_upload_rejects_unsupported_and_oversized_files(client, app_module):
+    assert client.post('/upload-resume', files={'file': ('a.txt', b'text', 'text/plain')}).status_code == 400
+    oversized = b'x' * (app_module.upload_ingestor.max_bytes + 1)
+    response = client.post('/upload-resume', files={'file': ('big.pdf', oversized, 'application/pdf')})
+    assert response.status_code == 413
+    assert response.json()['detail'] == app_module.FILE_TOO_LARGE
+    oversized += b'x' * app_module.MULTIPART_OVERHEAD
+    response = client.post(
+        '/upload-resume', files={'file': ('big.pdf', oversized, 'application/pdf')},
+        headers={'Origin': 'https://app.example.com'}
+    )
+    assert response.status_code == 413
+    assert response.headers['access-control-allow-origin'] == 'https://app.example.com'
+    assert response.json()['detail'] == app_module.FILE_TOO_LARGE
+
+
+def test_text_store_evict_rejects_paths(client, tmp_path):
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    response = client.post('/text-store/evict', json={'file_hashes': [str(outside)]})
+    assert response.status_code == 400
+    assert outside.is_dir()
+    assert client.post('/text-store/evict', json={'file_hashes': ['0' * 64]}).json()['evicted'] == 0
+
+
+def test_warm_limits_each_file_rather_than_the_request(client, app_module):
+    max_bytes = app_module.upload_ingestor.max_bytes
+    files = [('files', (f'{index}.pdf', b'%PDF' + b'x' * (max_bytes // 2), 'application/pdf')) for index in range(3)]
+    files.append(('files', ('big.pdf', b'x' * (max_bytes + 1), 'application/pdf')))
+    response = client.post('/text-store/warm', files=files)
+    assert response.status_code == 200
+    assert [result['status'] for result in response.json()['results']] == ['failed', 'failed', 'failed', 'too_large']
+    too_many = [('files', (f'{index}.pdf', b'%PDF', 'application/pdf')) for index in range(app_module.WARM_MAX_FILES + 1)]
+    assert client.post('/text-store/warm', files=too_many).status_code == 400
+
+
+def test_stream_falls_back_to_the_batch_path_when_a_page_task_fails(app_module, monkeypatch):
+    from extracted_text import ExtractedPage, ExtractedText
+    from extractor_router import PdfProfile, RouteDecision
+    from upload_ingest import IngestedUpload
+
+    class Router:
+        def __init__(self):
+            self.routes, self.records = 0, []
+
+        def triage(self, profile):
+            pass
+
+        def route(self, profile):
+            self.routes += 1
+            return RouteDecision('other', ('pdfplumber', 'pypdf'), 'fast', False)
+
+        def record(self, document_class, attempts):
+            self.records.append([extractor for extractor, _, _ in attempts])
+
+    class Pool:
+        parallel = True
+
+        def __init__(self):
+            self.calls = []
+
+        async def run(self, func, *args):
+            self.calls.append(func.__name__)
+            if func is app_module.pdf_profile:
+                return PdfProfile('', '', 2, 1, 0, False, text_operator_count=1)
+            if func is app_module.extract_pdf_pages:
+                raise RuntimeError('page task failed')
+            page = ExtractedPage(1, RESUME_TEXT, [])
+            return ExtractedText(RESUME_TEXT, [page], 'pypdf'), [('pypdf', 0.1, True)], None
+
+    router, pool = Router(), Pool()
+    monkeypatch.setattr(app_module, 'extractor_router', router)
+    monkeypatch.setattr(app_module, 'worker_pool', pool)
+    upload = IngestedUpload('broken.pdf', 'application/pdf')
+    upload.file_hash = 'f' * 64
+
+    async def collect():
+        return [item async for item in app_module.stream_upload_pages(upload)]
+
+    events = app_module.asyncio.run(collect())
+    assert [kind for kind, _ in events] == ['page', 'document']
+    assert events[-1][1].producer == 'pypdf'
+    assert pool.calls.count('pdf_profile') == 1
+    assert router.routes == 1
+    assert router.records == [['pdfplumber'], ['pypdf']]
+    app_module.text_store.evict(['f' * 64])
+
+
+def test_text_extraction_endpoints_run_on_the_worker_pool(client, app_module):
+    submitted = app_module.worker_pool.stats()['submitted']
+    contact = client.post('/extract-contact', json={'text': RESUME_TEXT + ' contact'}).json()
+    skills = client.post('/extract-skills', json={'text': RESUME_TEXT + ' skills'}).json()
+    assert contact['contact']['email'] == 'jane.doe@example.com'
+    assert 'Python' in skills['skills'] and skills['categorized_skills']
+    assert app_module.worker_pool.stats()['submitted'] == submitted + 2
+    assert client.post('/extract-contact', json={'text': ' '}).status_code == 400
+
+
+def test_cache_version_covers_the_response_builders(app_module):
+    from analysis_cache import pipeline_fingerprint
+
+    assert app_module.models in app_module.PIPELINE_MODULES
+    assert app_module in app_module.PIPELINE_MODULES
+    assert app_module.analysis_cache.version.endswith(pipeline_fingerprint(*app_module.PIPELINE_MODULES))
@@ -0,0 +1,21 @@
+import pytest
+
+import memory_guard
+from memory_guard import MemoryGuard, MemoryLimitExceeded, current_rss
+
+
+def test_reports_growth_past_the_limit(monkeypatch):
+    samples = iter([100 * 1024 * 1024, 100 * 1024 * 1024, 102 * 1024 * 1024])
+    monkeypatch.setattr(memory_guard, 'current_rss', lambda: next(samples))
+    guard = MemoryGuard(1024 * 1024)
+    guard.check('PDF page 1')
+    with pytest.raises(MemoryLimitExceeded, match='PDF page 2 used 2MB, over the per-document limit of 1MB'):
+        guard.check('PDF page 2')
+    assert guard.peak == 2 * 1024 * 1024
+
+
+def test_disabled_guard_never_samples():
+    guard = MemoryGuard(0)
+    guard.check('PDF page 1')
+    assert guard.baseline == guard.peak == 0
+    assert current_rss() > 0
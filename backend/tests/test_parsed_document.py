@@ -0,0 +1,44 @@
+from parsed_document import ParsedDocument
+
+
+def test_views_are_built_once():
+    document = ParsedDocument('Jane Doe\n  Skills:  \nPython')
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return 'value'
+
+    assert document.view('custom', factory) == 'value'
+    assert document.view('custom', factory) == 'value'
+    assert calls == [1]
+    assert document.lines is document.lines
+
+
+def test_line_views():
+    document = ParsedDocument('Jane Doe\n  Skills:  \nPython')
+    assert document.lines == ['Jane Doe', '  Skills:  ', 'Python']
+    assert document.stripped_lower_lines == ['jane doe', 'skills:', 'python']
+    assert document.line_offsets == [0, 9, 21]
+    for line, offset in zip(document.lines, document.line_offsets):
+        assert document.text[offset:offset + len(line)] == line
+    assert document.tokens == ['Jane', 'Doe', 'Skills:', 'Python']
+
+
+def test_of_reuses_documents():
+    document = ParsedDocument('text')
+    assert ParsedDocument.of(document) is document
+    assert ParsedDocument.of('text').text == 'text'
+
+
+def test_source_offsets_map_back_through_the_normalizer():
+    from text_normalizer import TextNormalizer
+
+    raw = '  Jane   Doe\n\n\n\nSkills:\tPython'
+    document = ParsedDocument.from_normalized(TextNormalizer().normalize(raw))
+    assert document.text == 'Jane Doe\n\nSkills: Python'
+    for line, offset in zip(document.lines, document.line_offsets):
+        if line:
+            source = document.source_offset(offset)
+            assert raw[source:source + 4] == line[:4]
+    assert ParsedDocument('plain').source_offset(3) == 3
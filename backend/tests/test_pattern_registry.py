@@ -0,0 +1,55 @@
+import re
+
+import pytest
+
+from pattern_registry import PatternRegistry
+
+
+def test_tracked_patterns_behave_like_compiled_regexes_and_count_calls():
+    registry = PatternRegistry()
+    digits = registry.register('digits', r'\d+')
+    text = 'call 0412 or 555'
+    assert digits.search(text).group() == re.search(r'\d+', text).group()
+    assert digits.findall(text) == ['0412', '555']
+    assert [match.group() for match in digits.finditer(text)] == ['0412', '555']
+    assert digits.sub('#', text) == 'call # or #'
+    assert digits.match(text) is None
+    assert digits.stats()['calls'] == 5 and digits.stats()['hits'] == 4
+
+
+def test_registration_is_idempotent_and_shares_compiled_expressions():
+    registry = PatternRegistry()
+    first = registry.register('a', r'x+', re.IGNORECASE)
+    assert registry.register('a', r'x+', re.IGNORECASE) is first
+    assert registry.register('b', r'x+', re.IGNORECASE).regex is first.regex
+    with pytest.raises(ValueError):
+        registry.register('a', r'y+')
+    group = registry.register_group('g', [r'a', r'b'])
+    assert [pattern.name for pattern in group] == ['g[0]', 'g[1]']
+    assert len(registry) == 4 and 'g[1]' in registry
+
+
+def test_disabled_registry_skips_counters_and_reset_clears_them():
+    disabled = PatternRegistry(enabled=False)
+    pattern = disabled.register('p', r'a')
+    assert [match.group() for match in pattern.finditer('aa')] == ['a', 'a']
+    assert pattern.stats()['calls'] == 0
+    registry = PatternRegistry()
+    pattern = registry.register('p', r'a')
+    list(pattern.finditer('aa'))
+    assert registry.stats()[0]['calls'] == 1
+    registry.reset_stats()
+    assert registry.stats()[0]['calls'] == 0
+
+
+def test_drained_counters_merge_into_another_registry():
+    worker, parent = PatternRegistry(), PatternRegistry()
+    worker.register('digits', r'\d+').search('a1')
+    worker.register('letters', r'[a-z]+')
+    parent.register('digits', r'\d+').search('no digits')
+    deltas = worker.drain_stats()
+    assert list(deltas) == ['digits'] and deltas['digits'][:2] == (1, 1)
+    assert worker.get('digits').calls == 0 and worker.drain_stats() == {}
+    parent.merge_stats(dict(deltas, unknown=(1, 1, 0.0)))
+    assert (parent.get('digits').calls, parent.get('digits').hits) == (2, 1)
+    assert 'unknown' not in parent
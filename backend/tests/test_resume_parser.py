@@ -0,0 +1,108 @@
+import io
+
+import pytest
+
+from extracted_text import ExtractedPage
+from incremental_analysis import IncrementalAnalysis
+
+PyPDF2 = pytest.importorskip('PyPDF2')
+pytest.importorskip('pdfplumber')
+from resume_parser import ImprovedResumeParser  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def parser():
+    return ImprovedResumeParser()
+
+
+def encrypted_pdf(user_password, owner_password):
+    writer = PyPDF2.PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    writer.encrypt(user_password, owner_password)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_owner_password_only_pdf_is_profiled(parser):
+    profile = parser.pdf_profile(encrypted_pdf('', 'owner-secret'))
+    assert profile.encrypted and profile.decrypted
+    assert profile.page_count == 1
+    assert profile.unreadable_reason == 'empty'
+
+
+def test_user_password_pdf_is_rejected_as_encrypted(parser):
+    profile = parser.pdf_profile(encrypted_pdf('user-secret', 'owner-secret'))
+    assert profile.encrypted and not profile.decrypted
+    assert profile.unreadable_reason == 'encrypted'
+
+
+def test_parallel_pages_assemble_like_serial_extraction(parser):
+    pages = [ExtractedPage(2, 'Second  page\tskills', [[['Python', 'Go']]]), ExtractedPage(1, 'First page\n\n\nname', [])]
+    assembled = parser.assemble_pdf_pages(pages)
+    assert [page.number for page in assembled.pages] == [1, 2]
+    assert assembled.text == parser._clean_text('First page\n\n\nname\nSecond  page\tskills\nPython Go\n')
+    assert parser.assemble_pdf_pages([ExtractedPage(1, '', [])]).text == ''
+
+
+def test_in_memory_sources_match_file_paths(parser, tmp_path):
+    docx = pytest.importorskip('docx')
+    document = docx.Document()
+    document.add_paragraph('Jane Doe')
+    document.add_paragraph('Skills: Python, Docker')
+    path = tmp_path / 'resume.docx'
+    document.save(str(path))
+    content = path.read_bytes()
+    content_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+    expected = parser.extract_document(str(path), content_type)
+    assert parser.extract_document(content, content_type) == expected
+    assert parser.extract_document(memoryview(content), content_type) == expected
+    with open(path, 'rb') as handle:
+        assert parser.extract_document(handle, content_type) == expected
+
+
+class FakePage:
+    def __init__(self, edges, rects=()):
+        self.edges = edges
+        self.lines = []
+        self.rects = list(rects)
+        self.table_calls = 0
+
+    def extract_text(self):
+        return 'Jane Doe'
+
+    def extract_tables(self):
+        self.table_calls += 1
+        return [[['Python', None]]]
+
+
+def test_table_detection_needs_a_ruling_grid(parser):
+    plain = FakePage([])
+    assert parser._extract_pdf_page(plain, 1) == ExtractedPage(1, 'Jane Doe', [])
+    assert plain.table_calls == 0
+    underline = FakePage([{'orientation': 'h'}] * 4, rects=[{}])
+    assert parser._extract_pdf_page(underline, 1).tables == []
+    assert underline.table_calls == 0
+    grid = FakePage([{'orientation': 'h'}, {'orientation': 'v'}] * 2, rects=[{}])
+    assert parser._extract_pdf_page(grid, 2) == ExtractedPage(2, 'Jane Doe', [[['Python', '']]])
+    assert grid.table_calls == 1
+
+
+def test_incremental_analysis_carries_state_across_pages(parser):
+    analysis = IncrementalAnalysis(parser)
+    first_page = (
+        'John Smith\nSydney, NSW\njohn.smith@example.com\n\n'
+        'SUMMARY\nBackend engineer with Python and Docker.\n\nEXPERIENCE\nAcme Corp 2019 - 2023\n'
+    )
+    first = analysis.feed(ExtractedPage(1, first_page, []))
+    second = analysis.feed(ExtractedPage(2, (
+        'Built Kubernetes clusters.\nPhone: +61 412 345 678\n\nSKILLS\nSQL, React\n'
+    ), []))
+    assert first['contact'] == {'email': 'john.smith@example.com', 'name': 'John Smith', 'location': 'Sydney, NSW'}
+    assert first['skills'] == ['Docker', 'Python']
+    assert [item['section'] for item in first['sections']] == ['summary', 'experience']
+    assert [first_page[item['offset']:].split('\n')[0] for item in first['sections']] == ['SUMMARY', 'EXPERIENCE']
+    assert second['contact'] == {'phone': '+61 412 345 678'}
+    assert second['skills'] == ['Kubernetes', 'React', 'Sql']
+    assert second['sections'][0] == {'section': 'experience', 'line': 0, 'offset': 0, 'continued': True}
+    assert analysis.sections == {'summary': 1, 'experience': 1, 'skills': 2}
@@ -0,0 +1,71 @@
+import random
+
+from parsed_document import ParsedDocument
+from resume_parser import ImprovedResumeParser
+
+INDICATORS = [
+    'education', 'experience', 'work', 'skills', 'objective', 'summary',
+    'employment', 'career', 'background', 'qualifications', 'achievements',
+    'projects', 'certifications', 'awards', 'interests', 'hobbies',
+    'references', 'leadership', 'volunteer', 'activities'
+]
+
+LINES = [
+    'Skills', 'SKILLS:', 'Technical Skills', 'Core Competencies', 'Summary', 'Professional Summary',
+    'Education', 'Work Experience', 'Employment History', 'Objective: build things', 'Projects',
+    'Python, Docker, Kubernetes', 'Led a team of five engineers', 'Bachelor of Science',
+    'Senior Software Engineer at Example Pty Ltd', 'Interests', 'my work skills are broad',
+    '', '   ', 'References available on request', 'Volunteer work', 'career highlights',
+]
+
+
+def legacy_is_section_header(line):
+    line_clean = line.strip().lower()
+    for indicator in INDICATORS:
+        if (line_clean == indicator or
+                line_clean.startswith(indicator + ':') or
+                line_clean.startswith(indicator + ' ') or
+                line_clean.endswith(indicator)):
+            return True
+    return False
+
+
+def legacy_extract_section(headers, text):
+    text_lines = text.split('\n')
+    for i, line in enumerate(text_lines):
+        line_lower = line.lower().strip()
+        for header in headers:
+            if (line_lower == header or
+                    line_lower.startswith(header + ':') or
+                    header in line_lower and len(line_lower) < len(header) + 15):
+                section_content = []
+                for j in range(i + 1, len(text_lines)):
+                    next_line = text_lines[j].strip()
+                    if legacy_is_section_header(next_line.lower()):
+                        break
+                    if next_line:
+                        section_content.append(next_line)
+                    if len(section_content) > 25:
+                        break
+                if section_content:
+                    return '\n'.join(section_content)
+    return None
+
+
+def random_resumes(count):
+    rng = random.Random(4)
+    for _ in range(count):
+        yield '\n'.join(rng.choice(LINES) for _ in range(rng.randint(1, 40)))
+
+
+def test_sections_match_legacy_line_scan():
+    parser = ImprovedResumeParser()
+    for text in random_resumes(2000):
+        document = ParsedDocument(text)
+        for section_type, headers in parser.section_headers.items():
+            expected = legacy_extract_section(headers, text)
+            assert parser._extract_section(document, section_type) == expected, (section_type, text)
+
+
+def test_unknown_section_type():
+    assert ImprovedResumeParser()._extract_section(ParsedDocument('Skills\nPython'), 'hobbies') is None
@@ -0,0 +1,51 @@
+import random
+import re
+
+import pytest
+
+from ai_analyzer import ImprovedAIAnalyzer
+from resume_parser import ImprovedResumeParser
+from skill_matcher import SkillMatcher
+
+
+def legacy_find_skills(skill_categories, text_lower, space_delimited):
+    found = set()
+    for skill_list in skill_categories.values():
+        for skill in skill_list:
+            skill = skill.lower()
+            if space_delimited and f' {skill} ' in f' {text_lower} ':
+                found.add(skill)
+            elif re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
+                found.add(skill)
+    return found
+
+
+@pytest.fixture(scope='module', params=['parser', 'analyzer'])
+def skill_categories(request):
+    if request.param == 'parser':
+        return ImprovedResumeParser().skill_patterns
+    return ImprovedAIAnalyzer().skill_categories
+
+
+def random_texts(skill_categories, count):
+    skills = sorted({skill.lower() for skill_list in skill_categories.values() for skill in skill_list})
+    fillers = [' ', ' ', ', ', '\n', '/', '-', '.', '(', ')', '+', '#', 'x', 'pre', '_', ' and ']
+    rng = random.Random(11)
+    for _ in range(count):
+        yield ''.join(rng.choice(skills) + rng.choice(fillers) for _ in range(rng.randint(1, 12)))
+
+
+@pytest.mark.parametrize('space_delimited', [False, True])
+def test_matches_legacy_per_skill_search(skill_categories, space_delimited):
+    matcher = SkillMatcher(skill_categories)
+    for text in random_texts(skill_categories, 3000):
+        assert matcher.find_skills(text, space_delimited) == legacy_find_skills(skill_categories, text, space_delimited), text
+
+
+def test_overlapping_and_punctuated_skills():
+    categories = {'languages': ['c', 'c++', 'c#', 'objective-c', 'go'], 'web': ['node.js', 'vue.js', 'vue']}
+    matcher = SkillMatcher(categories)
+    text = 'objective-c, c++ and c# with vue.js on node.js; going'
+    assert matcher.find_skills(text) == legacy_find_skills(categories, text, False)
+    assert {'objective-c', 'c', 'vue.js', 'vue', 'node.js'} <= matcher.find_skills(text)
+    assert 'go' not in matcher.find_skills(text)
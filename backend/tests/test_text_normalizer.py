@@ -0,0 +1,40 @@
+import random
+import re
+
+from text_normalizer import TextNormalizer
+
+
+def legacy_clean_text(text):
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'[^\w\s@.,()|\-/+:]', ' ', text)
+    return text.strip()
+
+
+def test_matches_legacy_regex_pipeline_on_random_text():
+    alphabet = list("ab Z9_\n\t  @.,()|-/+:#$%*!?\r\x0c") + ['é', '—', '•', 'ß', '中', ' ']
+    rng = random.Random(7)
+    normalizer = TextNormalizer()
+    for _ in range(20000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert normalizer.normalize(text).text == legacy_clean_text(text), repr(text)
+
+
+def test_matches_legacy_regex_pipeline_on_resume_text():
+    text = (
+        "  Jane Doe \t\n\n\n  jane.doe@example.com | +61 (0)412-345-678\n"
+        "• Python, C++ & C#  —  5 years\n\n\t\nSKILLS:\n  Docker\tKubernetes  \n"
+    )
+    assert TextNormalizer().normalize(text).text == legacy_clean_text(text)
+
+
+def test_offsets_map_back_to_the_source():
+    alphabet = list("ab Z9_\n\t  @.#") + ['é', '•', ' ']
+    rng = random.Random(11)
+    normalizer = TextNormalizer()
+    for _ in range(5000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        normalized = normalizer.normalize(text)
+        for index, char in enumerate(normalized.text):
+            if char.isalnum() or char == '@':
+                assert text[normalized.source_offset(index)] == char, (repr(text), index)
@@ -0,0 +1,52 @@
+import pytest
+
+from extracted_text import ExtractedPage, ExtractedText
+from text_store import TextStore
+
+EXTRACTED = ExtractedText(
+    'Jane Doe\nSkills\nPython',
+    [ExtractedPage(1, 'Jane Doe\nSkills\nPython', [[['Skill', 'Years'], ['Python', '5']]])],
+    'pdfplumber'
+)
+
+
+def test_round_trips_by_hash_and_variant(tmp_path):
+    store = TextStore(str(tmp_path), 'v1')
+    file_hash = TextStore.file_hash(b'%PDF-1.4 resume')
+    assert store.get(file_hash, 'application/pdf', 10) is None
+    store.put(file_hash, 'application/pdf', 10, EXTRACTED)
+    assert store.get(file_hash, 'application/pdf', 10) == EXTRACTED
+    assert store.get(file_hash, 'application/pdf', 5) is None
+    assert store.contains(file_hash, 'application/pdf', 10)
+    assert store.file_hashes() == [file_hash]
+    assert store.stats()['hits'] == 1 and store.stats()['misses'] == 2
+
+
+def test_evicts_by_hash_and_stale_versions(tmp_path):
+    old = TextStore(str(tmp_path), 'v1')
+    old.put(TextStore.file_hash(b'a'), 'application/pdf', None, EXTRACTED)
+    store = TextStore(str(tmp_path), 'v2')
+    kept, evicted = TextStore.file_hash(b'b'), TextStore.file_hash(b'c')
+    store.put(kept, 'application/pdf', None, EXTRACTED)
+    store.put(evicted, 'application/pdf', None, EXTRACTED)
+    assert store.evict([evicted, TextStore.file_hash(b'missing')]) == 1
+    assert store.file_hashes() == [kept]
+    assert store.evict_stale() == 1
+    assert old.file_hashes() == []
+    assert store.clear() == 1
+    assert store.file_hashes() == []
+
+
+def test_evict_rejects_anything_but_a_sha256_hash(tmp_path):
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    store = TextStore(str(tmp_path / 'store'), 'v1')
+    kept = TextStore.file_hash(b'a')
+    store.put(kept, 'application/pdf', None, EXTRACTED)
+    for file_hash in (str(outside), '../../outside', kept.upper(), kept[:-1], '', None):
+        with pytest.raises(ValueError):
+            store.evict([file_hash])
+    with pytest.raises(ValueError):
+        store.evict([TextStore.file_hash(b'b'), str(outside)])
+    assert outside.is_dir()
+    assert store.file_hashes() == [kept]
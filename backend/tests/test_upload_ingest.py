@@ -0,0 +1,98 @@
+import asyncio
+import io
+import os
+
+import pytest
+
+from upload_ingest import UploadIngestor, UploadLimitMiddleware, UploadTooLarge
+
+
+class FakeUpload:
+    def __init__(self, data, filename='resume.pdf', content_type='application/pdf'):
+        self.filename = filename
+        self.content_type = content_type
+        self._stream = io.BytesIO(data)
+
+    async def read(self, size):
+        return self._stream.read(size)
+
+
+def test_small_uploads_stay_in_memory_and_large_ones_spool():
+    ingestor = UploadIngestor(max_bytes=1000, spool_threshold=100, chunk_size=16)
+    with asyncio.run(ingestor.ingest(FakeUpload(b'x' * 50))) as small:
+        assert not small.spooled and small.read() == b'x' * 50
+    with asyncio.run(ingestor.ingest(FakeUpload(b'y' * 500))) as large:
+        assert large.spooled and large.read() == b'y' * 500
+        path = large.path
+    assert not os.path.exists(path)
+    assert ingestor.stats()['accepted'] == 2 and ingestor.stats()['spooled'] == 1
+
+
+def test_oversized_upload_is_rejected_mid_stream():
+    ingestor = UploadIngestor(max_bytes=100, chunk_size=16)
+    with pytest.raises(UploadTooLarge):
+        asyncio.run(ingestor.ingest(FakeUpload(b'z' * 101)))
+    assert ingestor.rejected == 1
+
+
+async def echo_app(scope, receive, send):
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if not message.get('more_body'):
+            break
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def parse_error_app(scope, receive, send):
+    try:
+        await echo_app(scope, receive, send)
+    except Exception:
+        await send({'type': 'http.response.start', 'status': 400, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b'There was an error parsing the body'})
+
+
+def call(app, chunks, path='/upload', headers=()):
+    ingestor = UploadIngestor(max_bytes=100)
+    middleware = UploadLimitMiddleware(app, ingestor, {'/upload': 1, '/bulk': 3}, overhead=10, detail='too big')
+    pending = list(chunks)
+    sent = []
+
+    async def receive():
+        chunk = pending.pop(0)
+        return {'type': 'http.request', 'body': chunk, 'more_body': bool(pending)}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(middleware({'type': 'http', 'path': path, 'headers': list(headers)}, receive, send))
+    return sent[0]['status'], sent[1]['body'], len(pending), ingestor.rejected
+
+
+def test_middleware_passes_bodies_within_the_limit():
+    assert call(echo_app, [b'a' * 50, b'b' * 50]) == (200, b'a' * 50 + b'b' * 50, 0, 0)
+
+
+def test_middleware_stops_reading_a_chunked_body_past_the_limit():
+    status, body, unread, rejected = call(echo_app, [b'a' * 50] * 10)
+    assert (status, body, rejected) == (413, b'{"detail": "too big"}', 1)
+    assert unread == 7
+
+
+def test_middleware_replaces_the_parser_error_with_413():
+    assert call(parse_error_app, [b'a' * 50] * 10)[0] == 413
+
+
+def test_middleware_rejects_declared_oversized_length_before_reading():
+    assert call(echo_app, [b'a'], headers=[(b'content-length', b'999')])[:3] == (413, b'{"detail": "too big"}', 1)
+
+
+def test_middleware_scales_the_limit_with_the_file_count():
+    assert call(echo_app, [b'a' * 50] * 6, path='/bulk')[0] == 200
+    assert call(echo_app, [b'a' * 50] * 7, path='/bulk')[:3] == (413, b'{"detail": "too big"}', 0)
+
+
+def test_middleware_ignores_other_paths():
+    assert call(echo_app, [b'a' * 50] * 4, path='/jobs')[0] == 200
@@ -0,0 +1,82 @@
+import asyncio
+import io
+
+import pytest
+
+from pattern_registry import pattern_registry
+import worker_pool
+from worker_pool import PoolSaturated, WorkerPool, analyze_text
+
+RESUME = 'Jane Doe\njane.doe@example.com\n\nSkills\nPython, Docker, Kubernetes\n'
+
+
+def test_process_pool_runs_tasks():
+    async def scenario():
+        pool = WorkerPool(max_workers=1, max_pending=2)
+        try:
+            await pool.start()
+            assert pool.ready
+            result = await pool.run(analyze_text, RESUME)
+            assert 'Python' in result['skills']
+            assert result['contact_info']['email'] == 'jane.doe@example.com'
+            return pool.stats()
+        finally:
+            pool.shutdown()
+
+    stats = asyncio.run(scenario())
+    assert stats['mode'] == 'process'
+    assert stats['submitted'] == stats['completed'] == 1
+
+
+def test_rejects_when_every_slot_is_busy():
+    async def scenario():
+        pool = WorkerPool(max_workers=0, max_pending=1, queue_timeout=0.05)
+        await pool.start()
+        await pool._slots.acquire()
+        with pytest.raises(PoolSaturated):
+            await pool.run(len, 'x')
+        pool._slots.release()
+        assert await pool.run(len, 'xy') == 2
+        return pool.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats['mode'] == 'thread'
+    assert stats['rejected'] == 1 and stats['completed'] == 1
+
+
+def test_worker_pattern_stats_are_merged_into_the_parent():
+    async def scenario():
+        pool = WorkerPool(max_workers=1, max_pending=2)
+        try:
+            await pool.start()
+            pattern_registry.reset_stats()
+            await pool.run(analyze_text, RESUME)
+            first = {entry['name']: entry['calls'] for entry in pattern_registry.stats()}
+            await pool.run(analyze_text, RESUME)
+            second = {entry['name']: entry['calls'] for entry in pattern_registry.stats()}
+            return first, second
+        finally:
+            pool.shutdown()
+
+    first, second = asyncio.run(scenario())
+    assert sum(first.values()) > 0
+    assert second == {name: calls * 2 for name, calls in first.items()}
+
+
+def test_only_in_memory_errors_retry_from_a_temp_file(monkeypatch):
+    sources = []
+
+    class Parser:
+        def extract_document(self, source, error):
+            sources.append(type(source))
+            if isinstance(source, bytes):
+                raise error
+            return 'from file'
+
+    monkeypatch.setitem(worker_pool._worker_state, 'parser', Parser())
+    assert worker_pool._from_memory('extract_document', b'data', 'a.pdf', io.UnsupportedOperation('fileno')) == 'from file'
+    assert sources == [bytes, str]
+    sources.clear()
+    with pytest.raises(ValueError):
+        worker_pool._from_memory('extract_document', b'data', 'a.pdf', ValueError('corrupt'))
+    assert sources == [bytes]
@@ -0,0 +1,90 @@
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Tuple
+from pattern_registry import pattern_registry
+
+_WHITESPACE_RUNS = pattern_registry.register('parser.clean.whitespace', r'\n\s*\n| {2,}')
+_KEPT_PUNCTUATION = frozenset('@.,()|-/+:_')
+_PLACEHOLDER = '\x00'
+
+
+def _ascii_class(byte: int) -> int:
+    char = chr(byte)
+    if char == '\t':
+        return 32
+    if byte >= 128 or char.isalnum() or char.isspace() or char in _KEPT_PUNCTUATION:
+        return byte
+    return 0
+
+
+# Byte-level class table: tabs become spaces, disallowed ASCII becomes a
+# placeholder that survives whitespace collapsing. Bytes >= 128 pass through
+# untouched so UTF-8 sequences are never split.
+_ASCII_TABLE = bytes(_ascii_class(byte) for byte in range(256))
+
+
+class _NonAsciiClassCache(Dict[str, bool]):
+    def __missing__(self, char: str) -> bool:
+        kept = char.isalnum() or char.isspace()
+        self[char] = kept
+        return kept
+
+
+_NON_ASCII_KEPT = _NonAsciiClassCache()
+
+
+class NormalizedText(NamedTuple):
+    text: str
+    anchors: List[Tuple[int, int, bool]]
+
+    def source_offset(self, index: int) -> int:
+        """Map an index in ``text`` back to the offset in the original extraction."""
+        position = bisect_right(self.anchors, (index, float('inf'), True)) - 1
+        out_start, source_start, collapsed = self.anchors[position]
+        return source_start if collapsed else source_start + index - out_start
+
+
+class TextNormalizer:
+    """Single-pass cleaner producing the normalized text and an offset map.
+
+    Character classes are resolved through a byte translation table; the only
+    length-changing step is the whitespace-run scan, which records an anchor
+    for every collapsed run so positions can be mapped back to the source.
+    """
+
+    def normalize(self, text: str) -> NormalizedText:
+        if not text.isascii():
+            for char in set(text):
+                if ord(char) >= 128 and not _NON_ASCII_KEPT[char]:
+                    text = text.replace(char, _PLACEHOLDER)
+        classified = text.encode('utf-8').translate(_ASCII_TABLE).decode('utf-8')
+
+        pieces = []
+        anchors = []
+        out_pos = 0
+        last = 0
+        for match in _WHITESPACE_RUNS.finditer(classified):
+            start, end = match.span()
+            if start > last:
+                anchors.append((out_pos, last, False))
+                pieces.append(classified[last:start])
+                out_pos += start - last
+            replacement = '\n\n' if classified[start] == '\n' else ' '
+            anchors.append((out_pos, start, True))
+            pieces.append(replacement)
+            out_pos += len(replacement)
+            last = end
+        if last < len(classified):
+            anchors.append((out_pos, last, False))
+            pieces.append(classified[last:])
+
+        collapsed = ''.join(pieces).replace(_PLACEHOLDER, ' ')
+        stripped = collapsed.lstrip()
+        lead = len(collapsed) - len(stripped)
+        stripped = stripped.rstrip()
+        if lead and anchors:
+            first = bisect_right(anchors, (lead, float('inf'), True)) - 1
+            out_start, source_start, is_collapsed = anchors[first]
+            head = (0, source_start if is_collapsed else source_start + lead - out_start, is_collapsed)
+            anchors = [head] + [(out_start - lead, source_start, is_collapsed)
+                                for out_start, source_start, is_collapsed in anchors[first + 1:]]
+        return NormalizedText(stripped, anchors or [(0, 0, False)])
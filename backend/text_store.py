@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+from extracted_text import ExtractedText
+
+_FILE_HASH = re.compile(r'^[0-9a-f]{64}$')
+
+
+class TextStore:
+    def __init__(self, root: str, version: str):
+        self.root = root
+        self.version = version
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def file_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def _entry_dir(self, file_hash: str) -> str:
+        if not isinstance(file_hash, str) or not _FILE_HASH.match(file_hash):
+            raise ValueError(f"Invalid file hash: {file_hash!r}")
+        return os.path.join(self.root, self.version, file_hash[:2], file_hash)
+
+    def _entry_path(self, file_hash: str, content_type: str, max_pages: Optional[int]) -> str:
+        variant = hashlib.sha256(f'{content_type}:{max_pages}'.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self._entry_dir(file_hash), f'{variant}.json')
+
+    def get(self, file_hash: str, content_type: str, max_pages: Optional[int]) -> Optional[ExtractedText]:
+        path = self._entry_path(file_hash, content_type, max_pages)
+        try:
+            with open(path, 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return ExtractedText.from_dict(data['extracted'])
+
+    def contains(self, file_hash: str, content_type: str, max_pages: Optional[int]) -> bool:
+        return os.path.exists(self._entry_path(file_hash, content_type, max_pages))
+
+    def put(self, file_hash: str, content_type: str, max_pages: Optional[int], extracted: ExtractedText) -> None:
+        path = self._entry_path(file_hash, content_type, max_pages)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = {
+            'file_hash': file_hash,
+            'content_type': content_type,
+            'max_pages': max_pages,
+            'extractor_version': self.version,
+            'extracted': extracted.to_dict()
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        with self._lock:
+            self.writes += 1
+
+    def evict(self, file_hashes: List[str]) -> int:
+        entry_dirs = [self._entry_dir(file_hash) for file_hash in file_hashes]
+        version_dir = os.path.realpath(os.path.join(self.root, self.version))
+        evicted = 0
+        for entry_dir in entry_dirs:
+            if os.path.commonpath([os.path.realpath(entry_dir), version_dir]) != version_dir:
+                raise ValueError(f"Refusing to evict {entry_dir} outside {version_dir}")
+            if os.path.isdir(entry_dir):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                evicted += 1
+        with self._lock:
+            self.evictions += evicted
+        return evicted
+
+    def evict_stale(self) -> int:
+        evicted = 0
+        if not os.path.isdir(self.root):
+            return evicted
+        for version in os.listdir(self.root):
+            if version != self.version:
+                version_dir = os.path.join(self.root, version)
+                evicted += sum(len(os.listdir(os.path.join(version_dir, shard))) for shard in os.listdir(version_dir))
+                shutil.rmtree(version_dir, ignore_errors=True)
+        with self._lock:
+            self.evictions += evicted
+        return evicted
+
+    def clear(self) -> int:
+        evicted = len(self.file_hashes())
+        shutil.rmtree(os.path.join(self.root, self.version), ignore_errors=True)
+        with self._lock:
+            self.evictions += evicted
+        return evicted
+
+    def file_hashes(self) -> List[str]:
+        version_dir = os.path.join(self.root, self.version)
+        if not os.path.isdir(version_dir):
+            return []
+        return [
+            file_hash
+            for shard in sorted(os.listdir(version_dir))
+            for file_hash in sorted(os.listdir(os.path.join(version_dir, shard)))
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'root': self.root,
+            'extractor_version': self.version,
+            'files': len(self.file_hashes()),
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+
+class UploadTooLarge(Exception):
+    def __init__(self, limit: int):
+        super().__init__(f"Upload exceeds {limit} bytes")
+        self.limit = limit
+
+
+class IngestedUpload:
+    def __init__(self, filename: str, content_type: str):
+        self.filename = filename
+        self.content_type = content_type
+        self.size = 0
+        self.file_hash = ''
+        self._buffer = bytearray()
+        self._data = b''
+        self._spool = None
+        self.path: Optional[str] = None
+
+    @property
+    def spooled(self) -> bool:
+        return self.path is not None
+
+    @property
+    def source(self) -> Union[bytes, str]:
+        return self.path if self.path is not None else self._data
+
+    def read(self) -> bytes:
+        if self.path is None:
+            return self._data
+        with open(self.path, 'rb') as handle:
+            return handle.read()
+
+    def _append(self, chunk: bytes, spool_threshold: int) -> None:
+        if self._spool is None and len(self._buffer) + len(chunk) > spool_threshold:
+            file_extension = os.path.splitext(self.filename or '')[1]
+            self._spool = tempfile.NamedTemporaryFile(delete=False, suffix=file_extension)
+            self.path = self._spool.name
+            self._spool.write(self._buffer)
+            self._buffer = bytearray()
+        if self._spool is not None:
+            self._spool.write(chunk)
+        else:
+            self._buffer.extend(chunk)
+
+    def _finish(self) -> None:
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+        elif self._buffer:
+            self._data = bytes(self._buffer)
+            self._buffer = bytearray()
+
+    def close(self) -> None:
+        self._finish()
+        self._data = b''
+        if self.path is not None and os.path.exists(self.path):
+            os.unlink(self.path)
+        self.path = None
+
+    def __enter__(self) -> 'IngestedUpload':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class UploadIngestor:
+    def __init__(self, max_bytes: int, spool_threshold: int = 1024 * 1024, chunk_size: int = 64 * 1024):
+        self.max_bytes = max_bytes
+        self.spool_threshold = spool_threshold
+        self.chunk_size = chunk_size
+        self.accepted = 0
+        self.rejected = 0
+        self.spooled = 0
+        self.bytes_ingested = 0
+
+    def check_declared_size(self, declared: Optional[Union[int, str]]) -> None:
+        try:
+            declared_size = int(declared) if declared is not None else None
+        except ValueError:
+            return
+        if declared_size is not None and declared_size > self.max_bytes:
+            self.rejected += 1
+            raise UploadTooLarge(self.max_bytes)
+
+    async def ingest(self, upload: Any) -> IngestedUpload:
+        self.check_declared_size(getattr(upload, 'size', None))
+        ingested = IngestedUpload(upload.filename, upload.content_type)
+        digest = hashlib.sha256()
+        try:
+            while True:
+                chunk = await upload.read(self.chunk_size)
+                if not chunk:
+                    break
+                ingested.size += len(chunk)
+                if ingested.size > self.max_bytes:
+                    self.rejected += 1
+                    raise UploadTooLarge(self.max_bytes)
+                digest.update(chunk)
+                ingested._append(chunk, self.spool_threshold)
+            ingested._finish()
+        except BaseException:
+            ingested.close()
+            raise
+        ingested.file_hash = digest.hexdigest()
+        self.accepted += 1
+        self.bytes_ingested += ingested.size
+        if ingested.spooled:
+            self.spooled += 1
+        return ingested
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'max_bytes': self.max_bytes,
+            'spool_threshold': self.spool_threshold,
+            'chunk_size': self.chunk_size,
+            'accepted': self.accepted,
+            'rejected': self.rejected,
+            'spooled': self.spooled,
+            'bytes_ingested': self.bytes_ingested
+        }
+
+
+class UploadLimitMiddleware:
+    """Cuts off request bodies on upload paths once they pass the limit, before the multipart parser buffers them.
+
+    ``paths`` maps each guarded path to the number of files it accepts; the
+    body limit is that many files at the ingestor's per-file limit.
+    """
+
+    def __init__(self, app: Any, ingestor: UploadIngestor, paths: Mapping[str, int], overhead: int, detail: str):
+        self.app = app
+        self.ingestor = ingestor
+        self.paths = dict(paths)
+        self.overhead = overhead
+        self.detail = detail
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope['type'] != 'http' or scope['path'] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        limit = self.paths[scope['path']] * (self.ingestor.max_bytes + self.overhead)
+        for name, value in scope.get('headers', []):
+            if name == b'content-length' and value.isdigit() and int(value) > limit:
+                self.ingestor.rejected += 1
+                await self._reject(send)
+                return
+        received = 0
+        exceeded = False
+
+        async def limited_receive() -> Dict[str, Any]:
+            nonlocal received, exceeded
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > limit:
+                    exceeded = True
+                    raise UploadTooLarge(self.ingestor.max_bytes)
+            return message
+
+        async def guarded_send(message: Dict[str, Any]) -> None:
+            # The form parser may turn the abort into its own error response; the 413 replaces it.
+            if not exceeded:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except UploadTooLarge:
+            pass
+        if exceeded:
+            self.ingestor.rejected += 1
+            await self._reject(send)
+
+    async def _reject(self, send: Callable) -> None:
+        body = json.dumps({'detail': self.detail}).encode()
+        await send({
+            'type': 'http.response.start',
+            'status': 413,
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+        })
+        await send({'type': 'http.response.body', 'body': body})
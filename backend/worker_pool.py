@@ -0,0 +1,258 @@
+import asyncio
+import io
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from extracted_text import ExtractedPage, ExtractedText
+from extractor_router import PdfProfile
+from memory_guard import MemoryLimitExceeded
+from models import JobMatch, ResumeAnalysis
+from parsed_document import ParsedDocument
+from pattern_registry import pattern_registry
+
+_worker_state: Dict[str, Any] = {}
+_local = threading.local()
+# What a reader raises when it needs a real file (a path, a name or a descriptor) rather than a buffer.
+_IN_MEMORY_ERRORS = (io.UnsupportedOperation, TypeError, AttributeError)
+
+
+class PoolSaturated(Exception):
+    pass
+
+
+def _init_worker(parser_options: Optional[Dict[str, Any]] = None, job_store_path: Optional[str] = None) -> None:
+    from resume_parser import ImprovedResumeParser
+    from ai_analyzer import ImprovedAIAnalyzer
+    from job_matcher import EnhancedJobMatcher
+    from job_store import JobStore
+    # A forked worker inherits the parent's counters; start from zero so only its own work is reported.
+    pattern_registry.reset_stats()
+    _worker_state['parser'] = ImprovedResumeParser(**(parser_options or {}))
+    _worker_state['analyzer'] = ImprovedAIAnalyzer()
+    _worker_state['matcher'] = EnhancedJobMatcher(JobStore(job_store_path, readonly=True) if job_store_path else None)
+
+
+def _state() -> Dict[str, Any]:
+    if not _worker_state:
+        _init_worker()
+    return _worker_state
+
+
+def _loop() -> asyncio.AbstractEventLoop:
+    if getattr(_local, 'loop', None) is None:
+        _local.loop = asyncio.new_event_loop()
+    return _local.loop
+
+
+def _ping() -> None:
+    _state()
+
+
+def _run_task(func: Callable[..., Any], *args: Any) -> Tuple[Any, Dict[str, Tuple[int, int, float]]]:
+    # Pattern counters live in each worker process; ship them back with the result for the parent to merge.
+    result = func(*args)
+    return result, pattern_registry.drain_stats()
+
+
+@contextmanager
+def _spooled(content: bytes, filename: str) -> Iterator[str]:
+    file_extension = os.path.splitext(filename or '')[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
+        tmp_file.write(content)
+        tmp_file_path = tmp_file.name
+    try:
+        yield tmp_file_path
+    finally:
+        if os.path.exists(tmp_file_path):
+            os.unlink(tmp_file_path)
+
+
+def _from_memory(method: str, source: Union[bytes, str], filename: str, *args: Any) -> Any:
+    handler = getattr(_state()['parser'], method)
+    if isinstance(source, str):
+        return handler(source, *args)
+    try:
+        return handler(source, *args)
+    except _IN_MEMORY_ERRORS as e:
+        print(f"In-memory {method} failed, retrying from a temp file: {e}")
+    with _spooled(source, filename) as file_path:
+        return handler(file_path, *args)
+
+
+def extract_content(source: Union[bytes, str], filename: str, content_type: str, max_pages: int = 10) -> ExtractedText:
+    return _from_memory('extract_document', source, filename, content_type, max_pages)
+
+
+def pdf_profile(source: Union[bytes, str], filename: str) -> PdfProfile:
+    return _from_memory('pdf_profile', source, filename)
+
+
+def extract_routed(source: Union[bytes, str], filename: str, max_pages: int,
+                   order: Sequence[str]) -> Tuple[Optional[ExtractedText], List[Tuple[str, float, bool]], str]:
+    attempts: List[Tuple[str, float, bool]] = []
+    try:
+        extracted = _from_memory('extract_document', source, filename, 'application/pdf', max_pages, order, attempts)
+    except MemoryLimitExceeded:
+        raise
+    except Exception as e:
+        return None, attempts, str(e)
+    return extracted, attempts, ''
+
+
+def extract_pdf_pages(source: Union[bytes, str], filename: str, page_numbers: List[int]) -> List[ExtractedPage]:
+    return _from_memory('extract_pdf_pages', source, filename, page_numbers)
+
+
+def analyze_text(resume_text: str) -> Dict[str, Any]:
+    state = _state()
+    parser, analyzer, matcher, loop = state['parser'], state['analyzer'], state['matcher'], _loop()
+    document = ParsedDocument(resume_text)
+    contact_info = parser.extract_contact_info(document)
+    professional_summary = parser.extract_professional_summary(document)
+    skills = parser.extract_skills(document)
+    education_info = parser.extract_education_info(document)
+    analysis: ResumeAnalysis = loop.run_until_complete(analyzer.analyze_resume(
+        document, contact_info,
+        skills=skills,
+        education_info=education_info,
+        professional_summary=professional_summary
+    ))
+    job_matches: List[JobMatch] = loop.run_until_complete(matcher.find_matches(analysis))
+    return {
+        'contact_info': contact_info,
+        'professional_summary': professional_summary,
+        'skills': skills,
+        'education_info': education_info,
+        'analysis': analysis,
+        'job_matches': job_matches
+    }
+
+
+def extract_contact(resume_text: str) -> Dict[str, Optional[str]]:
+    return _state()['parser'].extract_contact_info(resume_text)
+
+
+def extract_skills(resume_text: str) -> Dict[str, Any]:
+    parser = _state()['parser']
+    skills = parser.extract_skills(resume_text)
+    categorized_skills = {}
+    for category, skill_list in parser.skill_patterns.items():
+        category_skills = []
+        for skill in skills:
+            if skill.lower() in [s.lower() for s in skill_list]:
+                category_skills.append(skill)
+        if category_skills:
+            categorized_skills[category.replace('_', ' ').title()] = category_skills
+    return {'skills': skills, 'categorized_skills': categorized_skills}
+
+
+def debug_parse(resume_text: str) -> Dict[str, Any]:
+    parser = _state()['parser']
+    document = ParsedDocument(resume_text)
+    return {
+        'contact_info': parser.extract_contact_info(document),
+        'skills': parser.extract_skills(document),
+        'professional_summary': parser.extract_professional_summary(document)
+    }
+
+
+class WorkerPool:
+    def __init__(self, max_workers: int, max_pending: int, queue_timeout: float = 30.0,
+                 parser_options: Optional[Dict[str, Any]] = None, job_store_path: Optional[str] = None):
+        self.parser_options = parser_options or {}
+        self.job_store_path = job_store_path
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.ready = False
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.parallel_documents = 0
+        self.parallel_pages = 0
+
+    async def start(self) -> None:
+        self._slots = asyncio.Semaphore(self.max_pending)
+        if self.max_workers <= 0:
+            _init_worker(self.parser_options, self.job_store_path)
+            self.ready = True
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker, initargs=(self.parser_options, self.job_store_path)
+        )
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(self._executor, _ping) for _ in range(self.max_workers)
+        ])
+        self.ready = True
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self.ready = False
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._slots is None:
+            await self.start()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise PoolSaturated(f"All {self.max_pending} worker slots busy for {self.queue_timeout}s")
+        self.submitted += 1
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            if self._executor is None:
+                result = await loop.run_in_executor(None, partial(func, *args))
+            else:
+                result, pattern_deltas = await loop.run_in_executor(self._executor, partial(_run_task, func, *args))
+                pattern_registry.merge_stats(pattern_deltas)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+        self.completed += 1
+        return result
+
+    @property
+    def parallel(self) -> bool:
+        return self._executor is not None and self.max_workers > 1
+
+    async def extract_pdf_pages(self, source: Union[bytes, str], filename: str,
+                                pages_to_process: int) -> List[ExtractedPage]:
+        chunk_count = min(self.max_workers, pages_to_process)
+        numbers = list(range(1, pages_to_process + 1))
+        chunks = [numbers[i::chunk_count] for i in range(chunk_count)]
+        results = await asyncio.gather(*[
+            self.run(extract_pdf_pages, source, filename, chunk) for chunk in chunks
+        ])
+        self.parallel_documents += 1
+        self.parallel_pages += pages_to_process
+        return sorted((page for pages in results for page in pages), key=lambda page: page.number)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'mode': 'process' if self._executor is not None else 'thread',
+            'max_workers': self.max_workers,
+            'ready': self.ready,
+            'max_pending': self.max_pending,
+            'in_flight': self.in_flight,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'parallel_documents': self.parallel_documents,
+            'parallel_pages': self.parallel_pages
+        }